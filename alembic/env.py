@@ -23,6 +23,9 @@ from app.models.entity_media import EntityMedia  # noqa: F401
 from app.models.message import Message  # noqa: F401
 from app.models.reminder_frequency import ReminderFrequency  # noqa: F401
 from app.models.message_recipient import MessageRecipient  # noqa: F401
+from app.models.user_mailbox import UserMailbox  # noqa: F401
+from app.models.email_outbox import OutboxEmail  # noqa: F401
+from app.models.cache_version import CacheVersion  # noqa: F401
 
 from app.models.user import User  # noqa: F401
 from app.models.role import Role  # noqa: F401
@@ -83,6 +86,13 @@ target_metadata = Base.metadata
 # my_important_option = config.get_main_option("my_important_option")
 # ... etc.
 
+# bookkeeping tables of the migrations themselves, not part of the models
+MIGRATION_TABLES = {"alembic_keyset_indexes"}
+
+
+def include_object(object, name, type_, reflected, compare_to):
+    return not (type_ == "table" and name in MIGRATION_TABLES)
+
 
 def run_migrations_offline() -> None:
     """Run migrations in 'offline' mode.
@@ -102,6 +112,7 @@ def run_migrations_offline() -> None:
         target_metadata=target_metadata,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
+        include_object=include_object,
     )
 
     with context.begin_transaction():
@@ -109,7 +120,11 @@ def run_migrations_offline() -> None:
 
 
 def do_run_migrations(connection: Connection) -> None:
-    context.configure(connection=connection, target_metadata=target_metadata)
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        include_object=include_object,
+    )
 
     with context.begin_transaction():
         context.run_migrations()
@@ -0,0 +1,53 @@
+"""Inbox join indexes
+
+Revision ID: 27e08159810b
+Revises: cc4a1d8ca352
+Create Date: 2026-10-17 22:32:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "27e08159810b"
+down_revision: Union[str, None] = "cc4a1d8ca352"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = [
+    (
+        "ix_message_recipient_recipient_date",
+        "message_recipient",
+        ["recipient_id", "msg_send_date"],
+    ),
+    (
+        "ix_message_recipient_group_date",
+        "message_recipient",
+        ["recipient_group_id", "msg_send_date"],
+    ),
+    ("ix_message_recipient_message", "message_recipient", ["message_id"]),
+    (
+        "ix_under_contract_client_unit_period",
+        "under_contract",
+        ["client_id", "property_unit_assoc_id", "start_date", "end_date"],
+    ),
+]
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+
+    for name, table, columns in INDEXES:
+        # databases created by the app's create_all at this revision have them
+        if name in {index["name"] for index in inspector.get_indexes(table)}:
+            continue
+
+        op.create_index(name, table, columns)
+
+
+def downgrade() -> None:
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,76 @@
+"""Created at keyset indexes
+
+Revision ID: 5b0f8e6a9c21
+Revises: d41c9e2b7f3a
+Create Date: 2026-10-17 22:36:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5b0f8e6a9c21"
+down_revision: Union[str, None] = "d41c9e2b7f3a"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# the indexes this revision created, so downgrade leaves those the app's
+# create_all made before it ran
+CREATED_INDEXES = "alembic_keyset_indexes"
+
+
+def keyset_indexes():
+    """
+    (name, table, columns, exists) of the keyset index of every table with a
+    created_at column.
+    """
+    inspector = sa.inspect(op.get_bind())
+    indexes = []
+
+    for table in inspector.get_table_names():
+        columns = {c["name"] for c in inspector.get_columns(table)}
+        if "created_at" not in columns:
+            continue
+
+        name = f"ix_{table}_created_at_keyset"
+        primary_key = inspector.get_pk_constraint(table)["constrained_columns"]
+        existing = {index["name"] for index in inspector.get_indexes(table)}
+
+        indexes.append((name, table, ["created_at", *primary_key], name in existing))
+
+    return indexes
+
+
+def upgrade() -> None:
+    created = []
+
+    # backs the (created_at, primary key) ordering used by cursor pagination
+    for name, table, columns, exists in keyset_indexes():
+        # databases created by the app's create_all at this revision have them
+        if exists:
+            continue
+
+        op.create_index(name, table, columns)
+        created.append({"name": name, "table_name": table})
+
+    created_indexes = op.create_table(
+        CREATED_INDEXES,
+        sa.Column("name", sa.String(255), nullable=False),
+        sa.Column("table_name", sa.String(255), nullable=False),
+        sa.PrimaryKeyConstraint("name"),
+    )
+    op.bulk_insert(created_indexes, created)
+
+
+def downgrade() -> None:
+    created = op.get_bind().execute(
+        sa.text(f"SELECT name, table_name FROM {CREATED_INDEXES}")
+    )
+
+    for name, table in created.all():
+        op.drop_index(name, table_name=table)
+
+    op.drop_table(CREATED_INDEXES)
@@ -0,0 +1,57 @@
+"""Message listing indexes
+
+Revision ID: 86db8a850123
+Revises: ea6e0db5a157
+Create Date: 2026-10-17 22:34:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "86db8a850123"
+down_revision: Union[str, None] = "ea6e0db5a157"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+MAILBOX_COLUMNS = ["user_id", "is_notification", "created_at"]
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+
+    # databases created by the app's create_all at this revision have them
+    if "ix_message_sender_created" not in {
+        index["name"] for index in inspector.get_indexes("message")
+    }:
+        op.create_index(
+            "ix_message_sender_created",
+            "message",
+            ["sender_id", "date_created", "message_id"],
+        )
+
+    # message_id breaks created_at ties for the mailbox page cursor
+    mailbox = {
+        index["name"]: index["column_names"]
+        for index in inspector.get_indexes("user_mailbox")
+    }
+    columns = mailbox.get("ix_user_mailbox_user_created")
+    if columns != MAILBOX_COLUMNS + ["message_id"]:
+        if columns is not None:
+            op.drop_index("ix_user_mailbox_user_created", table_name="user_mailbox")
+
+        op.create_index(
+            "ix_user_mailbox_user_created",
+            "user_mailbox",
+            MAILBOX_COLUMNS + ["message_id"],
+        )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_user_mailbox_user_created", table_name="user_mailbox")
+    op.create_index("ix_user_mailbox_user_created", "user_mailbox", MAILBOX_COLUMNS)
+
+    op.drop_index("ix_message_sender_created", table_name="message")
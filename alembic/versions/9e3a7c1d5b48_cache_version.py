@@ -0,0 +1,46 @@
+"""Cache version
+
+Revision ID: 9e3a7c1d5b48
+Revises: 5b0f8e6a9c21
+Create Date: 2026-10-17 22:37:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "9e3a7c1d5b48"
+down_revision: Union[str, None] = "5b0f8e6a9c21"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # databases created by the app's create_all at this revision have it already
+    if sa.inspect(op.get_bind()).has_table("cache_version"):
+        return
+
+    cache_version = op.create_table(
+        "cache_version",
+        sa.Column("name", sa.String(64), nullable=False),
+        sa.Column("version", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint("name"),
+    )
+    op.create_index(
+        "ix_cache_version_created_at_keyset",
+        "cache_version",
+        ["created_at", "name"],
+    )
+
+    # the permission matrix bumps an existing row, no worker races to insert it
+    op.bulk_insert(cache_version, [{"name": "rbac", "version": 0}])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_cache_version_created_at_keyset", table_name="cache_version")
+    op.drop_table("cache_version")
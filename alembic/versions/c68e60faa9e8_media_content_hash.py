@@ -0,0 +1,35 @@
+"""Media content hash
+
+Revision ID: c68e60faa9e8
+Revises: ba533544b11f
+Create Date: 2026-10-17 22:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c68e60faa9e8"
+down_revision: Union[str, None] = "ba533544b11f"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # databases created by the app's create_all at this revision have it already
+    columns = {c["name"] for c in sa.inspect(op.get_bind()).get_columns("media")}
+    if "content_hash" in columns:
+        return
+
+    op.add_column("media", sa.Column("content_hash", sa.String(64), nullable=True))
+    op.create_index("ix_media_content_hash", "media", ["content_hash"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_media_content_hash", table_name="media")
+
+    with op.batch_alter_table("media") as batch_op:
+        batch_op.drop_column("content_hash")
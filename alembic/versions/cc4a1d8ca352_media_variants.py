@@ -0,0 +1,32 @@
+"""Media variants
+
+Revision ID: cc4a1d8ca352
+Revises: c68e60faa9e8
+Create Date: 2026-10-17 22:31:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "cc4a1d8ca352"
+down_revision: Union[str, None] = "c68e60faa9e8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # databases created by the app's create_all at this revision have it already
+    columns = {c["name"] for c in sa.inspect(op.get_bind()).get_columns("media")}
+    if "variants" in columns:
+        return
+
+    op.add_column("media", sa.Column("variants", sa.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("media") as batch_op:
+        batch_op.drop_column("variants")
@@ -0,0 +1,59 @@
+"""Email outbox
+
+Revision ID: d41c9e2b7f3a
+Revises: 86db8a850123
+Create Date: 2026-10-17 22:35:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d41c9e2b7f3a"
+down_revision: Union[str, None] = "86db8a850123"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # databases created by the app's create_all at this revision have it already
+    if sa.inspect(op.get_bind()).has_table("email_outbox"):
+        return
+
+    op.create_table(
+        "email_outbox",
+        sa.Column("outbox_id", sa.UUID(), nullable=False),
+        sa.Column("idempotency_key", sa.String(255), nullable=False),
+        sa.Column("recipient", sa.String(255), nullable=False),
+        sa.Column("subject", sa.String(255), nullable=False),
+        sa.Column("message", sa.Text(), nullable=False),
+        sa.Column(
+            "status",
+            sa.Enum("pending", "sending", "sent", "failed", name="emailstatusenum"),
+            nullable=False,
+        ),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.Column("available_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("claimed_by", sa.UUID(), nullable=True),
+        sa.Column("claimed_until", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("sent_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint("outbox_id"),
+        sa.UniqueConstraint("idempotency_key"),
+    )
+    op.create_index(
+        "ix_email_outbox_status_available",
+        "email_outbox",
+        ["status", "available_at"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_email_outbox_status_available", table_name="email_outbox")
+    op.drop_table("email_outbox")
+    sa.Enum(name="emailstatusenum").drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,69 @@
+"""User mailbox
+
+Revision ID: ea6e0db5a157
+Revises: 27e08159810b
+Create Date: 2026-10-17 22:33:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "ea6e0db5a157"
+down_revision: Union[str, None] = "27e08159810b"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+
+    # databases created by the app's create_all at this revision have them
+    if "delivered_at" not in {c["name"] for c in inspector.get_columns("message")}:
+        # existing messages start pending, the fan-out worker delivers them
+        op.add_column(
+            "message",
+            sa.Column("delivered_at", sa.DateTime(timezone=True), nullable=True),
+        )
+        op.create_index("ix_message_delivered_at", "message", ["delivered_at"])
+
+    if inspector.has_table("user_mailbox"):
+        return
+
+    op.create_table(
+        "user_mailbox",
+        sa.Column("user_id", sa.UUID(), nullable=False),
+        sa.Column("message_id", sa.UUID(), nullable=False),
+        sa.Column("is_notification", sa.Boolean(), nullable=False),
+        sa.Column("is_read", sa.Boolean(), nullable=False),
+        sa.Column("read_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(["message_id"], ["message.message_id"]),
+        sa.ForeignKeyConstraint(["user_id"], ["users.user_id"]),
+        sa.PrimaryKeyConstraint("user_id", "message_id"),
+    )
+    op.create_index(
+        "ix_user_mailbox_user_created",
+        "user_mailbox",
+        ["user_id", "is_notification", "created_at"],
+    )
+    op.create_index(
+        "ix_user_mailbox_user_unread",
+        "user_mailbox",
+        ["user_id", "is_read", "is_notification"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_user_mailbox_user_unread", table_name="user_mailbox")
+    op.drop_index("ix_user_mailbox_user_created", table_name="user_mailbox")
+    op.drop_table("user_mailbox")
+
+    op.drop_index("ix_message_delivered_at", table_name="message")
+
+    with op.batch_alter_table("message") as batch_op:
+        batch_op.drop_column("delivered_at")
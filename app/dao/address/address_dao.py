@@ -67,7 +67,10 @@ class AddressDAO(BaseDAO[AddressModel]):
         self, db_session: AsyncSession, address_data: AddressCreateSchema
     ) -> AddressCreateSchema:
         try:
-            country: Country = await self.country_dao.query_on_create(
+            # countries repeat across an entity's addresses, remembered per request
+            country: Country = await self.country_dao.load(
+                db_session=db_session, key=address_data.country, column="country_name"
+            ) or await self.country_dao.query_on_create(
                 db_session=db_session,
                 filters={"country_name": address_data.country},
                 single=True,
@@ -1,12 +1,19 @@
-from typing import Union
+from uuid import UUID
+from datetime import datetime
+from typing import Dict, List, Optional
 from fastapi import Request
 from fastapi_sso.sso.base import OpenID
 from fastapi_sso.sso.google import GoogleSSO
-from sqlalchemy.orm.exc import NoResultFound
+from sqlalchemy import func, update
+from sqlalchemy.future import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 # models
 from app.models.user import User
+from app.models.role import Role
+from app.models.user_role import UserRoles
+from app.models.permissions import Permissions
+from app.models.role_permissions import RolePermissions
 
 # daos
 from app.dao.auth.user_dao import UserDAO
@@ -19,7 +26,7 @@ from app.utils.response import DAOResponse
 from app.utils.jwt.auth_handler import signJWT
 
 # schemas
-from app.schema.auth import Login, TokenExposed
+from app.schema.auth import AuthUser, TokenExposed
 
 CLIENT_ID = settings.GOOGLE_SIGNIN_CLIENT_ID
 CLIENT_SECRET = settings.GOOGLE_SIGNIN_CLIENT_SECRET
@@ -32,6 +39,22 @@ class AuthDAO(BaseDAO[User]):
         self.model = User
         self.user_dao = UserDAO()
 
+        # the only user columns login and token issuance read
+        self.auth_columns = [
+            "user_id",
+            "first_name",
+            "last_name",
+            "email",
+            "phone_number",
+            "identification_number",
+            "photo_url",
+            "date_of_birth",
+            "password",
+            "login_provider",
+            "is_verified",
+            "is_disabled",
+        ]
+
         super().__init__(self.model)
 
     async def google_login(self):
@@ -43,7 +66,7 @@ class AuthDAO(BaseDAO[User]):
             try:
                 user: OpenID = await google_sso.verify_and_process(request)
 
-                existing_user: User = await self.user_dao.user_exists(
+                existing_user: AuthUser = await self.get_auth_user(
                     db_session, user.email
                 )
 
@@ -51,13 +74,15 @@ class AuthDAO(BaseDAO[User]):
                     if not existing_user.is_verified:
                         raise Exception("User account not verified")
 
-                    existing_user.update_last_login_time()
+                    await self.record_login(db_session, existing_user.user_id)
 
                     return signJWT(existing_user)
                 else:
                     # create a new user if not found
                     created_user = await self.create_google_user(db_session, user)
-                    return signJWT(created_user)
+                    return signJWT(
+                        await self.get_auth_user(db_session, created_user.email)
+                    )
 
             except Exception as e:
                 return DAOResponse[str](
@@ -86,20 +111,106 @@ class AuthDAO(BaseDAO[User]):
 
         return created_user
 
-    async def verify_password(
-        self, db_session: AsyncSession, login_info: Login
-    ) -> bool:
+    async def get_auth_user(
+        self, db_session: AsyncSession, email: str
+    ) -> Optional[AuthUser]:
         """
-        Verifies a user's password against the stored hash.
+        Reads a user's credentials, roles and permission names in one statement.
         """
-        current_user: Union[User | None] = await self.user_dao.user_exists(
-            db_session=db_session, email=login_info.username
+        # permission names per role, aggregated in the database
+        role_permissions = (
+            select(func.aggregate_strings(Permissions.name, ","))
+            .join(
+                RolePermissions,
+                RolePermissions.permission_id == Permissions.permission_id,
+            )
+            .where(RolePermissions.role_id == Role.role_id)
+            .correlate(Role)
+            .scalar_subquery()
         )
 
-        if current_user is None:
-            raise NoResultFound("User does not exist")
+        query = (
+            select(
+                *[getattr(User, key) for key in self.auth_columns],
+                Role.role_id,
+                Role.name.label("role_name"),
+                Role.alias.label("role_alias"),
+                Role.description.label("role_description"),
+                role_permissions.label("role_permissions"),
+            )
+            .outerjoin(UserRoles, UserRoles.user_id == User.user_id)
+            .outerjoin(Role, Role.role_id == UserRoles.role_id)
+            .where(User.email == email)
+        )
+
+        executed_query = await db_session.execute(query)
+        rows = executed_query.mappings().all()
+
+        if not rows:
+            return None
+
+        roles: List[Dict] = []
+        permissions: Dict[str, None] = {}
+        for row in rows:
+            if row["role_id"] is None:
+                continue
+
+            roles.append(
+                {
+                    "role_id": row["role_id"],
+                    "name": row["role_name"],
+                    "alias": row["role_alias"],
+                    "description": row["role_description"],
+                }
+            )
+            # roles can share permissions, keep the first occurrence
+            permissions.update(
+                dict.fromkeys((row["role_permissions"] or "").split(","))
+            )
+
+        permissions.pop("", None)
+
+        return AuthUser(
+            **{key: rows[0][key] for key in self.auth_columns},
+            roles=roles,
+            permissions=list(permissions),
+        )
+
+    async def record_login(self, db_session: AsyncSession, user_id: UUID):
+        """
+        Moves the user's current login time to the last one and stamps a new one.
+        """
+        await db_session.execute(
+            update(User)
+            .where(User.user_id == user_id)
+            .values(
+                last_login_time=User.current_login_time,
+                current_login_time=datetime.now(),
+            )
+        )
 
-        return Hash.verify(current_user.password, login_info.password)
+    async def verify_password(self, current_user: AuthUser, password: str) -> bool:
+        """
+        Verifies a user's password against the stored hash.
+        """
+        return await Hash.verify_async(current_user.password, password)
+
+    async def rehash_password(
+        self, db_session: AsyncSession, current_user: AuthUser, password: str
+    ):
+        """
+        Rehashes a verified password stored with a different cost than configured.
+        """
+        if not Hash.needs_rehash(current_user.password):
+            return
+
+        await db_session.execute(
+            update(User)
+            .where(User.user_id == current_user.user_id)
+            .values(password=await Hash.bcrypt_async(password))
+        )
 
-    async def authenticate_user(self, current_user: User) -> DAOResponse[TokenExposed]:
+    async def authenticate_user(
+        self, current_user: AuthUser
+    ) -> DAOResponse[TokenExposed]:
         return signJWT(current_user)
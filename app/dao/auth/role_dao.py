@@ -6,6 +6,9 @@ from sqlalchemy.orm import selectinload
 from sqlalchemy.orm.exc import NoResultFound
 from sqlalchemy.ext.asyncio import AsyncSession
 
+# db
+from app.db.dbPagination import Pagination
+
 # utils
 from app.utils.response import DAOResponse
 
@@ -32,12 +35,18 @@ class RoleDAO(BaseDAO[Role]):
 
     @override
     async def get_all(
-        self, db_session: AsyncSession, offset: int = 0, limit: int = 100
+        self,
+        db_session: AsyncSession,
+        offset: int = 0,
+        limit: int = 100,
+        pagination: Pagination = None,
     ) -> DAOResponse[List[RoleResponse]]:
         """
         Retrieve all roles with pagination, including role statistics such as user count per role.
         """
-        roles = await super().get_all(db_session=db_session, offset=offset, limit=limit)
+        roles = await super().get_all(
+            db_session=db_session, offset=offset, limit=limit, pagination=pagination
+        )
 
         if not roles:
             return DAOResponse(success=True, data=[])
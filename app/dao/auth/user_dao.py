@@ -1,13 +1,15 @@
 import uuid
-import asyncio
 from uuid import UUID
 from pydantic import ValidationError
 from typing_extensions import override
-from sqlalchemy.orm import selectinload
 from sqlalchemy.orm.exc import NoResultFound
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Any, Dict, List, Optional, Union
 
+# db
+from app.db.dbLoadPlan import LoadPlan
+from app.db.dbPagination import Pagination
+
 # models
 from app.models.user import User
 from app.models.role import Role
@@ -16,7 +18,7 @@ from app.models.role import Role
 from app.services.email_service import EmailService
 
 # utils
-from app.utils.hashing import Hash
+from app.utils.hashing import Hash, HashPoolBusyException
 from app.utils.response import DAOResponse
 
 # daos
@@ -64,6 +66,36 @@ class UserDAO(BaseDAO[User]):
             "rental_history": self.add_rental_history_info,
         }
 
+        self.load_plans = {
+            LoadPlan.DETAIL: [
+                "roles.permissions",
+                "accounts",
+                "addresses.city",
+                "addresses.region",
+                "addresses.country",
+                "emergency_addresses.city",
+                "emergency_addresses.region",
+                "emergency_addresses.country",
+                "rental_histories.addresses.city",
+                "rental_histories.addresses.region",
+                "rental_histories.addresses.country",
+                "client_under_contract.contract.properties",
+                "owned_properties",
+            ],
+            LoadPlan.AUTH: ["roles.permissions"],
+        }
+
+        # the listing serializes the same fields as the detail view
+        self.load_plans[LoadPlan.LIST] = self.load_plans[LoadPlan.DETAIL]
+
+        # projections stay off the accounts and the contract details
+        self.expandable = [
+            "roles.permissions",
+            "addresses.city",
+            "addresses.region",
+            "addresses.country",
+        ]
+
         super().__init__(self.model, nesting_degree=nesting_degree, excludes=excludes)
 
     @override
@@ -81,6 +113,15 @@ class UserDAO(BaseDAO[User]):
             if existing_user:
                 raise Exception("User already exists")
 
+            # verification and prepared, hashed before anything is written
+            verification_token, is_subscribed_token = (
+                str(uuid.uuid4()),
+                str(uuid.uuid4()),
+            )
+            await self.prepare_auth_info(
+                user_data, verification_token, is_subscribed_token
+            )
+
             # prepare and create new user
             user_data["gender"] = GenderEnum(user_data["gender"])
             user_info = self.extract_model_data(user_data, UserBase)
@@ -88,13 +129,6 @@ class UserDAO(BaseDAO[User]):
                 db_session=db_session, obj_in=user_info
             )
 
-            # verification and prepared
-            verification_token, is_subscribed_token = (
-                str(uuid.uuid4()),
-                str(uuid.uuid4()),
-            )
-            self.prepare_auth_info(user_data, verification_token, is_subscribed_token)
-
             # process any entity details
             await self.handle_entity_details(
                 db_session=db_session,
@@ -115,9 +149,9 @@ class UserDAO(BaseDAO[User]):
                 db_session, new_user, verification_token, is_subscribed_token
             )
 
-            # send email to user
+            # send email to user, queued in this transaction
             await self.send_verification_email(
-                new_user, verification_token, is_subscribed_token
+                db_session, new_user, verification_token, is_subscribed_token
             )
 
             return DAOResponse[UserResponse](
@@ -126,6 +160,8 @@ class UserDAO(BaseDAO[User]):
 
         except ValidationError as e:
             return DAOResponse(success=False, data=str(e))
+        except HashPoolBusyException:
+            raise
         except Exception as e:
             await db_session.rollback()
             return DAOResponse[UserResponse](success=False, error=f"Fatal {str(e)}")
@@ -174,28 +210,36 @@ class UserDAO(BaseDAO[User]):
 
     @override
     async def get_all(
-        self, db_session: AsyncSession, offset=0, limit=100
+        self,
+        db_session: AsyncSession,
+        offset=0,
+        limit=100,
+        pagination: Pagination = None,
     ) -> DAOResponse[List[UserResponse]]:
         result = await super().get_all(
-            db_session=db_session, offset=offset, limit=limit
+            db_session=db_session, offset=offset, limit=limit, pagination=pagination
         )
 
         return DAOResponse[List[UserResponse]](
-            success=True, data=[UserResponse.from_orm_model(r) for r in result]
+            success=True,
+            data=[UserResponse.from_orm_model(r) for r in result],
         )
 
     @override
     async def get(
-        self, db_session: AsyncSession, id: Union[UUID | Any | int]
+        self,
+        db_session: AsyncSession,
+        id: Union[UUID | Any | int],
+        load_plan: Optional[str] = None,
     ) -> DAOResponse[UserResponse]:
-        result = await super().get(db_session=db_session, id=id)
+        result = await super().get(db_session=db_session, id=id, load_plan=load_plan)
 
         return DAOResponse[UserResponse](
             success=bool(result),
             data={} if result is None else UserResponse.from_orm_model(result),
         )
 
-    def prepare_auth_info(
+    async def prepare_auth_info(
         self,
         user_data: Dict[str, Any],
         verification_token: str,
@@ -208,14 +252,17 @@ class UserDAO(BaseDAO[User]):
             user_auth_info = user_data["user_auth_info"]
 
             if "password" in user_auth_info:
-                user_auth_info["password"] = Hash.bcrypt(user_auth_info["password"])
+                user_auth_info["password"] = await Hash.bcrypt_async(
+                    user_auth_info["password"]
+                )
 
             user_auth_info["verification_token"] = verification_token
             user_auth_info["is_subscribed_token"] = is_subscribed_token
 
     async def user_exists(self, db_session: AsyncSession, email: str):
-        return await self.query(
-            db_session=db_session, filters={"email": email}, single=True
+        # login checks the same email more than once per request
+        return await self.load(
+            db_session=db_session, key=email, column="email", load_plan=LoadPlan.AUTH
         )
 
     async def get_user_and_role(
@@ -228,7 +275,7 @@ class UserDAO(BaseDAO[User]):
             db_session=db_session,
             filters={f"{self.primary_key}": user_id},
             single=True,
-            options=[selectinload(User.roles)],
+            load_plan=LoadPlan.AUTH,
         )
         role = await self.role_dao.query(
             db_session=db_session, filters={"alias": role_alias}, single=True
@@ -286,19 +333,22 @@ class UserDAO(BaseDAO[User]):
             return DAOResponse[User](success=False, error=str(e))
 
     async def send_verification_email(
-        self, user: User, verification_token: str, is_subscribed_token: str
+        self,
+        db_session: AsyncSession,
+        user: User,
+        verification_token: str,
+        is_subscribed_token: str,
     ):
         """
         Sends a verification email to the user.
         """
         email_service = EmailService()
-        asyncio.create_task(
-            email_service.send_user_email(
-                user.email,
-                f"{user.first_name} {user.last_name}",
-                VERIFICATION_LINK.format(user.email, verification_token),
-                UNSUBSCRIBE_LINK.format(user.email, is_subscribed_token),
-            )
+        await email_service.send_user_email(
+            db_session,
+            user.email,
+            f"{user.first_name} {user.last_name}",
+            VERIFICATION_LINK.format(user.email, verification_token),
+            UNSUBSCRIBE_LINK.format(user.email, is_subscribed_token),
         )
 
     async def update_and_refresh_user(
@@ -315,7 +365,6 @@ class UserDAO(BaseDAO[User]):
             db_session=db_session,
             filters={f"{self.primary_key}": user.user_id},
             single=True,
-            options=[selectinload(User.addresses)],
         )
         user.verification_token = verification_token
         user.is_subscribed_token = is_subscribed_token
@@ -1,10 +1,14 @@
 from uuid import UUID
-from typing import Any, List, Union
+from typing import Any, List, Optional, Union
 from pydantic import ValidationError
 from sqlalchemy.orm import joinedload
 from typing_extensions import override
 from sqlalchemy.ext.asyncio import AsyncSession
 
+# db
+from app.db.dbLoadPlan import LoadPlan
+from app.db.dbPagination import Pagination
+
 # utils
 from app.utils.response import DAOResponse
 
@@ -43,6 +47,17 @@ class InvoiceDAO(BaseDAO[Invoice]):
 
         self.detail_mappings = {"invoice_items": self.add_invoice_details}
 
+        self.load_plans = {
+            LoadPlan.LIST: ["issued_by_user", "issued_to_user", "invoice_items"],
+            LoadPlan.DETAIL: [
+                "issued_by_user",
+                "issued_to_user",
+                "invoice_items",
+                "contracts.properties",
+                "transaction",
+            ],
+        }
+
         super().__init__(self.model, nesting_degree=nesting_degree, excludes=excludes)
 
     @override
@@ -118,10 +133,14 @@ class InvoiceDAO(BaseDAO[Invoice]):
 
     @override
     async def get_all(
-        self, db_session: AsyncSession, offset=0, limit=100
+        self,
+        db_session: AsyncSession,
+        offset=0,
+        limit=100,
+        pagination: Pagination = None,
     ) -> DAOResponse[List[InvoiceResponse]]:
         result = await super().get_all(
-            db_session=db_session, offset=offset, limit=limit
+            db_session=db_session, offset=offset, limit=limit, pagination=pagination
         )
 
         return DAOResponse[List[InvoiceResponse]](
@@ -130,9 +149,14 @@ class InvoiceDAO(BaseDAO[Invoice]):
 
     @override
     async def get(
-        self, db_session: AsyncSession, id: Union[UUID | Any | int]
+        self,
+        db_session: AsyncSession,
+        id: Union[UUID | Any | int],
+        load_plan: Optional[str] = None,
     ) -> DAOResponse[InvoiceResponse]:
-        result: Invoice = await super().get(db_session=db_session, id=id)
+        result: Invoice = await super().get(
+            db_session=db_session, id=id, load_plan=load_plan
+        )
 
         return DAOResponse[InvoiceResponse](
             success=bool(result),
@@ -1,9 +1,13 @@
 from uuid import UUID
-from typing import Any, List, Union
+from typing import Any, List, Optional, Union
 from pydantic import ValidationError
 from typing_extensions import override
 from sqlalchemy.ext.asyncio import AsyncSession
 
+# db
+from app.db.dbLoadPlan import LoadPlan
+from app.db.dbPagination import Pagination
+
 # daos
 from app.dao.resources.base_dao import BaseDAO
 
@@ -27,6 +31,17 @@ class TransactionDAO(BaseDAO[Transaction]):
         self.model = Transaction
         self.primary_key = "transaction_number"
 
+        self.load_plans = {
+            LoadPlan.LIST: [
+                "client_offered_transaction",
+                "client_requested_transaction",
+            ],
+            LoadPlan.DETAIL: [
+                "client_offered_transaction",
+                "client_requested_transaction",
+            ],
+        }
+
         super().__init__(self.model, nesting_degree=nesting_degree, excludes=excludes)
 
     @override
@@ -88,10 +103,14 @@ class TransactionDAO(BaseDAO[Transaction]):
 
     @override
     async def get_all(
-        self, db_session: AsyncSession, offset=0, limit=100
+        self,
+        db_session: AsyncSession,
+        offset=0,
+        limit=100,
+        pagination: Pagination = None,
     ) -> DAOResponse[List[TransactionResponse]]:
         result = await super().get_all(
-            db_session=db_session, offset=offset, limit=limit
+            db_session=db_session, offset=offset, limit=limit, pagination=pagination
         )
 
         return DAOResponse[List[TransactionResponse]](
@@ -100,9 +119,14 @@ class TransactionDAO(BaseDAO[Transaction]):
 
     @override
     async def get(
-        self, db_session: AsyncSession, id: Union[UUID | Any | int]
+        self,
+        db_session: AsyncSession,
+        id: Union[UUID | Any | int],
+        load_plan: Optional[str] = None,
     ) -> DAOResponse[TransactionResponse]:
-        result: Transaction = await super().get(db_session=db_session, id=id)
+        result: Transaction = await super().get(
+            db_session=db_session, id=id, load_plan=load_plan
+        )
 
         return DAOResponse[TransactionResponse](
             success=bool(result),
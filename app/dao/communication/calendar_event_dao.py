@@ -1,9 +1,13 @@
 from uuid import UUID
-from typing import Any, List, Union
+from typing import Any, List, Optional, Union
 from pydantic import ValidationError
 from typing_extensions import override
 from sqlalchemy.ext.asyncio import AsyncSession
 
+# db
+from app.db.dbLoadPlan import LoadPlan
+from app.db.dbPagination import Pagination
+
 # utils
 from app.utils.response import DAOResponse
 
@@ -28,6 +32,11 @@ class CalendarEventDAO(BaseDAO[CalendarEvent]):
         self.model = CalendarEvent
         self.primary_key = "event_id"
 
+        self.load_plans = {
+            LoadPlan.LIST: ["organizer"],
+            LoadPlan.DETAIL: ["organizer"],
+        }
+
         super().__init__(self.model, nesting_degree=nesting_degree, excludes=excludes)
 
     @override
@@ -61,10 +70,14 @@ class CalendarEventDAO(BaseDAO[CalendarEvent]):
 
     @override
     async def get_all(
-        self, db_session: AsyncSession, offset=0, limit=100
+        self,
+        db_session: AsyncSession,
+        offset=0,
+        limit=100,
+        pagination: Pagination = None,
     ) -> DAOResponse[List[CalendarEventResponse]]:
         result = await super().get_all(
-            db_session=db_session, offset=offset, limit=limit
+            db_session=db_session, offset=offset, limit=limit, pagination=pagination
         )
 
         return DAOResponse[List[CalendarEventResponse]](
@@ -73,9 +86,14 @@ class CalendarEventDAO(BaseDAO[CalendarEvent]):
 
     @override
     async def get(
-        self, db_session: AsyncSession, id: Union[UUID | Any | int]
+        self,
+        db_session: AsyncSession,
+        id: Union[UUID | Any | int],
+        load_plan: Optional[str] = None,
     ) -> DAOResponse[CalendarEventResponse]:
-        result: CalendarEvent = await super().get(db_session=db_session, id=id)
+        result: CalendarEvent = await super().get(
+            db_session=db_session, id=id, load_plan=load_plan
+        )
 
         return DAOResponse[CalendarEventResponse](
             success=bool(result),
@@ -1,9 +1,13 @@
 from uuid import UUID
-from typing import Any, List, Union
+from typing import Any, List, Optional, Union
 from pydantic import ValidationError
 from typing_extensions import override
 from sqlalchemy.ext.asyncio import AsyncSession
 
+# db
+from app.db.dbLoadPlan import LoadPlan
+from app.db.dbPagination import Pagination
+
 # utils
 from app.utils.response import DAOResponse
 
@@ -27,6 +31,11 @@ class MaintenanceRequestDAO(BaseDAO[MaintenanceRequest]):
         self.model = MaintenanceRequest
         self.primary_key = "task_number"
 
+        self.load_plans = {
+            LoadPlan.LIST: ["user", "property_unit_assoc"],
+            LoadPlan.DETAIL: ["user", "property_unit_assoc"],
+        }
+
         super().__init__(self.model, nesting_degree=nesting_degree, excludes=excludes)
 
     @override
@@ -59,10 +68,14 @@ class MaintenanceRequestDAO(BaseDAO[MaintenanceRequest]):
 
     @override
     async def get_all(
-        self, db_session: AsyncSession, offset=0, limit=100
+        self,
+        db_session: AsyncSession,
+        offset=0,
+        limit=100,
+        pagination: Pagination = None,
     ) -> DAOResponse[List[MaintenanceRequestResponse]]:
         result = await super().get_all(
-            db_session=db_session, offset=offset, limit=limit
+            db_session=db_session, offset=offset, limit=limit, pagination=pagination
         )
 
         return DAOResponse[List[MaintenanceRequestResponse]](
@@ -72,9 +85,14 @@ class MaintenanceRequestDAO(BaseDAO[MaintenanceRequest]):
 
     @override
     async def get(
-        self, db_session: AsyncSession, id: Union[UUID | Any | int]
+        self,
+        db_session: AsyncSession,
+        id: Union[UUID | Any | int],
+        load_plan: Optional[str] = None,
     ) -> DAOResponse[MaintenanceRequestResponse]:
-        result: MaintenanceRequest = await super().get(db_session=db_session, id=id)
+        result: MaintenanceRequest = await super().get(
+            db_session=db_session, id=id, load_plan=load_plan
+        )
 
         return DAOResponse[MaintenanceRequestResponse](
             success=bool(result),
@@ -1,9 +1,16 @@
+import pytz
 from uuid import UUID
-from typing import Any, List, Union
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Union
 from typing_extensions import override
+from sqlalchemy import Select, func, insert, select, update
 from sqlalchemy.orm.exc import NoResultFound
 from sqlalchemy.ext.asyncio import AsyncSession
 
+# db
+from app.db.dbLoadPlan import LoadPlan
+from app.db.dbPagination import Pagination
+
 # daos
 from app.dao.resources.base_dao import BaseDAO
 
@@ -11,8 +18,12 @@ from app.dao.resources.base_dao import BaseDAO
 from app.utils.settings import settings
 from app.utils.response import DAOResponse
 
+# services
+from app.services.mailbox_fanout import MAILBOX_PENDING
+
 # models
 from app.models.message import Message
+from app.models.user_mailbox import UserMailbox
 from app.models.message_recipient import MessageRecipient
 
 # schemas
@@ -28,6 +39,11 @@ class MessageDAO(BaseDAO[Message]):
         self.model = Message
         self.primary_key = "message_id"
 
+        self.load_plans = {
+            LoadPlan.LIST: ["sender"],
+            LoadPlan.DETAIL: ["sender", "recipients.recipient"],
+        }
+
         super().__init__(self.model, nesting_degree=nesting_degree, excludes=excludes)
 
     @override
@@ -45,37 +61,51 @@ class MessageDAO(BaseDAO[Message]):
             # extract base information
             message_info = self.extract_model_data(message_items, MessageCreate)
 
-            # create new user
-            new_message: Message = await super().create(
-                db_session=db_session, obj_in=message_info
-            )
+            new_message: Message = self.model(**message_info)
+            db_session.add(new_message)
+            await db_session.flush()
+
             new_message.thread_id = new_message.message_id
             new_message.parent_message_id = new_message.message_id
 
-            # Create and add message recipients
-            recipients = [
-                MessageRecipient(
-                    recipient_id=rid, message_id=new_message.message_id, is_read=False
-                )
-                for rid in obj_in["recipient_ids"]
-            ]
-            recipients_groups = [
-                MessageRecipient(
-                    recipient_group_id=rid,
-                    message_id=new_message.message_id,
-                    is_read=False,
+            # every recipient in one multi-row INSERT, in the message's transaction
+            recipient_ids = list(dict.fromkeys(obj_in.get("recipient_ids") or []))
+            group_ids = list(dict.fromkeys(obj_in.get("recipient_groups") or []))
+            rows = [
+                {"recipient_id": rid, "recipient_group_id": None}
+                for rid in recipient_ids
+            ] + [{"recipient_id": None, "recipient_group_id": gid} for gid in group_ids]
+
+            if rows:
+                sent_at = datetime.now(pytz.utc)
+                await db_session.execute(
+                    insert(MessageRecipient),
+                    [
+                        {
+                            **row,
+                            "message_id": new_message.message_id,
+                            "msg_send_date": sent_at,
+                            "is_read": False,
+                        }
+                        for row in rows
+                    ],
                 )
-                for rid in obj_in["recipient_groups"]
-            ]
-            db_session.add_all(recipients + recipients_groups)
 
-            # commit transactions.
-            for obj in recipients + recipients_groups:
-                await self.commit_and_refresh(db_session=db_session, obj=obj)
+            # the mailbox fan-out picks the message up once this commits
+            db_session.info[MAILBOX_PENDING] = True
+
+            await self.commit(db_session)
+            await db_session.refresh(new_message, ["sender"])
 
-            await self.commit_and_refresh(db_session=db_session, obj=new_message)
             return DAOResponse[MessageResponseModel](
-                success=True, data=MessageResponseModel.from_orm_model(new_message)
+                success=True,
+                data={
+                    **MessageResponseModel.from_orm_model(
+                        new_message, with_recipients=False
+                    ),
+                    "recipient_count": len(recipient_ids),
+                    "recipient_group_count": len(group_ids),
+                },
             )
         except NoResultFound:
             msg = "MessageDAO Create Failure"
@@ -85,25 +115,236 @@ class MessageDAO(BaseDAO[Message]):
             msg = f"MessageDAO Create Failure: {str(e)}"
             return DAOResponse(success=False, error=msg)
 
+    async def listing(
+        self, db_session: AsyncSession, messages: List[Message]
+    ) -> List[Dict[str, Any]]:
+        """
+        Listing rows of the messages, their recipients counted rather than loaded.
+        """
+        counts = {}
+
+        if messages:
+            result = await db_session.execute(
+                select(
+                    MessageRecipient.message_id,
+                    func.count(MessageRecipient.recipient_id),
+                    func.count(MessageRecipient.recipient_group_id),
+                )
+                .where(
+                    MessageRecipient.message_id.in_([m.message_id for m in messages])
+                )
+                .group_by(MessageRecipient.message_id)
+            )
+            counts = {message_id: rest for message_id, *rest in result.all()}
+
+        return [
+            {
+                **MessageResponseModel.from_orm_model(message, with_recipients=False),
+                "recipient_count": counts.get(message.message_id, (0, 0))[0],
+                "recipient_group_count": counts.get(message.message_id, (0, 0))[1],
+            }
+            for message in messages
+        ]
+
     @override
     async def get_all(
-        self, db_session: AsyncSession, offset=0, limit=100
+        self,
+        db_session: AsyncSession,
+        offset=0,
+        limit=100,
+        pagination: Pagination = None,
     ) -> DAOResponse[List[MessageResponseModel]]:
         result = await super().get_all(
-            db_session=db_session, offset=offset, limit=limit
+            db_session=db_session, offset=offset, limit=limit, pagination=pagination
         )
 
         return DAOResponse[List[MessageResponseModel]](
-            success=True, data=[MessageResponseModel.from_orm_model(r) for r in result]
+            success=True, data=await self.listing(db_session, result)
         )
 
     @override
     async def get(
-        self, db_session: AsyncSession, id: Union[UUID | Any | int]
+        self,
+        db_session: AsyncSession,
+        id: Union[UUID | Any | int],
+        load_plan: Optional[str] = None,
     ) -> DAOResponse[MessageResponseModel]:
-        result: Message = await super().get(db_session=db_session, id=id)
+        result: Message = await super().get(
+            db_session=db_session, id=id, load_plan=load_plan
+        )
 
         return DAOResponse[MessageResponseModel](
             success=bool(result),
             data={} if result is None else MessageResponseModel.from_orm_model(result),
         )
+
+    @staticmethod
+    def page_meta(pagination: Pagination) -> Dict[str, Any]:
+        return {
+            "limit": pagination.limit,
+            "next_cursor": pagination.next_cursor,
+            "previous_cursor": pagination.previous_cursor,
+            "has_more": pagination.has_more,
+        }
+
+    def sent_query(
+        self,
+        sender_id: UUID,
+        is_draft: bool = False,
+        is_scheduled: bool = False,
+        since: Optional[datetime] = None,
+    ) -> Select:
+        query = (
+            select(self.model)
+            .where(
+                self.model.sender_id == sender_id,
+                self.model.is_draft.is_(is_draft),
+                self.model.is_scheduled.is_(is_scheduled),
+                self.model.is_notification.is_(False),
+            )
+            .options(*self.load_options(LoadPlan.LIST))
+        )
+
+        if since is not None:
+            query = query.where(self.model.date_created > since)
+
+        return query
+
+    async def get_sent(
+        self,
+        db_session: AsyncSession,
+        sender_id: UUID,
+        is_draft: bool = False,
+        is_scheduled: bool = False,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        since: Optional[datetime] = None,
+    ) -> DAOResponse[List[MessageResponseModel]]:
+        """
+        A page of the sender's messages, drafts or scheduled messages, newest first.
+        """
+        pagination = Pagination(
+            limit=limit,
+            cursor=cursor,
+            order_by=[self.model.date_created, self.model.message_id],
+            descending=True,
+        )
+        query = pagination.apply(
+            self.sent_query(sender_id, is_draft, is_scheduled, since), self.model
+        )
+
+        result = await db_session.execute(query)
+        messages = pagination.paginate(result.scalars().all(), self.model)
+
+        return DAOResponse[List[MessageResponseModel]](
+            success=True,
+            data=await self.listing(db_session, messages),
+            meta=self.page_meta(pagination),
+        )
+
+    def inbox_query(
+        self,
+        user_id: UUID,
+        is_notification: bool = False,
+        since: Optional[datetime] = None,
+    ) -> Select:
+        """
+        The user's mailbox rows with their messages.
+
+        Group messages are resolved to their recipients when they're fanned
+        out, so this is a range scan of the user's mailbox rows.
+        """
+        query = (
+            select(UserMailbox)
+            .where(
+                UserMailbox.user_id == user_id,
+                UserMailbox.is_notification.is_(is_notification),
+            )
+            .options(
+                *LoadPlan.options(
+                    UserMailbox,
+                    [f"message.{path}" for path in self.load_plans[LoadPlan.LIST]],
+                    strict=settings.DB_STRICT_LOADING,
+                )
+            )
+        )
+
+        if since is not None:
+            query = query.where(UserMailbox.created_at > since)
+
+        return query
+
+    async def get_inbox(
+        self,
+        db_session: AsyncSession,
+        user_id: UUID,
+        is_notification: bool = False,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        since: Optional[datetime] = None,
+    ) -> DAOResponse[List[MessageResponseModel]]:
+        """
+        A page of the user's inbox or notifications, newest first.
+
+        Mailbox rows carry the message's creation date, so the cursor is the
+        message's (date_created, message_id) like the sent listings.
+        """
+        pagination = Pagination(
+            limit=limit,
+            cursor=cursor,
+            order_by=[UserMailbox.created_at, UserMailbox.message_id],
+            descending=True,
+        )
+        query = pagination.apply(
+            self.inbox_query(user_id, is_notification, since), UserMailbox
+        )
+
+        result = await db_session.execute(query)
+        mailbox = pagination.paginate(result.scalars().all(), UserMailbox)
+        messages = await self.listing(db_session, [row.message for row in mailbox])
+
+        return DAOResponse[List[MessageResponseModel]](
+            success=True,
+            data=[
+                {**message, "is_read": row.is_read}
+                for message, row in zip(messages, mailbox)
+            ],
+            meta=self.page_meta(pagination),
+        )
+
+    async def get_unread_counts(
+        self, db_session: AsyncSession, user_id: UUID
+    ) -> DAOResponse[Dict[str, int]]:
+        result = await db_session.execute(
+            select(UserMailbox.is_notification, func.count())
+            .where(UserMailbox.user_id == user_id, UserMailbox.is_read.is_(False))
+            .group_by(UserMailbox.is_notification)
+        )
+        counts = dict(result.all())
+
+        return DAOResponse[Dict[str, int]](
+            success=True,
+            data={
+                "inbox": counts.get(False, 0),
+                "notifications": counts.get(True, 0),
+            },
+        )
+
+    async def mark_read(
+        self, db_session: AsyncSession, user_id: UUID, message_ids: List[UUID]
+    ) -> DAOResponse[Dict[str, int]]:
+        result = await db_session.execute(
+            update(UserMailbox)
+            .where(
+                UserMailbox.user_id == user_id,
+                UserMailbox.message_id.in_(message_ids),
+                UserMailbox.is_read.is_(False),
+            )
+            .values(is_read=True, read_at=datetime.now(pytz.utc))
+            .execution_options(synchronize_session=False)
+        )
+        await self.commit(db_session)
+
+        return DAOResponse[Dict[str, int]](
+            success=True, data={"updated": result.rowcount}
+        )
@@ -1,9 +1,13 @@
 from uuid import UUID
-from typing import Any, List, Union
+from typing import Any, List, Optional, Union
 from pydantic import ValidationError
 from typing_extensions import override
 from sqlalchemy.ext.asyncio import AsyncSession
 
+# db
+from app.db.dbLoadPlan import LoadPlan
+from app.db.dbPagination import Pagination
+
 # daos
 from app.dao.resources.base_dao import BaseDAO
 
@@ -22,6 +26,11 @@ class TourBookingDAO(BaseDAO[Tour]):
         self.model = Tour
         self.primary_key = "tour_booking_id"
 
+        self.load_plans = {
+            LoadPlan.LIST: ["property_unit_assoc", "user"],
+            LoadPlan.DETAIL: ["property_unit_assoc", "user"],
+        }
+
         super().__init__(self.model, nesting_degree=nesting_degree, excludes=excludes)
 
     # TODO:
@@ -52,10 +61,14 @@ class TourBookingDAO(BaseDAO[Tour]):
 
     @override
     async def get_all(
-        self, db_session: AsyncSession, offset=0, limit=100
+        self,
+        db_session: AsyncSession,
+        offset=0,
+        limit=100,
+        pagination: Pagination = None,
     ) -> DAOResponse[List[TourResponse]]:
         result = await super().get_all(
-            db_session=db_session, offset=offset, limit=limit
+            db_session=db_session, offset=offset, limit=limit, pagination=pagination
         )
 
         return DAOResponse[List[TourResponse]](
@@ -64,9 +77,14 @@ class TourBookingDAO(BaseDAO[Tour]):
 
     @override
     async def get(
-        self, db_session: AsyncSession, id: Union[UUID | Any | int]
+        self,
+        db_session: AsyncSession,
+        id: Union[UUID | Any | int],
+        load_plan: Optional[str] = None,
     ) -> DAOResponse[TourResponse]:
-        result: Tour = await super().get(db_session=db_session, id=id)
+        result: Tour = await super().get(
+            db_session=db_session, id=id, load_plan=load_plan
+        )
 
         return DAOResponse[TourResponse](
             success=bool(result),
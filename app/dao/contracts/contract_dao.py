@@ -6,6 +6,10 @@ from sqlalchemy.orm.exc import NoResultFound
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Any, Dict, List, Optional, Union
 
+# db
+from app.db.dbLoadPlan import LoadPlan
+from app.db.dbPagination import Pagination
+
 # utils
 from app.utils.response import DAOResponse
 
@@ -49,6 +53,26 @@ class ContractDAO(BaseDAO[Contract]):
             "utilities": self.utility_dao.add_entity_utility,
         }
 
+        self.load_plans = {
+            LoadPlan.DETAIL: [
+                "under_contract.properties",
+                "under_contract.client_representative",
+                "under_contract.employee_representative",
+                "utilities.payment_type",
+                "utilities.utility",
+            ],
+        }
+
+        # the listing serializes the same fields as the detail view
+        self.load_plans[LoadPlan.LIST] = self.load_plans[LoadPlan.DETAIL]
+
+        # projections stay off the billing details
+        self.expandable = [
+            "under_contract.properties",
+            "under_contract.client_representative",
+            "under_contract.employee_representative",
+        ]
+
         super().__init__(self.model, nesting_degree=nesting_degree, excludes=excludes)
 
     @override
@@ -98,21 +122,29 @@ class ContractDAO(BaseDAO[Contract]):
 
     @override
     async def get_all(
-        self, db_session: AsyncSession, offset=0, limit=100
+        self,
+        db_session: AsyncSession,
+        offset=0,
+        limit=100,
+        pagination: Pagination = None,
     ) -> DAOResponse[List[ContractResponse]]:
         result = await super().get_all(
-            db_session=db_session, offset=offset, limit=limit
+            db_session=db_session, offset=offset, limit=limit, pagination=pagination
         )
 
         return DAOResponse[List[ContractResponse | Dict]](
-            success=True, data=[ContractResponse.from_orm_model(r) for r in result]
+            success=True,
+            data=[ContractResponse.from_orm_model(r) for r in result],
         )
 
     @override
     async def get(
-        self, db_session: AsyncSession, id: Union[UUID | Any | int]
+        self,
+        db_session: AsyncSession,
+        id: Union[UUID | Any | int],
+        load_plan: Optional[str] = None,
     ) -> DAOResponse[ContractResponse]:
-        result = await super().get(db_session=db_session, id=id)
+        result = await super().get(db_session=db_session, id=id, load_plan=load_plan)
 
         return DAOResponse[ContractResponse](
             success=bool(result),
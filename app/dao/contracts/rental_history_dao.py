@@ -6,6 +6,9 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.dao.resources.base_dao import BaseDAO
 from app.dao.address.address_dao import AddressDAO
 
+# db
+from app.db.dbLoadPlan import LoadPlan
+
 # models
 from app.models.rental_history import PastRentalHistory as PastRentalHistoryModel
 
@@ -31,6 +34,19 @@ class PastRentalHistoryDAO(BaseDAO[PastRentalHistoryModel]):
             "address": self.address_dao.add_entity_address,
         }
 
+        self.load_plans = {
+            LoadPlan.LIST: [
+                "addresses.city",
+                "addresses.region",
+                "addresses.country",
+            ],
+            LoadPlan.DETAIL: [
+                "addresses.city",
+                "addresses.region",
+                "addresses.country",
+            ],
+        }
+
         super().__init__(self.model, nesting_degree=nesting_degree, excludes=excludes)
 
     async def create_or_update_rental_history_entity(
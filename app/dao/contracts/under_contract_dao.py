@@ -11,6 +11,9 @@ from app.utils.response import DAOResponse
 # enums
 from app.schema.enums import ContractStatus
 
+# db
+from app.db.dbLoadPlan import LoadPlan
+
 # models
 from app.models.under_contract import UnderContract
 
@@ -34,6 +37,21 @@ class UnderContractDAO(BaseDAO[UnderContract]):
             UnderContract, nesting_degree=nesting_degree, excludes=excludes
         )
         self.primary_key = "under_contract_id"
+        self.load_plans = {
+            LoadPlan.LIST: [
+                "client_representative",
+                "employee_representative",
+                "properties",
+                "contract",
+            ],
+            LoadPlan.DETAIL: [
+                "client_representative",
+                "employee_representative",
+                "properties",
+                "contract",
+            ],
+        }
+
         self.user_dao = UserDAO()
         self.contract_dao = ContractDAO()
         self.property_unit_assoc_dao = PropertyUnitAssocDAO()
@@ -46,25 +64,12 @@ class UnderContractDAO(BaseDAO[UnderContract]):
         contract_id: str,
         property_unit_assoc: UUID,
     ) -> Union[None, DAOResponse]:
-        user_dao_queries = [
-            self.user_dao.query(
-                db_session, filters={"user_id": client_id}, single=True
-            ),
-            self.user_dao.query(
-                db_session, filters={"user_id": employee_id}, single=True
-            ),
-        ]
-        contract_dao_query = self.contract_dao.query(
-            db_session, filters={"contract_number": contract_id}, single=True
-        )
-        property_unit_assoc_dao_query = self.property_unit_assoc_dao.query(
-            db_session,
-            filters={"property_unit_assoc_id": property_unit_assoc},
-            single=True,
-        )
-
+        # existence checks only, coalesced into one query per table
         client, employee, contract, property_unit = await asyncio.gather(
-            *user_dao_queries, contract_dao_query, property_unit_assoc_dao_query
+            self.user_dao.load(db_session, client_id),
+            self.user_dao.load(db_session, employee_id),
+            self.contract_dao.load(db_session, contract_id, column="contract_number"),
+            self.property_unit_assoc_dao.load(db_session, property_unit_assoc),
         )
 
         if not client:
@@ -1,8 +1,12 @@
 from uuid import UUID
-from typing import Any, List, Union
+from typing import Any, List, Optional, Union
 from typing_extensions import override
 from sqlalchemy.ext.asyncio import AsyncSession
 
+# db
+from app.db.dbLoadPlan import LoadPlan
+from app.db.dbPagination import Pagination
+
 from app.dao.resources.base_dao import BaseDAO
 from app.models.property_assignment import PropertyAssignment
 
@@ -19,6 +23,11 @@ class PropertyAssignmentDAO(BaseDAO[PropertyAssignment]):
         self.model = PropertyAssignment
         self.primary_key = "property_assignment_id"
 
+        self.load_plans = {
+            LoadPlan.LIST: ["property_unit_assoc", "user"],
+            LoadPlan.DETAIL: ["property_unit_assoc", "user"],
+        }
+
         super().__init__(self.model, nesting_degree=nesting_degree, excludes=excludes)
 
     @override
@@ -64,10 +73,14 @@ class PropertyAssignmentDAO(BaseDAO[PropertyAssignment]):
 
     @override
     async def get_all(
-        self, db_session: AsyncSession, offset=0, limit=100
+        self,
+        db_session: AsyncSession,
+        offset=0,
+        limit=100,
+        pagination: Pagination = None,
     ) -> DAOResponse[List[PropertyAssignmentResponse]]:
         result = await super().get_all(
-            db_session=db_session, offset=offset, limit=limit
+            db_session=db_session, offset=offset, limit=limit, pagination=pagination
         )
 
         return DAOResponse[List[PropertyAssignmentResponse]](
@@ -77,9 +90,14 @@ class PropertyAssignmentDAO(BaseDAO[PropertyAssignment]):
 
     @override
     async def get(
-        self, db_session: AsyncSession, id: Union[UUID | Any | int]
+        self,
+        db_session: AsyncSession,
+        id: Union[UUID | Any | int],
+        load_plan: Optional[str] = None,
     ) -> DAOResponse[PropertyAssignmentResponse]:
-        result: PropertyAssignment = await super().get(db_session=db_session, id=id)
+        result: PropertyAssignment = await super().get(
+            db_session=db_session, id=id, load_plan=load_plan
+        )
 
         return DAOResponse[PropertyAssignmentResponse](
             success=bool(result),
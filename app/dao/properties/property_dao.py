@@ -2,9 +2,13 @@ from uuid import UUID
 from pydantic import ValidationError
 from typing_extensions import override
 from sqlalchemy.orm import selectinload
-from typing import Any, Dict, List, Union
+from typing import Any, Dict, List, Optional, Union
 from sqlalchemy.ext.asyncio import AsyncSession
 
+# db
+from app.db.dbLoadPlan import LoadPlan
+from app.db.dbPagination import Pagination
+
 # models
 from app.models.property import Property
 
@@ -45,6 +49,32 @@ class PropertyDAO(BaseDAO[Property]):
             "utilities": self.utility_dao.add_entity_utility,
         }
 
+        self.load_plans = {
+            LoadPlan.DETAIL: [
+                "addresses.city",
+                "addresses.region",
+                "addresses.country",
+                "units",
+                "media",
+                "entity_amenities.amenity",
+                "entity_amenities.media",
+                "utilities.payment_type",
+                "utilities.utility",
+                "assigned_users.user",
+            ],
+        }
+
+        # the listing serializes the same fields as the detail view
+        self.load_plans[LoadPlan.LIST] = self.load_plans[LoadPlan.DETAIL]
+
+        # projections stay off the assigned users and the billing details
+        self.expandable = [
+            "addresses.city",
+            "addresses.region",
+            "addresses.country",
+            "media",
+        ]
+
         super().__init__(self.model, nesting_degree=nesting_degree, excludes=excludes)
 
     @override
@@ -134,24 +164,34 @@ class PropertyDAO(BaseDAO[Property]):
 
     @override
     async def get_all(
-        self, db_session: AsyncSession, offset=0, limit=100
+        self,
+        db_session: AsyncSession,
+        offset=0,
+        limit=100,
+        pagination: Pagination = None,
     ) -> DAOResponse[List[PropertyResponse]]:
         result = await super().get_all(
-            db_session=db_session, offset=offset, limit=limit
+            db_session=db_session, offset=offset, limit=limit, pagination=pagination
         )
 
         if not result:
             return DAOResponse(success=True, data=[])
 
         return DAOResponse[List[PropertyResponse]](
-            success=True, data=[PropertyResponse.from_orm_model(r) for r in result]
+            success=True,
+            data=[PropertyResponse.from_orm_model(r) for r in result],
         )
 
     @override
     async def get(
-        self, db_session: AsyncSession, id: Union[UUID | Any | int]
+        self,
+        db_session: AsyncSession,
+        id: Union[UUID | Any | int],
+        load_plan: Optional[str] = None,
     ) -> DAOResponse[PropertyResponse]:
-        result: Property = await super().get(db_session=db_session, id=id)
+        result: Property = await super().get(
+            db_session=db_session, id=id, load_plan=load_plan
+        )
 
         if not result:
             return DAOResponse(success=True, data={})
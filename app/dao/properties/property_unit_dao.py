@@ -2,9 +2,13 @@ from uuid import UUID
 from pydantic import ValidationError
 from typing_extensions import override
 from sqlalchemy.orm import selectinload
-from typing import Any, Dict, List, Union
+from typing import Any, Dict, List, Optional, Union
 from sqlalchemy.ext.asyncio import AsyncSession
 
+# db
+from app.db.dbLoadPlan import LoadPlan
+from app.db.dbPagination import Pagination
+
 # models
 from app.models.unit import Units
 
@@ -43,6 +47,24 @@ class PropertyUnitDAO(BaseDAO[Units]):
             "amenities": self.ammenity_dao.add_entity_ammenity,
             "utilities": self.utility_dao.add_entity_utility,
         }
+        self.load_plans = {
+            LoadPlan.DETAIL: [
+                "property",
+                "media",
+                "entity_amenities.amenity",
+                "entity_amenities.media",
+                "utilities.payment_type",
+                "utilities.utility",
+                "assigned_users.user",
+            ],
+        }
+
+        # the listing serializes the same fields as the detail view
+        self.load_plans[LoadPlan.LIST] = self.load_plans[LoadPlan.DETAIL]
+
+        # projections stay off the assigned users and the billing details
+        self.expandable = ["property", "media"]
+
         super().__init__(self.model, nesting_degree=nesting_degree, excludes=excludes)
 
     @override
@@ -137,21 +159,31 @@ class PropertyUnitDAO(BaseDAO[Units]):
 
     @override
     async def get_all(
-        self, db_session: AsyncSession, offset=0, limit=100
+        self,
+        db_session: AsyncSession,
+        offset=0,
+        limit=100,
+        pagination: Pagination = None,
     ) -> DAOResponse[List[PropertyUnitResponse]]:
         result = await super().get_all(
-            db_session=db_session, offset=offset, limit=limit
+            db_session=db_session, offset=offset, limit=limit, pagination=pagination
         )
 
         return DAOResponse[List[PropertyUnitResponse]](
-            success=True, data=[PropertyUnitResponse.from_orm_model(r) for r in result]
+            success=True,
+            data=[PropertyUnitResponse.from_orm_model(r) for r in result],
         )
 
     @override
     async def get(
-        self, db_session: AsyncSession, id: Union[UUID | Any | int]
+        self,
+        db_session: AsyncSession,
+        id: Union[UUID | Any | int],
+        load_plan: Optional[str] = None,
     ) -> DAOResponse[PropertyUnitResponse]:
-        result: Units = await super().get(db_session=db_session, id=id)
+        result: Units = await super().get(
+            db_session=db_session, id=id, load_plan=load_plan
+        )
 
         return DAOResponse[PropertyUnitResponse](
             success=bool(result),
@@ -1,3 +1,4 @@
+import asyncio
 from uuid import UUID
 from pydantic import ValidationError
 from typing_extensions import override
@@ -5,12 +6,16 @@ from sqlalchemy.orm.exc import NoResultFound
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Any, List, Dict, Optional, Union
 
+# db
+from app.db.dbPagination import Pagination
+
 # models
 from app.models.entity_media import EntityMedia
 from app.models.media import Media as MediaModel
 
 # utils
 from app.utils.response import DAOResponse
+from app.utils.uploads import SpooledUpload
 
 # services
 from app.services.upload_service import MediaUploaderService
@@ -25,11 +30,14 @@ from app.schema.media import (
     Media,
     MediaCreateSchema,
     MediaResponse,
+    MediaUploadSchema,
     MediaUpdateSchema,
 )
 
 
 class MediaDAO(BaseDAO[MediaModel]):
+    UPLOADS = "media_uploads"
+
     def __init__(self, excludes=[], nesting_degree: str = BaseDAO.NO_NESTED_CHILD):
         self.model = MediaModel
         self.primary_key = "media_id"
@@ -39,10 +47,14 @@ class MediaDAO(BaseDAO[MediaModel]):
 
     @override
     async def get_all(
-        self, db_session: AsyncSession, offset=0, limit=100
+        self,
+        db_session: AsyncSession,
+        offset=0,
+        limit=100,
+        pagination: Pagination = None,
     ) -> DAOResponse[List[MediaResponse]]:
         result = await super().get_all(
-            db_session=db_session, offset=offset, limit=limit
+            db_session=db_session, offset=offset, limit=limit, pagination=pagination
         )
 
         return DAOResponse[List[MediaResponse]](
@@ -64,7 +76,46 @@ class MediaDAO(BaseDAO[MediaModel]):
             media_info = self.extract_model_data(obj_in, MediaCreateSchema)
 
             # process media information
-            media_info = await self.upload_and_process_media(media_info, media_store)
+            media_info = await self.upload_and_process_media(
+                db_session, media_info, media_store
+            )
+
+            # create new media
+            new_media: Media = await super().create(
+                db_session=db_session, obj_in=media_info
+            )
+
+            return DAOResponse[MediaResponse](
+                success=True, data=MediaResponse.from_orm_model(new_media)
+            )
+        except Exception as e:
+            await db_session.rollback()
+            return DAOResponse(success=False, error=f"{str(e)}")
+
+    async def create_from_upload(
+        self,
+        db_session: AsyncSession,
+        obj_in: MediaUploadSchema,
+        upload: SpooledUpload,
+        media_store: str = None,
+    ) -> DAOResponse[MediaResponse]:
+        try:
+            # specify calling class
+            media_store = self.model.__name__ if media_store is None else media_store
+
+            uploader_service = MediaUploaderService(
+                file_name=obj_in.media_name,
+                media_type=media_store.lower(),
+                file_path=upload.path,
+                content_type=upload.content_type,
+            )
+            uploader_service.content_hash = upload.content_hash
+
+            media_info = obj_in.model_dump()
+            media_info.update(await self.store_media(db_session, uploader_service))
+            media_info["media_type"] = (
+                media_info["media_type"] or uploader_service.get_image_type()
+            )
 
             # create new media
             new_media: Media = await super().create(
@@ -77,6 +128,8 @@ class MediaDAO(BaseDAO[MediaModel]):
         except Exception as e:
             await db_session.rollback()
             return DAOResponse(success=False, error=f"{str(e)}")
+        finally:
+            upload.discard()
 
     @override
     async def update(
@@ -98,9 +151,14 @@ class MediaDAO(BaseDAO[MediaModel]):
 
             if "content_url" in media_info:
                 media_info = await self.upload_and_process_media(
-                    media_info, media_store
+                    db_session, media_info, media_store
                 )
 
+                # not part of the update schema, kept when the content is
+                if media_info["content_url"] != db_obj.content_url:
+                    db_obj.content_hash = media_info["content_hash"]
+                    db_obj.variants = media_info["variants"]
+
             # update media info
             existing_media: Media = await super().update(
                 db_session=db_session, db_obj=db_obj, obj_in=MediaBase(**media_info)
@@ -115,8 +173,49 @@ class MediaDAO(BaseDAO[MediaModel]):
             await db_session.rollback()
             return DAOResponse[MediaResponse](success=False, error=f"{str(e)}")
 
+    async def store_media(
+        self, db_session: AsyncSession, uploader_service: MediaUploaderService
+    ) -> Dict[str, Any]:
+        """
+        Stores the media content and its resized copies.
+
+        The content is hashed first, bytes that are already stored are linked
+        instead of being uploaded again. Returns the hash, url and variants
+        columns of the media.
+        """
+        content_hash = await uploader_service.digest_async()
+
+        stored_media: Optional[MediaModel] = (
+            await self.load(db_session, content_hash, column="content_hash")
+            if content_hash
+            else None
+        )
+        if stored_media:
+            return {
+                "content_hash": content_hash,
+                "content_url": stored_media.content_url,
+                "variants": stored_media.variants,
+            }
+
+        # rendered before the original is stored, storing may move a spooled file
+        derivatives = await uploader_service.render_derivatives_async()
+
+        upload_response = await uploader_service.upload_async()
+
+        if not upload_response.success:
+            raise Exception(str(upload_response.error))
+
+        # only once the original is stored, a failed upload leaves no orphans
+        variants = await uploader_service.store_derivatives_async(derivatives)
+
+        return {
+            "content_hash": content_hash,
+            "content_url": upload_response.data["content_url"],
+            "variants": variants or None,
+        }
+
     async def upload_and_process_media(
-        self, media_info: Dict[str, Any], media_store: str
+        self, db_session: AsyncSession, media_info: Dict[str, Any], media_store: str
     ) -> Dict[str, Any]:
         base64_data = media_info.get("content_url")
 
@@ -126,12 +225,14 @@ class MediaDAO(BaseDAO[MediaModel]):
             media_type=media_store.lower(),
         )
 
-        upload_response = uploader_service.upload()
-
-        if not upload_response.success:
-            raise Exception(str(upload_response.error))
+        # one upload per distinct content in a session, later callers await it
+        uploads: Dict[str, asyncio.Task] = db_session.info.setdefault(self.UPLOADS, {})
+        if base64_data not in uploads:
+            uploads[base64_data] = asyncio.ensure_future(
+                self.store_media(db_session, uploader_service)
+            )
 
-        media_info["content_url"] = upload_response.data["content_url"]
+        media_info.update(await uploads[base64_data])
 
         media_type = uploader_service.get_image_type()
         user_provided_media_type = media_info.get("media_type")
@@ -156,6 +257,17 @@ class MediaDAO(BaseDAO[MediaModel]):
             entity_model_name = entity_model if entity_model else self.model.__name__
             media_info = media_info if isinstance(media_info, list) else [media_info]
 
+            # upload every item at once, the rows are then written one by one. The
+            # uploads only reach the session through the media loader, see DataLoader
+            await asyncio.gather(
+                *[
+                    self.upload_and_process_media(
+                        db_session, media_item.model_dump(), entity_model_name
+                    )
+                    for media_item in media_info
+                ]
+            )
+
             for media_item in media_info:
                 media_item: Union[MediaBase | Media] = media_item
                 # Check if the entity already exists
@@ -168,6 +280,8 @@ class MediaDAO(BaseDAO[MediaModel]):
                                 "is_thumbnail",
                                 "caption",
                                 "description",
+                                "variants",
+                                "thumbnail_url",
                             ]
                         )
                     },
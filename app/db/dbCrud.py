@@ -1,18 +1,69 @@
+import time
 from typing import List, Type, TypeVar, Generic, Dict, Any, Union, Optional
 from uuid import UUID
 from asyncpg import ForeignKeyViolationError
-from sqlalchemy import and_, func
+from sqlalchemy import BigInteger, and_, cast, column, func, insert, table
 from sqlalchemy.future import select
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import inspect
-from sqlalchemy.orm import selectinload
 
 from app.db.dbExceptions import IntegrityError
+from app.db.dbLoader import DataLoader
+from app.db.dbLoadPlan import LoadPlan
+from app.db.dbUnitOfWork import UnitOfWork
+from app.utils.settings import settings
+from app.db.dbPagination import CountStrategy, Pagination
+from app.db.dbProjection import Projection
 
 DBModelType = TypeVar("DBModelType")
 
 
 class UtilsMixin:
+    model: Type[DBModelType]
+    load_parent_relationships: bool
+
+    # relationship paths loaded per named plan, see LoadPlan
+    load_plans: Dict[str, List[str]] = {}
+
+    # relationship paths ?fields= and ?expand= may reach, see Projection
+    expandable: Optional[List[str]] = None
+
+    def load_options(self, load_plan: Optional[str]) -> List[Any]:
+        """
+        Builds the loader options for a named plan.
+
+        No plan loads nothing. DAOs without a plan of that name load their
+        direct relationships when they are configured to nest them, and
+        nothing otherwise.
+        """
+        if load_plan is None:
+            paths = []
+        elif load_plan in self.load_plans:
+            paths = self.load_plans[load_plan]
+        elif self.load_parent_relationships:
+            paths = [rel.key for rel in inspect(self.model).relationships]
+        else:
+            paths = []
+
+        return LoadPlan.options(self.model, paths, strict=settings.DB_STRICT_LOADING)
+
+    def expandable_paths(self) -> List[str]:
+        """
+        Relationship paths a client-chosen projection may reach.
+
+        Unless the DAO names them, a projection reaches what the DAO's list
+        plan loads and nothing further.
+        """
+        if self.expandable is not None:
+            return self.expandable
+
+        return self.load_plans.get(LoadPlan.LIST, [])
+
+    def refresh_options(self, obj: DBModelType) -> List[Any]:
+        # reload what the detail responses walk, not just the columns
+        return self.load_options(LoadPlan.DETAIL) if isinstance(obj, self.model) else []
+
     def is_valid_uuid(uuid_to_test, version=4):
         try:
             uuid_obj = UUID(uuid_to_test, version=version)
@@ -21,10 +72,38 @@ class UtilsMixin:
 
         return uuid_obj
 
+    async def commit(self, db_session: AsyncSession):
+        # inside a unit of work the outermost caller commits
+        if UnitOfWork.is_active(db_session):
+            await db_session.flush()
+        else:
+            await db_session.commit()
+
+    async def commit_or_defer(self, db_session: AsyncSession, obj: DBModelType):
+        # intermediate writes only flush, the next commit_and_refresh reloads them
+        if not UnitOfWork.is_active(db_session):
+            return await self.commit_and_refresh(db_session=db_session, obj=obj)
+
+        try:
+            await db_session.flush()
+            UnitOfWork.defer_refresh(db_session, obj, self.refresh_options(obj))
+            return obj
+
+        except Exception as e:
+            await db_session.rollback()
+            raise Exception(f"Error committing data: {str(e)}")
+
     async def commit_and_refresh(self, db_session: AsyncSession, obj: DBModelType):
         try:
+            if UnitOfWork.is_active(db_session):
+                UnitOfWork.defer_refresh(db_session, obj, self.refresh_options(obj))
+                await UnitOfWork.refresh_pending(db_session)
+                return obj
+
             await db_session.commit()
-            await db_session.refresh(obj)
+            await UnitOfWork.refresh(
+                db_session, type(obj), [obj], self.refresh_options(obj)
+            )
             return obj
 
         except IntegrityError as e:
@@ -46,19 +125,148 @@ class CreateMixin(UtilsMixin):
         db_session.add(db_obj)
 
         try:
-            return await self.commit_and_refresh(db_session=db_session, obj=db_obj)
+            return await self.commit_or_defer(db_session=db_session, obj=db_obj)
 
         except Exception as e:
             await db_session.rollback()
             raise Exception(f"{str(e)}")
 
+    async def create_many(
+        self, db_session: AsyncSession, objs_in: List[Dict[str, Any]]
+    ) -> List[Any]:
+        """
+        Inserts all rows with a single multi-row INSERT and commits once.
+
+        Returns the primary keys of the new rows, in the order they were given.
+        """
+        if not objs_in:
+            return []
+
+        mapper = inspect(self.model)
+
+        if mapper.local_table is mapper.persist_selectable:
+            query = insert(self.model).returning(
+                *mapper.primary_key, sort_by_parameter_order=True
+            )
+
+            return await self.execute_many(
+                db_session=db_session, query=query, rows=objs_in
+            )
+
+        # RETURNING can't span the tables of a joined-inheritance model, so the
+        # keys are generated up front from the primary key column defaults
+        rows = []
+        for obj_in in objs_in:
+            row = dict(obj_in)
+            for key in mapper.primary_key:
+                if row.get(key.key) is None:
+                    if key.default is None or not key.default.is_callable:
+                        raise NotImplementedError(
+                            f"Cannot generate {key.key} for {self.model.__name__}"
+                        )
+                    row[key.key] = key.default.arg(None)
+            rows.append(row)
+
+        await self.execute_many(
+            db_session=db_session, query=insert(self.model), rows=rows, returning=False
+        )
+
+        return [
+            self.row_key([row[key.key] for key in mapper.primary_key]) for row in rows
+        ]
+
+    async def upsert_many(
+        self,
+        db_session: AsyncSession,
+        objs_in: List[Dict[str, Any]],
+        index_elements: List[str] = None,
+        update_fields: List[str] = None,
+    ) -> List[Any]:
+        """
+        Inserts all rows with a single INSERT .. ON CONFLICT DO UPDATE and commits once.
+
+        Rows clashing with an existing row on `index_elements` (the primary key
+        unless given) get `update_fields` overwritten (every other column that
+        was passed in unless given). Returns the primary keys of all rows, in the
+        order they were given.
+        """
+        if not objs_in:
+            return []
+
+        dialect = db_session.get_bind().dialect.name
+        dialect_inserts = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+
+        if dialect not in dialect_inserts:
+            raise NotImplementedError(f"Upserts are not supported on {dialect}")
+
+        mapper = inspect(self.model)
+        table_columns = mapper.local_table.c
+
+        if mapper.local_table is not mapper.persist_selectable:
+            raise NotImplementedError(
+                f"Upserts are not supported on inherited model {self.model.__name__}"
+            )
+
+        index_elements = index_elements or [key.name for key in mapper.primary_key]
+        update_fields = update_fields or [
+            key
+            for key in objs_in[0].keys()
+            if key in table_columns and key not in index_elements + ["created_at"]
+        ]
+
+        if "updated_at" in table_columns and "updated_at" not in update_fields:
+            update_fields.append("updated_at")
+
+        query = dialect_inserts[dialect](self.model)
+
+        # a no-op update still returns the row, DO NOTHING would drop it from RETURNING
+        set_ = {
+            field: query.excluded[field] for field in update_fields or index_elements
+        }
+        query = query.on_conflict_do_update(
+            index_elements=index_elements, set_=set_
+        ).returning(*mapper.primary_key, sort_by_parameter_order=True)
+
+        return await self.execute_many(db_session=db_session, query=query, rows=objs_in)
+
+    async def execute_many(
+        self,
+        db_session: AsyncSession,
+        query,
+        rows: List[Dict[str, Any]],
+        returning: bool = True,
+    ) -> List[Any]:
+        try:
+            executed_query = await db_session.execute(query, rows)
+            keys = [self.row_key(row) for row in executed_query] if returning else []
+            await self.commit(db_session)
+
+            return keys
+
+        except Exception as e:
+            await db_session.rollback()
+            raise Exception(f"Error committing data: {str(e)}")
+
+    @staticmethod
+    def row_key(values) -> Any:
+        return values[0] if len(values) == 1 else tuple(values)
+
 
 class ReadMixin(UtilsMixin):
     model: Type[DBModelType]
     load_parent_relationships: bool
 
+    # seconds a cached count is served for when estimating without statistics
+    COUNT_CACHE_TTL = 60
+    _count_cache: Dict[str, tuple] = {}
+
     async def get(
-        self, db_session: AsyncSession, id: Union[UUID | Any | int], skip=0, limit=100
+        self,
+        db_session: AsyncSession,
+        id: Union[UUID | Any | int],
+        skip=0,
+        limit=100,
+        load_plan: Optional[str] = None,
     ) -> DBModelType:
         # check if uuid
         gen_primary_id = UtilsMixin.is_valid_uuid(id)
@@ -67,14 +275,7 @@ class ReadMixin(UtilsMixin):
         # primary_keys = [(key.name, key) for key in inspect(self.model).primary_key]
         # primary_key = primary_keys[0]
         primary_key = self.primary_key
-
-        mapper = inspect(self.model)
-        relationships = [relationship.key for relationship in mapper.relationships]
-        query_options = (
-            [selectinload(getattr(self.model, attr)) for attr in relationships]
-            if self.load_parent_relationships
-            else []
-        )
+        query_options = self.load_options(load_plan)
 
         # find model object based on primary key
         filter = {f"{primary_key}": gen_primary_id}
@@ -93,23 +294,94 @@ class ReadMixin(UtilsMixin):
         return result
 
     async def get_all(
-        self, db_session: AsyncSession, offset=0, limit=100
+        self,
+        db_session: AsyncSession,
+        offset=0,
+        limit=100,
+        pagination: Pagination = None,
+        load_plan: str = LoadPlan.LIST,
     ) -> list[DBModelType]:
-        # dynamically access the relationship attribute using getattr
-        mapper = inspect(self.model)
-        relationships = [relationship.key for relationship in mapper.relationships]
-        query_options = (
-            [selectinload(getattr(self.model, attr)) for attr in relationships]
-            if self.load_parent_relationships
-            else []
-        )
+        # offset paging unless the caller passed a cursor
+        pagination = pagination or Pagination(limit=limit, offset=offset)
+        query_options = self.load_options(load_plan)
 
-        query = select(self.model).options(*query_options).offset(offset).limit(limit)
+        query = pagination.apply(select(self.model).options(*query_options), self.model)
         executed_query = await db_session.execute(query)
-        result = executed_query.scalars().all()
+        result = pagination.paginate(executed_query.scalars().all(), self.model)
 
         return result
 
+    def loader(
+        self,
+        db_session: AsyncSession,
+        column: Optional[str] = None,
+        load_plan: Optional[str] = None,
+    ) -> DataLoader:
+        column = column or self.primary_key
+
+        return DataLoader.for_session(
+            db_session, self.model, column, load_plan, self.load_options(load_plan)
+        )
+
+    async def load(
+        self,
+        db_session: AsyncSession,
+        key: Any,
+        column: Optional[str] = None,
+        load_plan: Optional[str] = None,
+    ) -> Optional[DBModelType]:
+        """
+        Looks a row up by a unique column through the request's batching loader.
+        """
+        return await self.loader(db_session, column, load_plan).load(key)
+
+    async def get_many(
+        self,
+        db_session: AsyncSession,
+        keys: List[Any],
+        column: Optional[str] = None,
+        load_plan: Optional[str] = None,
+    ) -> List[Optional[DBModelType]]:
+        """
+        Looks rows up by a unique column in one query, None for missing keys.
+        """
+        return await self.loader(db_session, column, load_plan).load_many(keys)
+
+    async def get_projected(
+        self,
+        db_session: AsyncSession,
+        id: Union[UUID | Any | int],
+        projection: Projection,
+    ) -> DBModelType:
+        """
+        Loads one row with only the projected columns and relationships.
+        """
+        primary_key = getattr(self.model, self.primary_key)
+        query = (
+            select(self.model)
+            .filter(primary_key == UtilsMixin.is_valid_uuid(id))
+            .options(*projection.options())
+        )
+
+        executed_query = await db_session.execute(query)
+        return executed_query.scalar_one_or_none()
+
+    async def get_all_projected(
+        self,
+        db_session: AsyncSession,
+        projection: Projection,
+        pagination: Pagination,
+    ) -> list[DBModelType]:
+        """
+        Loads a page of rows with only the projected columns and relationships.
+        """
+        query = pagination.apply(
+            select(self.model).options(*projection.options()), self.model
+        )
+
+        executed_query = await db_session.execute(query)
+        return pagination.paginate(executed_query.scalars().all(), self.model)
+
     async def query_on_joins(
         self,
         db_session: AsyncSession,
@@ -120,6 +392,7 @@ class ReadMixin(UtilsMixin):
         join_conditions: Optional[List] = None,
         skip=0,
         limit=100,
+        load_plan: str = LoadPlan.LIST,
     ) -> list[DBModelType]:
         # separate main model filters and joined table filters
         main_model_conditions = []
@@ -153,9 +426,8 @@ class ReadMixin(UtilsMixin):
             if join_model:
                 query = query.filter(getattr(join_model, column_name) == value)
 
-        # check if options
-        if options:
-            query = query.options(*options)
+        # explicit options are applied on top of the load plan
+        query = query.options(*self.load_options(load_plan), *(options or []))
 
         # check if order by
         if order_by:
@@ -176,13 +448,13 @@ class ReadMixin(UtilsMixin):
         single=False,
         options=None,
         order_by=None,
+        load_plan: Optional[str] = None,
     ) -> Union[List[DBModelType], None]:
         conditions = [getattr(self.model, k) == v for k, v in filters.items()]
         query = select(self.model).filter(and_(*conditions))
 
-        # check if options
-        if options:
-            query = query.options(*options)
+        # explicit options are applied on top of the load plan
+        query = query.options(*self.load_options(load_plan), *(options or []))
 
         # check if order by
         if order_by:
@@ -193,7 +465,15 @@ class ReadMixin(UtilsMixin):
 
         return query_result.scalar_one_or_none() if single else scalar_result
 
-    async def query_count(self, db_session: AsyncSession):
+    async def query_count(
+        self, db_session: AsyncSession, strategy: CountStrategy = CountStrategy.exact
+    ) -> Optional[int]:
+        if strategy == CountStrategy.none:
+            return None
+
+        if strategy == CountStrategy.estimated:
+            return await self.query_estimated_count(db_session)
+
         executed_query = await db_session.execute(
             select(func.count()).select_from(self.model)
         )
@@ -201,6 +481,58 @@ class ReadMixin(UtilsMixin):
 
         return count
 
+    async def query_estimated_count(self, db_session: AsyncSession) -> int:
+        """
+        Estimates the row count from planner statistics on Postgres and MySQL,
+        and serves a TTL-cached exact count everywhere else.
+        """
+        dialect = db_session.get_bind().dialect.name
+        table_name = inspect(self.model).local_table.name
+        estimate = None
+
+        # catalog lookups are plain selects so they stay on the read replica
+        if dialect == "postgresql":
+            pg_class = table("pg_class", column("oid"), column("reltuples"))
+            executed_query = await db_session.execute(
+                select(cast(pg_class.c.reltuples, BigInteger)).where(
+                    pg_class.c.oid == func.to_regclass(table_name)
+                )
+            )
+            estimate = executed_query.scalar()
+        elif dialect == "mysql":
+            tables = table(
+                "tables",
+                column("table_rows"),
+                column("table_schema"),
+                column("table_name"),
+                schema="information_schema",
+            )
+            executed_query = await db_session.execute(
+                select(tables.c.table_rows).where(
+                    tables.c.table_schema == func.database(),
+                    tables.c.table_name == table_name,
+                )
+            )
+            estimate = executed_query.scalar()
+
+        # tables that were never analyzed report -1 (or nothing at all)
+        if estimate is not None and estimate >= 0:
+            return int(estimate)
+
+        cache_key = f"{dialect}:{table_name}"
+        cached = ReadMixin._count_cache.get(cache_key)
+
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+
+        count = await self.query_count(db_session)
+        ReadMixin._count_cache[cache_key] = (
+            time.monotonic() + self.COUNT_CACHE_TTL,
+            count,
+        )
+
+        return count
+
     async def query_on_create(
         self,
         db_session: AsyncSession,
@@ -208,9 +540,14 @@ class ReadMixin(UtilsMixin):
         single=False,
         options=None,
         create_if_not_exist=False,
+        load_plan: Optional[str] = None,
     ):
         result = await self.query(
-            db_session=db_session, filters=filters, single=single, options=options
+            db_session=db_session,
+            filters=filters,
+            single=single,
+            options=options,
+            load_plan=load_plan,
         )
 
         if result:
@@ -219,7 +556,7 @@ class ReadMixin(UtilsMixin):
             db_obj = self.model(**filters)
             db_session.add(db_obj)
 
-            return await self.commit_and_refresh(db_session=db_session, obj=db_obj)
+            return await self.commit_or_defer(db_session=db_session, obj=db_obj)
 
 
 class UpdateMixin(UtilsMixin):
@@ -234,7 +571,7 @@ class UpdateMixin(UtilsMixin):
 
         db_session.add(db_obj)
 
-        return await self.commit_and_refresh(db_session=db_session, obj=db_obj)
+        return await self.commit_or_defer(db_session=db_session, obj=db_obj)
 
 
 class DeleteMixin(UtilsMixin):
@@ -244,7 +581,7 @@ class DeleteMixin(UtilsMixin):
         self, db_session: AsyncSession, db_obj: DBModelType
     ) -> DBModelType:
         await db_session.delete(db_obj)
-        await db_session.commit()
+        await self.commit(db_session)
 
 
 class DBOperations(CreateMixin, ReadMixin, UpdateMixin, DeleteMixin):
@@ -0,0 +1,57 @@
+from typing import Any, Dict, List
+
+from sqlalchemy import inspect
+from sqlalchemy.orm import raiseload, selectinload
+
+
+class LoadPlan:
+    """
+    Named set of relationships a query loads up front.
+
+    Models don't eagerly load anything on their own, so each DAO declares the
+    relationship paths its responses walk (e.g. "owned_properties.addresses.city")
+    per plan, and each route picks the plan it needs. In strict mode anything
+    outside the plan raises instead of silently issuing another SELECT.
+    """
+
+    LIST = "list"
+    DETAIL = "detail"
+    AUTH = "auth"
+
+    @classmethod
+    def build_tree(cls, paths: List[str]) -> Dict[str, Dict]:
+        tree: Dict[str, Dict] = {}
+
+        for path in paths:
+            node = tree
+            for key in path.split("."):
+                node = node.setdefault(key, {})
+
+        return tree
+
+    @classmethod
+    def options(cls, model, paths: List[str], strict: bool = False) -> List[Any]:
+        """
+        Turns relationship paths into selectinload options, one chain per path.
+        """
+        options = [raiseload("*", sql_only=True)] if strict else []
+
+        def walk(entity, tree: Dict[str, Dict], loader=None):
+            for key, children in tree.items():
+                attribute = getattr(entity, key)
+                chain = (
+                    loader.selectinload(attribute)
+                    if loader is not None
+                    else selectinload(attribute)
+                )
+                options.append(chain)
+
+                target = inspect(entity).relationships[key].mapper.class_
+                if strict:
+                    options.append(chain.raiseload("*", sql_only=True))
+
+                walk(target, children, chain)
+
+        walk(model, cls.build_tree(paths))
+
+        return options
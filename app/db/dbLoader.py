@@ -0,0 +1,135 @@
+import asyncio
+from typing import Any, Dict, Iterable, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.future import select
+from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+class DataLoader:
+    """
+    Request-scoped batching loader for rows looked up by a unique key column.
+
+    Loaders live in the session's info, one per (model, key column, load plan),
+    so every DAO working on the same request session shares them. Keys asked
+    for in the same event loop tick are fetched with a single
+    `WHERE key IN (...)` query and the rows, or the miss, are remembered until
+    the session next flushes or rolls back.
+
+    An AsyncSession can't run statements concurrently. Loaders take turns on
+    it with a lock, but nothing else does: while coroutines sharing a session
+    run under asyncio.gather, the loaders must be the only thing querying or
+    writing through that session until the gather returns.
+
+    Usage:
+        users = await asyncio.gather(
+            user_dao.load(db_session, client_id),
+            user_dao.load(db_session, employee_id),
+        )
+    """
+
+    LOADERS = "data_loaders"
+    LOCK = "data_loaders_lock"
+
+    def __init__(
+        self, db_session: AsyncSession, model, column: str, options: List[Any]
+    ):
+        self.db_session = db_session
+        self.model = model
+        self.column = getattr(model, column)
+        self.options = options
+
+        self.cache: Dict[Any, Any] = {}
+        self.queue: Dict[Any, asyncio.Future] = {}
+        self.task: Optional[asyncio.Task] = None
+
+    @classmethod
+    def for_session(
+        cls,
+        db_session: AsyncSession,
+        model,
+        column: str,
+        load_plan: Optional[str] = None,
+        options: Optional[List[Any]] = None,
+    ) -> "DataLoader":
+        loaders = db_session.info.setdefault(cls.LOADERS, {})
+        key = (model, column, load_plan)
+
+        if key not in loaders:
+            loaders[key] = cls(db_session, model, column, options or [])
+
+        return loaders[key]
+
+    def coerce(self, key: Any) -> Any:
+        # "0d53..." and UUID("0d53...") are the same row
+        try:
+            python_type = self.column.type.python_type
+            return key if isinstance(key, python_type) else python_type(key)
+        except (NotImplementedError, TypeError, ValueError):
+            return key
+
+    async def load(self, key: Any) -> Any:
+        key = self.coerce(key)
+
+        if key in self.cache:
+            return self.cache[key]
+
+        if key not in self.queue:
+            loop = asyncio.get_running_loop()
+
+            # the first key of a tick schedules the batch for the rest
+            if not self.queue:
+                loop.call_soon(self.schedule)
+
+            self.queue[key] = loop.create_future()
+
+        return await self.queue[key]
+
+    async def load_many(self, keys: Iterable[Any]) -> List[Any]:
+        return list(await asyncio.gather(*[self.load(key) for key in keys]))
+
+    def schedule(self):
+        self.task = asyncio.ensure_future(self.dispatch())
+
+    async def dispatch(self):
+        queue, self.queue = self.queue, {}
+
+        try:
+            rows = await self.fetch(list(queue))
+        except Exception as e:
+            for future in queue.values():
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for key, future in queue.items():
+            if not future.done():
+                future.set_result(rows.get(key))
+
+    async def fetch(self, keys: List[Any]) -> Dict[Any, Any]:
+        # a session runs one statement at a time, loaders take turns on it
+        lock = self.db_session.info.setdefault(self.LOCK, asyncio.Lock())
+
+        async with lock:
+            query = select(self.model).where(self.column.in_(keys))
+            query = query.options(*self.options)
+
+            executed_query = await self.db_session.execute(query)
+
+            rows = {
+                getattr(row, self.column.key): row for row in executed_query.scalars()
+            }
+
+        for key in keys:
+            self.cache[key] = rows.get(key)
+
+        return rows
+
+
+@event.listens_for(Session, "after_flush")
+@event.listens_for(Session, "after_soft_rollback")
+def clear_loader_caches(session: Session, *args):
+    # writes can add, change the key of or remove remembered rows
+    for loader in session.info.get(DataLoader.LOADERS, {}).values():
+        loader.cache.clear()
@@ -26,6 +26,7 @@ class DBManager:
             "user": settings.DB_USER,
             "pswd": settings.DB_PASSWORD,
             "host": settings.DB_HOST,
+            "read_host": settings.DB_READ_HOST,
             "port": settings.DB_PORT,
             "db": settings.DB_DATABASE,
             "engine": settings.DB_ENGINE,
@@ -14,6 +14,8 @@ from urllib.parse import quote
 import app.db.dbExceptions as DBExceptions
 from app.utils.settings import settings
 from app.db.dbDeclarative import Base
+from app.db.dbSession import RoutingSession
+from app.db.dbUnitOfWork import UnitOfWork
 
 
 class DBModule:
@@ -38,19 +40,39 @@ class DBModule:
             class_=AsyncSession,
         )
 
+        # create read session, routed to the replica until it writes
+        self.ReadSession: AsyncSession = async_sessionmaker(
+            autocommit=False,
+            expire_on_commit=False,
+            autoflush=True,
+            class_=AsyncSession,
+            sync_session_class=RoutingSession,
+            write_bind=self.engine["write"].sync_engine,
+            read_bind=self.engine["read"].sync_engine,
+        )
+
     @classmethod
     def get_declarative_base(self):
         return self._base
 
     async def get_db(self) -> AsyncIterator[AsyncSession]:
+        # one transaction per request, committed once the handler returns
         async with self.Session() as session:
+            async with UnitOfWork(session):
+                yield session
+
+    async def get_read_db(self) -> AsyncIterator[AsyncSession]:
+        async with self.ReadSession() as session:
             yield session
 
     def get_engine(self):
         return self.engine
 
-    def dispose(self):
-        self.engine["write"].dispose()
+    async def dispose(self):
+        await self.engine["write"].dispose()
+
+        if self.engine["read"] is not self.engine["write"]:
+            await self.engine["read"].dispose()
 
     async def check_models_generated(self):
         if not self._models_generated:
@@ -70,9 +92,13 @@ class DBModule:
         user = credentials.get("user")
         pswd = credentials.get("pswd", "")
         host = credentials.get("host")
+        read_host = credentials.get("read_host") or host
         port = credentials.get("port", 3306)
         db = credentials.get("db")
         conn_string = f"postgresql+asyncpg://{user}:{quote(pswd)}@{host}:{port}/{db}"
+        read_conn_string = (
+            f"postgresql+asyncpg://{user}:{quote(pswd)}@{read_host}:{port}/{db}"
+        )
 
         # create database if it doesn't exist
         cls.create_postgres_database_if_not_exist(conn_string)
@@ -84,14 +110,14 @@ class DBModule:
 
         return {
             "write": create_async_engine(conn_string, future=True, echo=False),
-            "read": create_async_engine(conn_string, future=True, echo=False),
+            "read": create_async_engine(read_conn_string, future=True, echo=False),
         }
 
     def setup_mysql(cls, credentials: dict):
         user = credentials.get("user")
         pswd = credentials.get("pswd", "")
         host = credentials.get("host")
-        read_host = credentials.get("read_host", host)
+        read_host = credentials.get("read_host") or host
         port = credentials.get("port", 3306)
         db = credentials.get("db")
 
@@ -114,24 +140,22 @@ class DBModule:
         }
 
     def setup_memory(cls, credentials=":memory:"):
-        return {
-            "write": create_async_engine(
-                f"sqlite+pysqlite:///{credentials}", future=True, echo=True
-            ),
-            "read": create_async_engine(
-                f"sqlite+pysqlite:///{credentials}", future=True, echo=True
-            ),
-        }
+        # an in-memory database only exists within its own engine, so reads
+        # and writes have to share it
+        engine = create_async_engine(
+            f"sqlite+pysqlite:///{credentials}", future=True, echo=True
+        )
+
+        return {"write": engine, "read": engine}
 
     def setup_sqlite(self, credentials=None, db_path="app.db"):
-        return {
-            "write": create_async_engine(
-                f"sqlite+aiosqlite:///{db_path}", echo=False, future=True
-            ),
-            "read": create_async_engine(
-                f"sqlite+aiosqlite:///{db_path}", echo=False, future=True
-            ),
-        }
+        # sqlite has no replica, a second pool on the same file only adds
+        # lock contention between the reader and the writer
+        engine = create_async_engine(
+            f"sqlite+aiosqlite:///{db_path}", echo=False, future=True
+        )
+
+        return {"write": engine, "read": engine}
 
     def create_postgres_database_if_not_exist(
         cls,
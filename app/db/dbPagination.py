@@ -0,0 +1,175 @@
+import json
+import base64
+from enum import Enum
+from datetime import datetime
+from typing import Any, List, Optional, Sequence
+
+from sqlalchemy import inspect, tuple_
+
+
+class InvalidCursorException(ValueError):
+    def __init__(self, msg="Invalid pagination cursor"):
+        self.msg = msg
+        super().__init__(self.msg)
+
+    def __str__(self):
+        return self.msg
+
+
+class CountStrategy(str, Enum):
+    """
+    How a list endpoint computes its total.
+
+    Attributes:
+        exact (str): SELECT count(*) over the whole table.
+        estimated (str): Planner statistics where available, a cached exact count otherwise.
+        none (str): No total, only whether another page exists.
+    """
+
+    exact = "exact"
+    estimated = "estimated"
+    none = "none"
+
+
+class Pagination:
+    """
+    Paging parameters for a list query.
+
+    Rows are ordered by (created_at, primary key), or by the given columns,
+    oldest first unless `descending`. With a cursor the page is fetched with a
+    keyset seek on that key instead of an OFFSET scan, and once the query ran
+    the next/previous cursors are filled in for the caller.
+    """
+
+    NEXT = "next"
+    PREVIOUS = "prev"
+
+    def __init__(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        cursor: str = None,
+        order_by: Optional[List[Any]] = None,
+        descending: bool = False,
+    ):
+        self.limit = limit
+        self.offset = offset
+        self.order_by = order_by
+        self.descending = descending
+        self.direction, self.key = (
+            self.decode_cursor(cursor) if cursor else (self.NEXT, None)
+        )
+
+        # filled in by the query
+        self.next_cursor: Optional[str] = None
+        self.previous_cursor: Optional[str] = None
+        self.has_more: Optional[bool] = None
+
+    @property
+    def is_keyset(self) -> bool:
+        return self.key is not None
+
+    @staticmethod
+    def key_columns(model) -> List[Any]:
+        mapper = inspect(model)
+        created_at = (
+            [mapper.columns["created_at"]] if "created_at" in mapper.columns else []
+        )
+
+        return created_at + list(mapper.primary_key)
+
+    def columns(self, model) -> List[Any]:
+        return self.order_by or self.key_columns(model)
+
+    @classmethod
+    def encode_cursor(cls, direction: str, columns: List[Any], row) -> str:
+        values = [
+            value.isoformat() if isinstance(value, datetime) else str(value)
+            for value in (getattr(row, col.key) for col in columns)
+        ]
+        payload = json.dumps([direction, values], separators=(",", ":"))
+
+        cursor = base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii")
+
+        # padding is dropped so the cursor can be used as-is in a query string
+        return cursor.rstrip("=")
+
+    @classmethod
+    def decode_cursor(cls, cursor: str):
+        try:
+            padding = "=" * (-len(cursor) % 4)
+            payload = base64.urlsafe_b64decode((cursor + padding).encode("ascii"))
+            direction, values = json.loads(payload)
+        except Exception:
+            raise InvalidCursorException()
+
+        if direction not in (cls.NEXT, cls.PREVIOUS) or not isinstance(values, list):
+            raise InvalidCursorException()
+
+        return direction, values
+
+    def parse_key(self, model) -> tuple:
+        columns = self.columns(model)
+
+        if len(columns) != len(self.key):
+            raise InvalidCursorException()
+
+        try:
+            return tuple(
+                (
+                    datetime.fromisoformat(value)
+                    if col.type.python_type is datetime
+                    else col.type.python_type(value)
+                )
+                for col, value in zip(columns, self.key)
+            )
+        except (ValueError, TypeError, NotImplementedError):
+            raise InvalidCursorException()
+
+    def apply(self, query, model):
+        """
+        Adds ordering and either the keyset seek or the offset to a select.
+        """
+        columns = self.columns(model)
+        descending = [c.desc() for c in columns]
+
+        if not self.is_keyset:
+            return (
+                query.order_by(*(descending if self.descending else columns))
+                .offset(self.offset)
+                .limit(self.limit + 1)
+            )
+
+        key = tuple_(*columns)
+        value = self.parse_key(model)
+
+        # a previous page of a newest-first listing seeks upwards
+        if (self.direction == self.NEXT) != self.descending:
+            query = query.filter(key > value).order_by(*columns)
+        else:
+            query = query.filter(key < value).order_by(*descending)
+
+        return query.limit(self.limit + 1)
+
+    def paginate(self, rows: Sequence[Any], model) -> List[Any]:
+        """
+        Trims the extra look-ahead row and fills in the page cursors.
+        """
+        rows = list(rows)
+        self.has_more = len(rows) > self.limit
+        rows = rows[: self.limit]
+
+        if self.direction == self.PREVIOUS:
+            rows.reverse()
+            has_next, has_previous = True, self.has_more
+        else:
+            has_next = self.has_more
+            has_previous = self.is_keyset or self.offset > 0
+
+        columns = self.columns(model)
+        if rows and has_next:
+            self.next_cursor = self.encode_cursor(self.NEXT, columns, rows[-1])
+        if rows and has_previous:
+            self.previous_cursor = self.encode_cursor(self.PREVIOUS, columns, rows[0])
+
+        return rows
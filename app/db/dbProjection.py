@@ -0,0 +1,231 @@
+from typing import Any, Dict, List, Optional
+
+from pydantic import ConfigDict, create_model
+from sqlalchemy import Column, inspect
+from sqlalchemy.orm import load_only, selectinload
+
+from app.db.dbLoadPlan import LoadPlan
+from app.db.dbPagination import Pagination
+
+
+class InvalidProjectionException(ValueError):
+    def __init__(self, msg="Invalid fields or expand parameter"):
+        self.msg = msg
+        super().__init__(self.msg)
+
+    def __str__(self):
+        return self.msg
+
+
+class Projection:
+    """
+    Client-chosen subset of a model to load and serialize.
+
+    `fields` names columns, dotted for columns of a relationship (e.g.
+    "name,amount,media.content_url"), and `expand` names relationship paths
+    loaded with all their columns (e.g. "units,media,addresses.city"). Only
+    those columns are selected and only those relationships are loaded, and
+    the response model is derived from the same selection.
+
+    Only the relationship paths in `allowed` can be reached, and no deeper
+    than MAX_DEPTH relationships.
+    """
+
+    # left out unless asked for, like the default response models
+    DEFAULT_EXCLUDES = ["created_at", "updated_at"]
+
+    MAX_DEPTH = 3
+
+    # response models built so far, keyed by the selection they serialize
+    RESPONSE_MODEL_CACHE_SIZE = 256
+    _response_models: Dict[tuple, Any] = {}
+
+    def __init__(
+        self,
+        model,
+        fields: Optional[str] = None,
+        expand: Optional[str] = None,
+        allowed: Optional[List[str]] = None,
+    ):
+        self.model = model
+        self.allowed = LoadPlan.build_tree(allowed or [])
+        self.expand = LoadPlan.build_tree(self.split(expand))
+        self.validate(model, self.expand, self.allowed)
+
+        # columns per node, keyed by the relationship path ("" is the model itself)
+        self.fields: Dict[str, List[str]] = {}
+        for field in self.split(fields):
+            self.add_field(field)
+
+    @staticmethod
+    def split(value: Optional[str]) -> List[str]:
+        return [item.strip() for item in (value or "").split(",") if item.strip()]
+
+    @staticmethod
+    def relationships(model) -> Dict[str, Any]:
+        return {
+            rel.key: rel
+            for rel in inspect(model).relationships
+            if rel.lazy != "dynamic"
+        }
+
+    @staticmethod
+    def columns(model) -> List[str]:
+        private = getattr(model, "private_columns", ())
+
+        return [
+            key
+            for key, column in inspect(model).columns.items()
+            if isinstance(column, Column) and key not in private
+        ]
+
+    def add_field(self, field: str):
+        *keys, name = field.split(".")
+        model, node, allowed = self.model, self.expand, self.allowed
+
+        if len(keys) > self.MAX_DEPTH:
+            raise InvalidProjectionException(f"Field nested too deep: {field}")
+
+        # naming a relationship in fields expands it
+        for key in keys:
+            relationships = self.relationships(model)
+            if key not in relationships:
+                raise InvalidProjectionException(f"Unknown field: {field}")
+            if key not in allowed:
+                raise InvalidProjectionException(f"Field not expandable: {field}")
+
+            model, node = relationships[key].mapper.class_, node.setdefault(key, {})
+            allowed = allowed[key]
+
+        if name in self.relationships(model):
+            if name not in allowed or len(keys) == self.MAX_DEPTH:
+                raise InvalidProjectionException(f"Field not expandable: {field}")
+
+            node.setdefault(name, {})
+        elif name in self.columns(model):
+            self.fields.setdefault(".".join(keys), []).append(name)
+        else:
+            raise InvalidProjectionException(f"Unknown field: {field}")
+
+    def validate(
+        self, model, tree: Dict[str, Dict], allowed: Dict[str, Dict], depth: int = 1
+    ):
+        relationships = self.relationships(model)
+
+        for key, children in tree.items():
+            if key not in relationships:
+                raise InvalidProjectionException(f"Unknown expand: {key}")
+            if key not in allowed:
+                raise InvalidProjectionException(f"Not expandable: {key}")
+            if depth > self.MAX_DEPTH:
+                raise InvalidProjectionException(f"Expand nested too deep: {key}")
+
+            self.validate(
+                relationships[key].mapper.class_, children, allowed[key], depth + 1
+            )
+
+    def selected_columns(self, model, path: str) -> List[str]:
+        if path not in self.fields:
+            return [c for c in self.columns(model) if c not in self.DEFAULT_EXCLUDES]
+
+        # primary keys keep identities intact
+        keys = [col.key for col in inspect(model).primary_key]
+
+        return list(dict.fromkeys(keys + self.fields[path]))
+
+    def options(self) -> List[Any]:
+        """
+        Turns the selection into load_only and selectinload options.
+        """
+        # the root also loads the key cursor pagination encodes
+        root_columns = self.selected_columns(self.model, "") + [
+            col.key for col in Pagination.key_columns(self.model)
+        ]
+        options = [
+            load_only(
+                *[getattr(self.model, key) for key in dict.fromkeys(root_columns)]
+            )
+        ]
+
+        def walk(entity, tree: Dict[str, Dict], path: str, loader=None):
+            for key, children in tree.items():
+                attribute = getattr(entity, key)
+                chain = (
+                    loader.selectinload(attribute)
+                    if loader is not None
+                    else selectinload(attribute)
+                )
+
+                child_path = f"{path}.{key}" if path else key
+                target = inspect(entity).relationships[key].mapper.class_
+                columns = self.selected_columns(target, child_path)
+                options.append(
+                    chain.load_only(*[getattr(target, column) for column in columns])
+                )
+
+                walk(target, children, child_path, chain)
+
+        walk(self.model, self.expand, "")
+
+        return options
+
+    @classmethod
+    def freeze(cls, tree: Dict[str, Dict]) -> tuple:
+        return tuple(
+            sorted((key, cls.freeze(children)) for key, children in tree.items())
+        )
+
+    def response_model(self):
+        """
+        Returns the pydantic model matching the selection, built once per selection.
+        """
+        key = (
+            self.model,
+            tuple(sorted((path, tuple(sorted(c))) for path, c in self.fields.items())),
+            self.freeze(self.expand),
+        )
+
+        cache = Projection._response_models
+        if key not in cache:
+            # forget the oldest selection rather than grow without bound
+            if len(cache) >= self.RESPONSE_MODEL_CACHE_SIZE:
+                del cache[next(iter(cache))]
+
+            cache[key] = self.build_model()
+
+        return cache[key]
+
+    def build_model(self):
+        """
+        Builds the pydantic model matching the selection.
+        """
+
+        def build(model, tree: Dict[str, Dict], path: str):
+            columns = inspect(model).columns
+            fields = {
+                key: (Optional[columns[key].type.python_type], None)
+                for key in self.selected_columns(model, path)
+            }
+
+            relationships = self.relationships(model)
+            for key, children in tree.items():
+                child_path = f"{path}.{key}" if path else key
+                sub_model = build(
+                    relationships[key].mapper.class_, children, child_path
+                )
+                fields[key] = (
+                    Optional[
+                        List[sub_model] if relationships[key].uselist else sub_model
+                    ],
+                    None,
+                )
+
+            return create_model(
+                f"{model.__name__}Projection",
+                __config__=ConfigDict(
+                    from_attributes=True, arbitrary_types_allowed=True
+                ),
+                **fields,
+            )
+
+        return build(self.model, self.expand, "")
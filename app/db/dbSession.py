@@ -0,0 +1,52 @@
+from sqlalchemy import Engine
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import Select
+from sqlalchemy.sql.dml import UpdateBase
+from sqlalchemy.sql.elements import TextClause
+
+
+class RoutingSession(Session):
+    """
+    Session that sends read statements to the "read" (replica) engine and
+    writes to the "write" (primary) engine.
+
+    As soon as the session writes, it is pinned to the primary for the rest of
+    its lifetime so that later reads in the same request see its own writes.
+    """
+
+    PRIMARY_PINNED = "primary_pinned"
+
+    def __init__(
+        self,
+        *args,
+        write_bind: Engine = None,
+        read_bind: Engine = None,
+        **kwargs,
+    ):
+        super().__init__(*args, **kwargs)
+        self.write_bind = write_bind
+        self.read_bind = read_bind or write_bind
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        if self.info.get(self.PRIMARY_PINNED) or self.is_write(clause):
+            self.info[self.PRIMARY_PINNED] = True
+            return self.write_bind
+
+        return self.read_bind
+
+    def is_write(self, clause) -> bool:
+        """
+        Determines whether a statement has to run on the primary.
+        """
+        # flushes, DML and raw SQL we can't inspect always go to the primary
+        if self._flushing or isinstance(clause, (UpdateBase, TextClause)):
+            return True
+
+        # row locks are only meaningful on the primary
+        if isinstance(clause, Select) and clause._for_update_arg is not None:
+            return True
+
+        return False
+
+    def pin_to_primary(self):
+        self.info[self.PRIMARY_PINNED] = True
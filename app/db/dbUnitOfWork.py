@@ -0,0 +1,138 @@
+from collections import defaultdict
+from typing import Any, Dict, List
+
+from sqlalchemy import event, inspect, tuple_
+from sqlalchemy.future import select
+from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+class UnitOfWork:
+    """
+    Groups every write made through a session into a single transaction.
+
+    While a unit of work is open, DAO calls to `commit_and_refresh` only flush
+    and queue the object for a refresh. The outermost unit of work refreshes
+    the queued objects with one query per model and commits once on exit, or
+    rolls everything back if the block raised or anything inside it rolled back.
+
+    Usage:
+        async with UnitOfWork(db_session):
+            await user_dao.create(db_session=db_session, obj_in=user)
+    """
+
+    DEPTH = "uow_depth"
+    PENDING_REFRESH = "uow_pending_refresh"
+    ROLLBACK_ONLY = "uow_rollback_only"
+
+    def __init__(self, db_session: AsyncSession):
+        self.db_session = db_session
+
+    @classmethod
+    def is_active(cls, db_session: AsyncSession) -> bool:
+        return db_session.info.get(cls.DEPTH, 0) > 0
+
+    @classmethod
+    def defer_refresh(
+        cls, db_session: AsyncSession, obj: Any, options: List[Any] = None
+    ):
+        pending = db_session.info.setdefault(cls.PENDING_REFRESH, {})
+        pending[id(obj)] = (obj, options or [])
+
+    @staticmethod
+    def in_savepoint(transaction) -> bool:
+        # a flush inside a savepoint rolls back a subtransaction of the savepoint
+        while transaction is not None:
+            if transaction.nested:
+                return True
+            transaction = transaction.parent
+
+        return False
+
+    @classmethod
+    def set_rollback_only(cls, db_session: Session):
+        if db_session.info.get(cls.DEPTH, 0) > 0:
+            db_session.info[cls.ROLLBACK_ONLY] = True
+
+    @classmethod
+    async def refresh_pending(cls, db_session: AsyncSession):
+        """
+        Flushes and reloads every queued object, one SELECT per model.
+        """
+        pending: Dict[int, Any] = db_session.info.pop(cls.PENDING_REFRESH, {})
+        await db_session.flush()
+
+        objects, options = defaultdict(list), {}
+        for obj, obj_options in pending.values():
+            objects[type(obj)].append(obj)
+            options.setdefault(type(obj), obj_options)
+
+        for model, objs in objects.items():
+            await cls.refresh(db_session, model, objs, options[model])
+
+    @classmethod
+    async def refresh(
+        cls, db_session: AsyncSession, model, objs: List[Any], options: List[Any]
+    ):
+        """
+        Reloads the objects and the relationships named by the loader options.
+        """
+        keys = [inspect(obj).identity for obj in objs if inspect(obj).persistent]
+        if not keys:
+            return
+
+        primary_key = inspect(model).primary_key
+        condition = (
+            primary_key[0].in_([key[0] for key in keys])
+            if len(primary_key) == 1
+            else tuple_(*primary_key).in_(keys)
+        )
+
+        await db_session.execute(
+            select(model)
+            .where(condition)
+            .options(*options)
+            .execution_options(populate_existing=True)
+        )
+
+    async def __aenter__(self):
+        info = self.db_session.info
+        info[self.DEPTH] = info.get(self.DEPTH, 0) + 1
+
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        info = self.db_session.info
+        info[self.DEPTH] -= 1
+
+        if exc_type is not None:
+            info[self.ROLLBACK_ONLY] = True
+
+        # only the outermost unit of work ends the transaction
+        if info[self.DEPTH] > 0:
+            return False
+
+        rollback_only = info.pop(self.ROLLBACK_ONLY, False)
+
+        try:
+            if not rollback_only:
+                await self.refresh_pending(self.db_session)
+                await self.db_session.commit()
+        except Exception:
+            rollback_only = True
+            raise
+        finally:
+            info.pop(self.PENDING_REFRESH, None)
+
+            if rollback_only:
+                await self.db_session.rollback()
+
+        return False
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def mark_rollback_only(session: Session, previous_transaction):
+    # a dao that rolled back mid-request must not have the rest of the work committed,
+    # a savepoint rolling back only undoes its own part
+    if not UnitOfWork.in_savepoint(previous_transaction):
+        UnitOfWork.set_rollback_only(session)
@@ -14,6 +14,9 @@ from app.models.entity_media import EntityMedia  # noqa: F401
 from app.models.message import Message  # noqa: F401
 from app.models.reminder_frequency import ReminderFrequency  # noqa: F401
 from app.models.message_recipient import MessageRecipient  # noqa: F401
+from app.models.user_mailbox import UserMailbox  # noqa: F401
+from app.models.email_outbox import OutboxEmail  # noqa: F401
+from app.models.cache_version import CacheVersion  # noqa: F401
 
 from app.models.user import User  # noqa: F401
 from app.models.role import Role  # noqa: F401
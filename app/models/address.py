@@ -36,7 +36,6 @@ class Addresses(Base):
         primaryjoin="EntityAddress.address_id==Addresses.address_id",
         secondaryjoin="and_(EntityAddress.entity_id==User.user_id, EntityAddress.entity_type=='User')",
         back_populates="addresses",
-        lazy="selectin",
     )
 
     rental_history = relationship(
@@ -46,7 +45,6 @@ class Addresses(Base):
         secondaryjoin="and_(EntityAddress.entity_id==PastRentalHistory.address_hash, EntityAddress.entity_type=='PastRentalHistory')",
         overlaps="users",
         back_populates="addresses",
-        lazy="selectin",
     )
 
     properties = relationship(
@@ -56,12 +54,11 @@ class Addresses(Base):
         secondaryjoin="and_(EntityAddress.entity_id==Property.property_unit_assoc_id, EntityAddress.entity_type=='Property')",
         back_populates="addresses",
         overlaps="users,rental_history",
-        lazy="selectin",
     )
 
-    city = relationship("City", back_populates="addresses", lazy="joined")
-    region = relationship("Region", back_populates="addresses", lazy="joined")
-    country = relationship("Country", back_populates="addresses", lazy="joined")
+    city = relationship("City", back_populates="addresses")
+    region = relationship("Region", back_populates="addresses")
+    country = relationship("Country", back_populates="addresses")
     entity_addresses = relationship(
         "EntityAddress",
         overlaps="users,properties,rental_history",
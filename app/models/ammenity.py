@@ -26,5 +26,4 @@ class Amenities(Base):
         primaryjoin="Amenities.amenity_id == EntityMedia.media_assoc_id",
         secondaryjoin="and_(EntityMedia.media_id == Media.media_id, EntityMedia.entity_type == 'Amenities')",
         overlaps="entity_media, media",
-        lazy="selectin",
     )
@@ -0,0 +1,17 @@
+from sqlalchemy import Column, Integer, String
+
+from app.models.model_base import BaseModel as Base
+
+
+class CacheVersion(Base):
+    """
+    Version of a cache every process keeps in memory, e.g. the permission matrix.
+
+    The transaction changing the data a cache is built from bumps its version,
+    so other processes can tell their copy is out of date.
+    """
+
+    __tablename__ = "cache_version"
+
+    name = Column(String(64), primary_key=True)
+    version = Column(Integer, default=0, nullable=False)
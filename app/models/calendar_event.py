@@ -60,7 +60,7 @@ class CalendarEvent(Base):
         UUID(as_uuid=True), ForeignKey("users.user_id"), nullable=False
     )
 
-    organizer = relationship("User", back_populates="events", lazy="selectin")
+    organizer = relationship("User", back_populates="events")
 
 
 @event.listens_for(CalendarEvent, "before_insert")
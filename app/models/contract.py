@@ -78,21 +78,18 @@ class Contract(Base):
         "Documents",
         secondary="contract_documents",
         back_populates="contract",
-        lazy="selectin",
         viewonly=True,
     )
     invoices = relationship(
         "Invoice",
         secondary="contract_invoice",
         back_populates="contracts",
-        lazy="selectin",
         viewonly=True,
     )
 
     under_contract = relationship(
         "UnderContract",
         back_populates="contract",
-        lazy="selectin",
         foreign_keys="UnderContract.contract_id",
         cascade="all, delete-orphan",
         viewonly=True,
@@ -104,7 +101,6 @@ class Contract(Base):
         primaryjoin="Contract.contract_number == UnderContract.contract_id",
         secondaryjoin="UnderContract.property_unit_assoc_id == PropertyUnitAssoc.property_unit_assoc_id",
         foreign_keys="[Contract.contract_number, PropertyUnitAssoc.property_unit_assoc_id]",
-        lazy="selectin",
         viewonly=True,
     )
 
@@ -114,16 +110,11 @@ class Contract(Base):
         primaryjoin="and_(EntityBillable.entity_assoc_id==Contract.contract_id, EntityBillable.entity_type=='Contract', EntityBillable.billable_type=='Utilities')",
         foreign_keys="[EntityBillable.entity_assoc_id]",
         overlaps="entity_billable,utilities",
-        lazy="selectin",
         viewonly=True,
     )
 
-    contract_type = relationship(
-        "ContractType", back_populates="contracts", lazy="selectin"
-    )
-    payment_type = relationship(
-        "PaymentTypes", back_populates="contracts", lazy="selectin"
-    )
+    contract_type = relationship("ContractType", back_populates="contracts")
+    payment_type = relationship("PaymentTypes", back_populates="contracts")
 
     def to_dict(self, exclude=[]):
         if exclude is None:
@@ -0,0 +1,42 @@
+import enum
+import uuid
+from datetime import datetime
+import pytz
+from sqlalchemy import Column, DateTime, Enum, Index, Integer, String, Text, UUID
+
+from app.models.model_base import BaseModel as Base
+
+
+class EmailStatusEnum(enum.Enum):
+    pending = "pending"
+    sending = "sending"
+    sent = "sent"
+    failed = "failed"
+
+
+class OutboxEmail(Base):
+    __tablename__ = "email_outbox"
+
+    outbox_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    # one row per logical email, a second enqueue with the same key is a no-op
+    idempotency_key = Column(String(255), unique=True, nullable=False)
+    recipient = Column(String(255), nullable=False)
+    subject = Column(String(255), nullable=False)
+    message = Column(Text, nullable=False)
+
+    status = Column(
+        Enum(EmailStatusEnum), default=EmailStatusEnum.pending, nullable=False
+    )
+    attempts = Column(Integer, default=0, nullable=False)
+    last_error = Column(Text, nullable=True)
+
+    # earliest time the next attempt may run, pushed back on failures
+    available_at = Column(
+        DateTime(timezone=True), default=lambda: datetime.now(pytz.utc)
+    )
+    # claim held by a dispatcher, reclaimable once it lapses
+    claimed_by = Column(UUID(as_uuid=True), nullable=True)
+    claimed_until = Column(DateTime(timezone=True), nullable=True)
+    sent_at = Column(DateTime(timezone=True), nullable=True)
+
+    __table_args__ = (Index("ix_email_outbox_status_available", status, available_at),)
@@ -23,11 +23,10 @@ class EntityAmenities(Base):
     )
     apply_to_units = Column(Boolean, default=False)
 
-    amenity = relationship("Amenities", overlaps="amenities", lazy="selectin")
+    amenity = relationship("Amenities", overlaps="amenities")
     media = relationship(
         "Media",
         secondary="entity_media",
         primaryjoin="EntityAmenities.entity_amenities_id == EntityMedia.media_assoc_id",
         secondaryjoin="and_(EntityMedia.media_id == Media.media_id, EntityMedia.entity_type == 'EntityAmenities')",
-        lazy="selectin",
     )
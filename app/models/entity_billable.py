@@ -27,7 +27,5 @@ class EntityBillable(Base):
     billable_amount = Column(String(128))
     apply_to_units = Column(Boolean, default=False)
 
-    payment_type = relationship(
-        "PaymentTypes", back_populates="entity_billable", lazy="selectin"
-    )
-    utility = relationship("Utilities", lazy="selectin")
+    payment_type = relationship("PaymentTypes", back_populates="entity_billable")
+    utility = relationship("Utilities")
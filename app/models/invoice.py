@@ -69,12 +69,10 @@ class Invoice(Base):
         "Transaction",
         primaryjoin="Invoice.invoice_number==Transaction.invoice_number",
         back_populates="transaction_invoice",
-        lazy="selectin",
     )
     invoice_items = relationship(
         "InvoiceItem",
         back_populates="invoice",
-        lazy="selectin",
         cascade="all, delete-orphan",
     )  # [property, property_unit, maintenance, service, fee]
 
@@ -82,13 +80,11 @@ class Invoice(Base):
         "User",
         foreign_keys=[issued_by],
         backref="invoice_as_issued_by_user",
-        lazy="selectin",
     )
     issued_to_user = relationship(
         "User",
         foreign_keys=[issued_to],
         backref="invoice_as_issued_to_user",
-        lazy="selectin",
     )
 
 
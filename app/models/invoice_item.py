@@ -33,7 +33,7 @@ class InvoiceItem(Base):
     description = Column(String, nullable=True)
     reference_id = Column(String, nullable=True)
 
-    invoice = relationship("Invoice", back_populates="invoice_items", lazy="selectin")
+    invoice = relationship("Invoice", back_populates="invoice_items")
 
 
 @event.listens_for(InvoiceItem, "before_insert")
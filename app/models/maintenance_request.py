@@ -65,7 +65,6 @@ class MaintenanceRequest(Base):
         secondaryjoin="Property.property_unit_assoc_id == PropertyUnitAssoc.property_unit_assoc_id",
         viewonly=True,
         back_populates="maintenance_requests",
-        lazy="selectin",
     )
     unit = relationship(
         "Units",
@@ -74,7 +73,6 @@ class MaintenanceRequest(Base):
         secondaryjoin="Units.property_unit_assoc_id == PropertyUnitAssoc.property_unit_assoc_id",
         viewonly=True,
         back_populates="maintenance_requests",
-        lazy="selectin",
     )
 
     property_unit_assoc = relationship(
@@ -84,10 +82,9 @@ class MaintenanceRequest(Base):
         primaryjoin="MaintenanceRequest.property_unit_assoc_id == PropertyUnitAssoc.property_unit_assoc_id",
         overlaps="maintenance_requests,maintenance_requests,property,unit",
         foreign_keys=[property_unit_assoc_id],
-        lazy="selectin",
         viewonly=True,
     )
-    user = relationship("User", back_populates="maintenance_requests", lazy="selectin")
+    user = relationship("User", back_populates="maintenance_requests")
 
 
 @event.listens_for(MaintenanceRequest, "before_insert")
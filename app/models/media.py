@@ -1,5 +1,5 @@
 import uuid
-from sqlalchemy import Column, String, UUID, Boolean, Text
+from sqlalchemy import JSON, Column, String, UUID, Boolean, Text
 
 from app.models.model_base import BaseModel as Base
 
@@ -20,3 +20,19 @@ class Media(Base):
     caption = Column(String(500), nullable=True)
     description = Column(Text, nullable=True)
     is_thumbnail = Column(Boolean, default=False)
+    # sha-256 of the uploaded bytes, identical files share one stored copy
+    content_hash = Column(String(64), nullable=True, index=True)
+    # urls of the resized copies, {"webp": {"320": url, ...}, "jpeg": {...}}
+    variants = Column(JSON, nullable=True)
+
+    @property
+    def thumbnail_url(self):
+        """
+        Url of the smallest derivative, the original when there are none.
+        """
+        for name in ("webp", "jpeg"):
+            sizes = (self.variants or {}).get(name)
+            if sizes:
+                return sizes[min(sizes, key=int)]
+
+        return self.content_url
@@ -2,7 +2,7 @@ from datetime import datetime
 import uuid
 import pytz
 from sqlalchemy.orm import relationship, backref
-from sqlalchemy import Column, ForeignKey, Boolean, DateTime, String, Text, UUID
+from sqlalchemy import Column, ForeignKey, Boolean, DateTime, Index, String, Text, UUID
 
 from app.models.model_base import BaseModel as Base
 
@@ -34,6 +34,8 @@ class Message(Base):
     next_remind_date = Column(
         DateTime(timezone=True), default=lambda: datetime.now(pytz.utc), nullable=True
     )
+    # set once the message is fanned out to its recipients' mailboxes
+    delivered_at = Column(DateTime(timezone=True), nullable=True, index=True)
 
     # TODO: Add to next update on message model
     reminder_frequency_id = Column(
@@ -41,11 +43,9 @@ class Message(Base):
     )
     reminder_frequency = relationship("ReminderFrequency", back_populates="messages")
 
-    sender = relationship("User", back_populates="sent_messages", lazy="selectin")
+    sender = relationship("User", back_populates="sent_messages")
 
-    recipients = relationship(
-        "MessageRecipient", back_populates="message", lazy="selectin"
-    )
+    recipients = relationship("MessageRecipient", back_populates="message")
 
     replies = relationship(
         "Message",
@@ -60,3 +60,8 @@ class Message(Base):
         backref=backref("thread_messages", foreign_keys=[thread_id]),
         foreign_keys=[thread_id],
     )
+
+    # a sender's outbox, drafts and scheduled messages, paged newest first
+    __table_args__ = (
+        Index("ix_message_sender_created", sender_id, date_created, message_id),
+    )
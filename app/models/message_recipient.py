@@ -2,7 +2,7 @@ from datetime import datetime
 import uuid
 import pytz
 from sqlalchemy.orm import relationship
-from sqlalchemy import Column, DateTime, ForeignKey, Boolean, UUID
+from sqlalchemy import Column, DateTime, ForeignKey, Boolean, Index, UUID
 
 from app.models.model_base import BaseModel as Base
 
@@ -23,10 +23,16 @@ class MessageRecipient(Base):
         DateTime(timezone=True), default=lambda: datetime.now(pytz.utc)
     )
 
-    recipient = relationship(
-        "User", back_populates="received_messages", lazy="selectin"
-    )
-    message = relationship("Message", back_populates="recipients", lazy="selectin")
+    recipient = relationship("User", back_populates="received_messages")
+    message = relationship("Message", back_populates="recipients")
     message_group = relationship(
-        "PropertyUnitAssoc", back_populates="messages_recipients", lazy="selectin"
+        "PropertyUnitAssoc", back_populates="messages_recipients"
+    )
+
+    # inbox lookups, by user or by unit within a contract period, and the
+    # recipients of a page of messages
+    __table_args__ = (
+        Index("ix_message_recipient_recipient_date", recipient_id, msg_send_date),
+        Index("ix_message_recipient_group_date", recipient_group_id, msg_send_date),
+        Index("ix_message_recipient_message", message_id),
     )
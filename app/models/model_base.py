@@ -2,7 +2,7 @@ from datetime import datetime
 
 # from sqlalchemy.ext.asyncio import AsyncAttrs
 import pytz
-from sqlalchemy import Column, DateTime, UUID
+from sqlalchemy import Column, DateTime, Index, UUID, event
 from sqlalchemy.ext.declarative import declared_attr
 
 from app.db.dbDeclarative import Base
@@ -37,3 +37,19 @@ class BaseModel(Base):
                 data[key] = value
 
         return data
+
+
+@event.listens_for(BaseModel, "instrument_class", propagate=True)
+def add_keyset_index(mapper, class_):
+    # backs the (created_at, primary key) ordering used by cursor pagination
+    table = mapper.local_table
+
+    # joined-inheritance subclasses are covered by their parent table's index
+    if "created_at" not in table.c:
+        return
+
+    Index(
+        f"ix_{table.name}_created_at_keyset",
+        table.c.created_at,
+        *table.primary_key.columns,
+    )
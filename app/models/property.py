@@ -64,6 +64,8 @@ class Property(PropertyUnitAssoc):
 
     __mapper_args__ = {
         "polymorphic_identity": "Property",
+        # subclass columns come with every base class load instead of a lazy SELECT
+        "polymorphic_load": "inline",
         "inherit_condition": property_unit_assoc_id
         == PropertyUnitAssoc.property_unit_assoc_id,
     }
@@ -87,7 +89,6 @@ class Property(PropertyUnitAssoc):
         "MaintenanceRequest",
         primaryjoin="Property.property_unit_assoc_id == MaintenanceRequest.property_unit_assoc_id",
         foreign_keys="[MaintenanceRequest.property_unit_assoc_id]",
-        lazy="selectin",
         back_populates="property",
         viewonly=True,
     )
@@ -96,7 +97,6 @@ class Property(PropertyUnitAssoc):
         "Tour",
         primaryjoin="Property.property_unit_assoc_id == Tour.property_unit_assoc_id",
         foreign_keys="[Tour.property_unit_assoc_id]",
-        lazy="selectin",
         back_populates="property",
         viewonly=True,
     )
@@ -110,7 +110,6 @@ class Property(PropertyUnitAssoc):
         "Units",
         primaryjoin="Units.property_id == Property.property_unit_assoc_id",
         back_populates="property",
-        lazy="selectin",
     )
 
     # relationship with media
@@ -119,7 +118,6 @@ class Property(PropertyUnitAssoc):
         secondary="entity_media",
         primaryjoin="and_(EntityMedia.media_assoc_id==Property.property_unit_assoc_id, EntityMedia.entity_type=='Property')",
         overlaps="entity_media,media",
-        lazy="selectin",
         viewonly=True,
     )
 
@@ -128,7 +126,6 @@ class Property(PropertyUnitAssoc):
         "EntityAmenities",
         primaryjoin="Property.property_unit_assoc_id == EntityAmenities.entity_assoc_id",
         foreign_keys="[EntityAmenities.entity_assoc_id]",
-        lazy="selectin",
         viewonly=True,
         cascade="all, delete-orphan",
     )
@@ -139,7 +136,6 @@ class Property(PropertyUnitAssoc):
         primaryjoin="and_(EntityBillable.entity_assoc_id==Property.property_unit_assoc_id, EntityBillable.entity_type=='Property', EntityBillable.billable_type=='Utilities')",
         foreign_keys="[EntityBillable.entity_assoc_id]",
         overlaps="entity_billable,utilities",
-        lazy="selectin",
         viewonly=True,
     )
 
@@ -148,7 +144,6 @@ class Property(PropertyUnitAssoc):
         secondary="entity_amenities",
         primaryjoin="Property.property_unit_assoc_id == EntityAmenities.entity_assoc_id",
         secondaryjoin="EntityAmenities.amenity_id == Amenities.amenity_id",
-        lazy="selectin",
         viewonly=True,
     )
 
@@ -160,8 +155,7 @@ class Property(PropertyUnitAssoc):
         secondaryjoin="EntityAddress.address_id==Addresses.address_id",
         overlaps="address,entity_addresses,users,properties,rental_history",
         back_populates="properties",
-        lazy="selectin",
     )
 
     # relationship with property assignments
-    assigned_users = relationship("PropertyAssignment", lazy="selectin", viewonly=True)
+    assigned_users = relationship("PropertyAssignment", viewonly=True)
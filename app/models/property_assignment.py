@@ -41,7 +41,5 @@ class PropertyAssignment(Base):
     date_to = Column(DateTime(timezone=True), default=lambda: datetime.now(pytz.utc))
     notes = Column(Text)
 
-    property_unit_assoc = relationship(
-        "PropertyUnitAssoc", lazy="selectin", viewonly=True
-    )
-    user = relationship("User", lazy="selectin", viewonly=True)
+    property_unit_assoc = relationship("PropertyUnitAssoc", viewonly=True)
+    user = relationship("User", viewonly=True)
@@ -30,7 +30,6 @@ class PropertyUnitAssoc(BaseModel):
         primaryjoin="and_(PropertyUnitAssoc.property_unit_type == 'Property', Property.property_unit_assoc_id == PropertyUnitAssoc.property_unit_assoc_id)",
         foreign_keys="[Property.property_unit_assoc_id]",
         remote_side="[PropertyUnitAssoc.property_unit_assoc_id]",
-        lazy="selectin",
         viewonly=True,
     )
 
@@ -39,7 +38,6 @@ class PropertyUnitAssoc(BaseModel):
         primaryjoin="and_(PropertyUnitAssoc.property_unit_type == 'Units', Units.property_unit_assoc_id == PropertyUnitAssoc.property_unit_assoc_id)",
         foreign_keys="[Units.property_unit_assoc_id]",
         remote_side="[PropertyUnitAssoc.property_unit_assoc_id]",
-        lazy="selectin",
         viewonly=True,
     )
 
@@ -73,7 +71,7 @@ class PropertyUnitAssoc(BaseModel):
 
     # relationship to message recipients
     messages_recipients = relationship(
-        "MessageRecipient", back_populates="message_group", lazy="selectin"
+        "MessageRecipient", back_populates="message_group"
     )
 
     # relationship to contracts
@@ -81,7 +79,6 @@ class PropertyUnitAssoc(BaseModel):
         "UnderContract",
         back_populates="properties",
         overlaps="members",
-        lazy="selectin",
     )
 
     prop_maintenance_requests = relationship(
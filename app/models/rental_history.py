@@ -32,5 +32,4 @@ class PastRentalHistory(Base):
         secondaryjoin="EntityAddress.address_id==Addresses.address_id",
         overlaps="address,entity_addresses,addresses,properties,users",
         back_populates="rental_history",
-        lazy="selectin",
     )
@@ -24,5 +24,4 @@ class Role(Base):
         "Permissions",
         secondary="role_permissions",
         back_populates="roles",
-        lazy="selectin",
     )
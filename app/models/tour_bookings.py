@@ -42,7 +42,7 @@ class Tour(Base):
         UUID, ForeignKey("users.user_id", ondelete="CASCADE"), nullable=True
     )
 
-    user = relationship("User", back_populates="tours", lazy="selectin")
+    user = relationship("User", back_populates="tours")
 
     property = relationship(
         "Property",
@@ -51,7 +51,6 @@ class Tour(Base):
         secondaryjoin="Property.property_unit_assoc_id == PropertyUnitAssoc.property_unit_assoc_id",
         viewonly=True,
         back_populates="tour_bookings",
-        lazy="selectin",
     )
 
     unit = relationship(
@@ -61,7 +60,6 @@ class Tour(Base):
         secondaryjoin="Units.property_unit_assoc_id == PropertyUnitAssoc.property_unit_assoc_id",
         viewonly=True,
         back_populates="tour_bookings",
-        lazy="selectin",
     )
 
     property_unit_assoc = relationship(
@@ -71,6 +69,5 @@ class Tour(Base):
         primaryjoin="Tour.property_unit_assoc_id == PropertyUnitAssoc.property_unit_assoc_id",
         overlaps="property,unit",
         foreign_keys=[property_unit_assoc_id],
-        lazy="selectin",
         viewonly=True,
     )
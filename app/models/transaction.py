@@ -56,20 +56,17 @@ class Transaction(Base):
         "User",
         foreign_keys=[client_offered],
         back_populates="transaction_as_client_offered",
-        lazy="selectin",
     )
     client_requested_transaction = relationship(
         "User",
         foreign_keys=[client_requested],
         back_populates="transaction_as_client_requested",
-        lazy="selectin",
     )
 
     transaction_invoice = relationship(
         "Invoice",
         primaryjoin="Invoice.invoice_number==Transaction.invoice_number",
         back_populates="transaction",
-        lazy="selectin",
     )
 
 
@@ -1,7 +1,7 @@
 import uuid
 import enum
 from sqlalchemy.orm import relationship
-from sqlalchemy import Column, DateTime, ForeignKey, Enum, UUID, String
+from sqlalchemy import Column, DateTime, ForeignKey, Enum, Index, UUID, String
 
 from app.models.model_base import BaseModel as Base
 
@@ -43,13 +43,10 @@ class UnderContract(Base):
         DateTime(timezone=True)
     )  # TODO: Value determined by system
 
-    properties = relationship(
-        "PropertyUnitAssoc", back_populates="under_contract", lazy="selectin"
-    )
+    properties = relationship("PropertyUnitAssoc", back_populates="under_contract")
     contract = relationship(
         "Contract",
         back_populates="under_contract",
-        lazy="selectin",
         foreign_keys=[contract_id],
         viewonly=True,
     )
@@ -58,11 +55,20 @@ class UnderContract(Base):
         "User",
         foreign_keys=[client_id],
         back_populates="client_under_contract",
-        lazy="selectin",
     )
     employee_representative = relationship(
         "User",
         foreign_keys=[employee_id],
         back_populates="employee_under_contract",
-        lazy="selectin",
+    )
+
+    # a client's contracts, joined to messages sent to the unit in the period
+    __table_args__ = (
+        Index(
+            "ix_under_contract_client_unit_period",
+            client_id,
+            property_unit_assoc_id,
+            start_date,
+            end_date,
+        ),
     )
@@ -44,6 +44,8 @@ class Units(PropertyUnitAssoc):
 
     __mapper_args__ = {
         "polymorphic_identity": "Units",
+        # subclass columns come with every base class load instead of a lazy SELECT
+        "polymorphic_load": "inline",
         "inherit_condition": property_unit_assoc_id
         == PropertyUnitAssoc.property_unit_assoc_id,
     }
@@ -67,7 +69,6 @@ class Units(PropertyUnitAssoc):
         "MaintenanceRequest",
         primaryjoin="Units.property_unit_assoc_id == MaintenanceRequest.property_unit_assoc_id",
         foreign_keys="[MaintenanceRequest.property_unit_assoc_id]",
-        lazy="selectin",
         back_populates="unit",
         viewonly=True,
     )
@@ -76,7 +77,6 @@ class Units(PropertyUnitAssoc):
         "Tour",
         primaryjoin="Units.property_unit_assoc_id == Tour.property_unit_assoc_id",
         foreign_keys="[Tour.property_unit_assoc_id]",
-        lazy="selectin",
         back_populates="unit",
         viewonly=True,
     )
@@ -86,7 +86,6 @@ class Units(PropertyUnitAssoc):
         primaryjoin="and_(EntityBillable.entity_assoc_id==Units.property_unit_assoc_id, EntityBillable.entity_type=='Units', EntityBillable.billable_type=='Utilities')",
         foreign_keys="[EntityBillable.entity_assoc_id]",
         overlaps="entity_billable,utilities",
-        lazy="selectin",
         viewonly=True,
     )
 
@@ -95,7 +94,6 @@ class Units(PropertyUnitAssoc):
         "Property",
         primaryjoin="Units.property_id == Property.property_unit_assoc_id",
         back_populates="units",
-        lazy="selectin",
     )
 
     # relationship with media
@@ -104,7 +102,6 @@ class Units(PropertyUnitAssoc):
         secondary="entity_media",
         primaryjoin="and_(EntityMedia.media_assoc_id==Units.property_unit_assoc_id, EntityMedia.entity_type=='Units')",
         overlaps="entity_media,media",
-        lazy="selectin",
         viewonly=True,
     )
 
@@ -113,7 +110,6 @@ class Units(PropertyUnitAssoc):
         "EntityAmenities",
         primaryjoin="Units.property_unit_assoc_id == EntityAmenities.entity_assoc_id",
         foreign_keys="[EntityAmenities.entity_assoc_id]",
-        lazy="selectin",
         viewonly=True,
     )
 
@@ -122,12 +118,11 @@ class Units(PropertyUnitAssoc):
         secondary="entity_amenities",
         primaryjoin="Units.property_unit_assoc_id == EntityAmenities.entity_assoc_id",
         secondaryjoin="EntityAmenities.amenity_id == Amenities.amenity_id",
-        lazy="selectin",
         viewonly=True,
     )
 
     # relationship with property assignments
-    assigned_users = relationship("PropertyAssignment", lazy="selectin", viewonly=True)
+    assigned_users = relationship("PropertyAssignment", viewonly=True)
     # events = relationship('CalendarEvent',
     #                         secondary="property_unit_assoc",
     #                         primaryjoin="CalendarEvent.property_unit_assoc_id == PropertyUnitAssoc.property_unit_assoc_id",
@@ -19,6 +19,14 @@ class GenderEnum(enum.Enum):
 class User(Base):
     __tablename__ = "users"
 
+    # never selectable through ?fields= projections
+    private_columns = (
+        "password",
+        "reset_token",
+        "verification_token",
+        "is_subscribed_token",
+    )
+
     user_id = Column(
         UUID(as_uuid=True),
         primary_key=True,
@@ -64,14 +72,12 @@ class User(Base):
     emergency_address_hash = Column(UUID(as_uuid=True))
 
     accounts = relationship(
-        "Accounts", secondary="user_accounts", back_populates="users", lazy="selectin"
+        "Accounts", secondary="user_accounts", back_populates="users"
     )
     maintenance_requests = relationship("MaintenanceRequest", back_populates="user")
     tours = relationship("Tour", back_populates="user")
     events = relationship("CalendarEvent", back_populates="organizer")
-    rental_histories = relationship(
-        "PastRentalHistory", back_populates="user", lazy="selectin"
-    )
+    rental_histories = relationship("PastRentalHistory", back_populates="user")
 
     addresses = relationship(
         "Addresses",
@@ -80,7 +86,6 @@ class User(Base):
         secondaryjoin="EntityAddress.address_id==Addresses.address_id",
         overlaps="address,entity_addresses,addresses,properties,rental_history",
         back_populates="users",
-        lazy="selectin",
     )
 
     emergency_addresses = relationship(
@@ -90,49 +95,38 @@ class User(Base):
         secondaryjoin="EntityAddress.address_id==Addresses.address_id",
         overlaps="address,entity_addresses,addresses,properties,rental_history",
         back_populates="users",
-        lazy="selectin",
     )
 
-    roles = relationship(
-        "Role", secondary="user_roles", back_populates="users", lazy="selectin"
-    )
+    roles = relationship("Role", secondary="user_roles", back_populates="users")
 
-    sent_messages = relationship("Message", back_populates="sender", lazy="selectin")
+    sent_messages = relationship("Message", back_populates="sender")
 
-    received_messages = relationship(
-        "MessageRecipient", back_populates="recipient", lazy="selectin"
-    )
+    received_messages = relationship("MessageRecipient", back_populates="recipient")
 
-    company = relationship(
-        "Company", secondary="users_company", back_populates="users", lazy="selectin"
-    )
+    company = relationship("Company", secondary="users_company", back_populates="users")
 
-    documents = relationship("Documents", back_populates="users", lazy="selectin")
+    documents = relationship("Documents", back_populates="users")
 
     interactions_as_user = relationship(
         "UserInteractions",
         foreign_keys="[UserInteractions.user_id]",
         back_populates="user",
-        lazy="selectin",
     )
     interactions_as_employee = relationship(
         "UserInteractions",
         foreign_keys="[UserInteractions.employee_id]",
         back_populates="employee",
-        lazy="selectin",
     )
 
     transaction_as_client_offered = relationship(
         "Transaction",
         foreign_keys="[Transaction.client_offered]",
         back_populates="client_offered_transaction",
-        lazy="selectin",
     )
     transaction_as_client_requested = relationship(
         "Transaction",
         foreign_keys="[Transaction.client_requested]",
         back_populates="client_requested_transaction",
-        lazy="selectin",
     )
 
     client_under_contract = relationship(
@@ -140,20 +134,17 @@ class User(Base):
         foreign_keys="[UnderContract.client_id]",
         back_populates="client_representative",
         overlaps="members",
-        lazy="selectin",
     )
     employee_under_contract = relationship(
         "UnderContract",
         foreign_keys="[UnderContract.employee_id]",
         back_populates="employee_representative",
-        lazy="selectin",
     )
 
     property = relationship(
         "PropertyUnitAssoc",
         secondary="property_assignment",
         back_populates="assignments",
-        lazy="selectin",
     )
 
     owned_properties = relationship(
@@ -161,7 +152,6 @@ class User(Base):
         secondary="property_assignment",
         primaryjoin="and_(PropertyAssignment.user_id == User.user_id, PropertyAssignment.assignment_type=='landlord')",
         secondaryjoin="PropertyAssignment.property_unit_assoc_id==PropertyUnitAssoc.property_unit_assoc_id",
-        lazy="selectin",
         viewonly=True,
     )
 
@@ -0,0 +1,37 @@
+from sqlalchemy.orm import relationship
+from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Index, UUID
+
+from app.models.model_base import BaseModel as Base
+
+
+class UserMailbox(Base):
+    """
+    One row per message per user it reached, directly or through a unit.
+
+    Written by the mailbox fan-out once a message is sent. `created_at` is
+    the message's creation date, so a user's inbox is an index range scan.
+    """
+
+    __tablename__ = "user_mailbox"
+
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.user_id"), primary_key=True)
+    message_id = Column(
+        UUID(as_uuid=True), ForeignKey("message.message_id"), primary_key=True
+    )
+    is_notification = Column(Boolean, default=False, nullable=False)
+    is_read = Column(Boolean, default=False, nullable=False)
+    read_at = Column(DateTime(timezone=True), nullable=True)
+
+    message = relationship("Message", viewonly=True)
+
+    # a user's inbox or notifications newest first, and their unread counts
+    __table_args__ = (
+        Index(
+            "ix_user_mailbox_user_created",
+            "user_id",
+            "is_notification",
+            "created_at",
+            "message_id",
+        ),
+        Index("ix_user_mailbox_user_unread", user_id, is_read, is_notification),
+    )
@@ -10,4 +10,4 @@ class UserRoles(Base):
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.user_id"), primary_key=True)
     role_id = Column(UUID(as_uuid=True), ForeignKey("role.role_id"), primary_key=True)
 
-    role = relationship("Role", viewonly=True, lazy="selectin")
+    role = relationship("Role", viewonly=True)
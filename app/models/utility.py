@@ -16,5 +16,7 @@ class Utilities(BillableAssoc):
 
     __mapper_args__ = {
         "polymorphic_identity": "Utilities",
+        # subclass columns come with every base class load instead of a lazy SELECT
+        "polymorphic_load": "inline",
         "inherit_condition": utility_id == BillableAssoc.billable_assoc_id,
     }
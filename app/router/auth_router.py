@@ -1,5 +1,4 @@
 import uuid
-import asyncio
 from typing import List, Union
 from fastapi import Depends, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -19,7 +18,7 @@ from app.router.base_router import BaseCRUDRouter
 
 # schemas
 from app.schema.schemas import UserSchema
-from app.schema.auth import Login, ResetPassword
+from app.schema.auth import AuthUser, Login, ResetPassword
 
 RESET_LINK = "https://housekee.netlify.app/account-recovery?token={}"
 UNSUBSCRIBE_LINK = (
@@ -44,7 +43,7 @@ class AuthRouter(BaseCRUDRouter):
     def register_routes(self):
         @self.router.post("/")
         async def user_login(request: Login, db: AsyncSession = Depends(self.get_db)):
-            current_user: User = await self.user_dao.user_exists(
+            current_user: AuthUser = await self.dao.get_auth_user(
                 db_session=db, email=request.username
             )
 
@@ -60,8 +59,9 @@ class AuthRouter(BaseCRUDRouter):
                         status_code=401, detail="Please set your password first!"
                     )
 
-                if await self.dao.verify_password(db_session=db, login_info=request):
-                    current_user.update_last_login_time()
+                if await self.dao.verify_password(current_user, request.password):
+                    await self.dao.record_login(db, current_user.user_id)
+                    await self.dao.rehash_password(db, current_user, request.password)
 
                     return await self.dao.authenticate_user(current_user=current_user)
                 else:
@@ -89,19 +89,19 @@ class AuthRouter(BaseCRUDRouter):
                 current_user.password = None
                 email_service = EmailService()
 
-                response = await self.dao.commit_and_refresh(
-                    db_session=db, obj=current_user
+                # queued in the same transaction as the reset token
+                await email_service.send_reset_password_email(
+                    db,
+                    current_user.email,
+                    current_user.first_name + " " + current_user.last_name,
+                    RESET_LINK.format(current_user.reset_token),
+                    UNSUBSCRIBE_LINK.format(
+                        current_user.email, current_user.is_subscribed_token
+                    ),
                 )
 
-                asyncio.create_task(
-                    email_service.send_reset_password_email(
-                        current_user.email,
-                        current_user.first_name + " " + current_user.last_name,
-                        RESET_LINK.format(current_user.reset_token),
-                        UNSUBSCRIBE_LINK.format(
-                            current_user.email, current_user.is_subscribed_token
-                        ),
-                    )
+                response = await self.dao.commit_and_refresh(
+                    db_session=db, obj=current_user
                 )
 
                 if response:
@@ -1,14 +1,23 @@
 from uuid import UUID
-from functools import reduce
+from functools import reduce, wraps
+from urllib.parse import urlencode
+import asyncio
 from sqlalchemy import inspect
 from pydantic import BaseModel, ConfigDict, create_model
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import Any, List, TypeVar, Generic, Optional, Union
+from typing import Any, Dict, List, Type, TypeVar, Generic, Optional, Union
 from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.routing import APIRoute
+from fastapi.concurrency import run_in_threadpool
 
 from app.dao.resources.base_dao import BaseDAO
-from app.utils.response import DAOResponse
-from app.utils.lifespan import get_db
+from app.db.dbCrud import UtilsMixin
+from app.db.dbLoadPlan import LoadPlan
+from app.db.dbUnitOfWork import UnitOfWork
+from app.db.dbPagination import CountStrategy, InvalidCursorException, Pagination
+from app.db.dbProjection import InvalidProjectionException, Projection
+from app.utils.response import DAOJSONResponse, DAOResponse
+from app.utils.lifespan import get_db, get_read_db
 from app.schema.base_schema import SchemasDictType
 
 DBModelType = TypeVar("DBModelType")
@@ -79,6 +88,71 @@ def create_pydantic_model_from_sqlalchemy(
     return pydantic_model
 
 
+class DAORoute(APIRoute):
+    """
+    Route that renders DAOResponse return values straight to JSON bytes.
+
+    FastAPI would otherwise validate the returned envelope against the
+    response model and run it through jsonable_encoder before encoding it.
+    That only skips the bare DAOResponse envelope, which filters nothing.
+    Routes that declare a narrower response model, like
+    DAOResponse[List[MessageResponseModel]], are still validated and
+    filtered by FastAPI.
+    """
+
+    def __init__(self, path: str, endpoint, **kwargs):
+        status_code = kwargs.get("status_code") or status.HTTP_200_OK
+
+        @wraps(endpoint)
+        async def render_endpoint(*args, **endpoint_kwargs):
+            if asyncio.iscoroutinefunction(endpoint):
+                result = await endpoint(*args, **endpoint_kwargs)
+            else:
+                result = await run_in_threadpool(endpoint, *args, **endpoint_kwargs)
+
+            if isinstance(result, DAOResponse) and self.renders_directly:
+                return DAOJSONResponse(content=result, status_code=status_code)
+
+            return result
+
+        super().__init__(path, render_endpoint, **kwargs)
+
+        # set by the return annotation or the route's response_model
+        self.renders_directly = self.response_model in (None, DAOResponse)
+
+
+# generated response models, keyed by (model, parents, children, excludes)
+pydantic_models: Dict[tuple, Type[BaseModel]] = {}
+
+
+def get_pydantic_model(
+    sqlalchemy_model,
+    load_parent_relationships=False,
+    load_child_relationships=False,
+    excludes=[],
+):
+    """
+    Returns the response model for a sqlalchemy model, generating it only the
+    first time a combination is asked for.
+    """
+    key = (
+        sqlalchemy_model,
+        load_parent_relationships,
+        load_child_relationships,
+        tuple(excludes),
+    )
+
+    if key not in pydantic_models:
+        pydantic_models[key] = create_pydantic_model_from_sqlalchemy(
+            sqlalchemy_model,
+            load_parent_relationships=load_parent_relationships,
+            load_child_relationships=load_child_relationships,
+            excludes=list(excludes),
+        )
+
+    return pydantic_models[key]
+
+
 class BaseCRUDRouter(Generic[DBModelType]):
     # nesting type
     NESTED_CHILD = "nested_child"
@@ -92,14 +166,24 @@ class BaseCRUDRouter(Generic[DBModelType]):
         prefix: str = "",
         tags: List[str] = [],
         show_default_routes=True,
+        show_batch_routes=False,
     ):
         self.model_schema = schemas["model_schema"]
         self.create_schema = schemas["create_schema"]
         self.update_schema = schemas["update_schema"]
         self.model_pk = schemas["primary_keys"]
-        self.router = APIRouter(prefix=prefix, tags=tags)
+        self.router = APIRouter(prefix=prefix, tags=tags, route_class=DAORoute)
         self.dao = dao
         self.get_db = get_db
+        self.get_read_db = get_read_db
+
+        # generated here once so the first request doesn't pay for it
+        self.response_model = get_pydantic_model(
+            self.dao.model,
+            load_parent_relationships=self.dao.load_parent_relationships,
+            load_child_relationships=self.dao.load_child_relationships,
+            excludes=self.dao.excludes,
+        )
 
         if show_default_routes:
             self.add_get_all_route()
@@ -108,50 +192,123 @@ class BaseCRUDRouter(Generic[DBModelType]):
             self.add_update_route()
             self.add_delete_route()
 
+        # batch inserts skip any custom dao create logic, so routers opt in
+        if show_batch_routes:
+            self.add_batch_create_route()
+
     def get_session_db(request: Request):
         return request.state.db
 
+    def get_projection(
+        self, fields: Optional[str], expand: Optional[str]
+    ) -> Optional[Projection]:
+        # without either parameter the dao's own response is used
+        if not fields and not expand:
+            return None
+
+        return Projection(
+            self.dao.model,
+            fields=fields,
+            expand=expand,
+            allowed=self.dao.expandable_paths(),
+        )
+
     def add_get_all_route(self):
         @self.router.get("/")
         async def get_all(
             request: Request,
             limit: int = Query(default=10, ge=1),
             offset: int = Query(default=0, ge=0),
-            db: AsyncSession = Depends(self.get_db),
+            cursor: Optional[str] = Query(default=None),
+            count: Optional[CountStrategy] = Query(default=None),
+            fields: Optional[str] = Query(default=None),
+            expand: Optional[str] = Query(default=None),
+            db: AsyncSession = Depends(self.get_read_db),
         ) -> DAOResponse:
-            items = await self.dao.get_all(db_session=db, offset=offset, limit=limit)
+            try:
+                pagination = Pagination(limit=limit, offset=offset, cursor=cursor)
+                projection = self.get_projection(fields, expand)
+            except (InvalidCursorException, InvalidProjectionException) as e:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)
+                )
+
+            items = (
+                await self.dao.get_all_projected(
+                    db_session=db, projection=projection, pagination=pagination
+                )
+                if projection
+                else await self.dao.get_all(
+                    db_session=db, offset=offset, limit=limit, pagination=pagination
+                )
+            )
 
             if items is None:
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND, detail="No items found"
                 )
 
-            # get url path
+            # get url path, keeping the projection on the page links
             base_url = request.url.path
-
-            total = await self.dao.query_count(db_session=db)
-            next_offset = offset + limit
-            previous_offset = offset - limit if offset - limit >= 0 else 0
-
-            next_link = (
-                f"{base_url}?limit={limit}&offset={next_offset}"
-                if next_offset < total
-                else None
+            page_query = urlencode(
+                [
+                    (key, value)
+                    for key, value in (
+                        ("limit", limit),
+                        ("fields", fields),
+                        ("expand", expand),
+                    )
+                    if value
+                ]
             )
-            previous_link = (
-                f"{base_url}?limit={limit}&offset={previous_offset}"
-                if offset > 0
-                else None
+
+            # keyset pages skip the count unless a strategy is asked for
+            count = count or (
+                CountStrategy.none if pagination.is_keyset else CountStrategy.exact
             )
+            total = await self.dao.query_count(db_session=db, strategy=count)
+
+            if pagination.is_keyset:
+                next_link = (
+                    f"{base_url}?{page_query}&cursor={pagination.next_cursor}"
+                    if pagination.next_cursor
+                    else None
+                )
+                previous_link = (
+                    f"{base_url}?{page_query}&cursor={pagination.previous_cursor}"
+                    if pagination.previous_cursor
+                    else None
+                )
+            else:
+                next_offset = offset + limit
+                previous_offset = offset - limit if offset - limit >= 0 else 0
+
+                next_link = (
+                    f"{base_url}?{page_query}&offset={next_offset}"
+                    if pagination.has_more
+                    else None
+                )
+                previous_link = (
+                    f"{base_url}?{page_query}&offset={previous_offset}"
+                    if offset > 0
+                    else None
+                )
 
             meta = {
-                "total": total,
                 "limit": limit,
-                "offset": offset,
                 "next": next_link,
                 "previous": previous_link,
+                "next_cursor": pagination.next_cursor,
+                "previous_cursor": pagination.previous_cursor,
+                "has_more": pagination.has_more,
+                "count": count.value,
             }
 
+            if not pagination.is_keyset:
+                meta["offset"] = offset
+            if total is not None:
+                meta["total"] = total
+
             # check if anything was passed on from dao
             meta = reduce(
                 lambda acc, item: {**item[1], **acc}
@@ -161,12 +318,14 @@ class BaseCRUDRouter(Generic[DBModelType]):
                 {},
             )
 
-            dynamic_model = create_pydantic_model_from_sqlalchemy(
-                self.dao.model,
-                load_parent_relationships=self.dao.load_parent_relationships,
-                load_child_relationships=self.dao.load_child_relationships,
-                excludes=self.dao.excludes,
-            )
+            if projection:
+                response_model = projection.response_model()
+
+                return DAOResponse[List[Any]](
+                    success=True,
+                    data=[response_model.model_validate(item) for item in items],
+                    meta=meta,
+                )
 
             if self.dao.load_child_relationships:
                 return DAOResponse[List[Any]](
@@ -184,7 +343,7 @@ class BaseCRUDRouter(Generic[DBModelType]):
                 else DAOResponse(
                     success=True,
                     data=[
-                        dynamic_model.model_validate(
+                        self.response_model.model_validate(
                             item, strict=False, from_attributes=True
                         )
                         for item in items
@@ -196,22 +355,38 @@ class BaseCRUDRouter(Generic[DBModelType]):
     def add_get_route(self):
         @self.router.get("/{id}")
         async def get(
-            id: Union[UUID | str], db: AsyncSession = Depends(self.get_db)
+            id: Union[UUID | str],
+            fields: Optional[str] = Query(default=None),
+            expand: Optional[str] = Query(default=None),
+            db: AsyncSession = Depends(self.get_read_db),
         ) -> DAOResponse:
+            try:
+                projection = self.get_projection(fields, expand)
+            except InvalidProjectionException as e:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)
+                )
+
             # item = await self.dao.query(db_session=db, filters={f"{self.model_pk[0]}": id}, single=True)
-            item = await self.dao.get(db_session=db, id=id)
+            item = (
+                await self.dao.get_projected(
+                    db_session=db, id=id, projection=projection
+                )
+                if projection
+                else await self.dao.get(
+                    db_session=db, id=id, load_plan=LoadPlan.DETAIL
+                )
+            )
 
             if item is None:
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND, detail="Item not found"
                 )
 
-            dynamic_model = create_pydantic_model_from_sqlalchemy(
-                self.dao.model,
-                load_parent_relationships=self.dao.load_parent_relationships,
-                load_child_relationships=self.dao.load_child_relationships,
-                excludes=self.dao.excludes,
-            )
+            if projection:
+                return DAOResponse[Any](
+                    success=True, data=projection.response_model().model_validate(item)
+                )
 
             if self.dao.load_child_relationships:
                 return DAOResponse[Any](
@@ -223,7 +398,7 @@ class BaseCRUDRouter(Generic[DBModelType]):
                 if isinstance(item, DAOResponse)
                 else DAOResponse[Any](
                     success=True,
-                    data=dynamic_model.model_validate(
+                    data=self.response_model.model_validate(
                         item, strict=False, from_attributes=True
                     ),
                 )
@@ -238,6 +413,9 @@ class BaseCRUDRouter(Generic[DBModelType]):
                 # TODO: Changed this from item.dict() to item.model_dump()
                 item = await self.dao.create(db_session=db, obj_in=item.model_dump())
 
+                # load what the deferred refreshes would have before serializing
+                await UnitOfWork.refresh_pending(db)
+
                 return (
                     item
                     if isinstance(item, DAOResponse)
@@ -248,6 +426,57 @@ class BaseCRUDRouter(Generic[DBModelType]):
                     status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)
                 )
 
+    def add_batch_create_route(self):
+        @self.router.post("/batch", status_code=status.HTTP_200_OK)
+        async def create_many(
+            items: List[self.create_schema],
+            on_conflict: Optional[List[str]] = Query(default=None),
+            db: AsyncSession = Depends(self.get_db),
+        ) -> DAOResponse:
+            columns = inspect(self.dao.model).columns.keys()
+            rows = []
+
+            for item in items:
+                item = item.model_dump()
+                nested = [k for k, v in item.items() if k not in columns and v]
+
+                if nested:
+                    raise HTTPException(
+                        status_code=status.HTTP_400_BAD_REQUEST,
+                        detail=f"Batch create does not support nested fields: {nested}",
+                    )
+
+                # unset values are left out so column defaults still apply
+                rows.append(
+                    {k: v for k, v in item.items() if k in columns and v is not None}
+                )
+
+            unknown = [field for field in on_conflict or [] if field not in columns]
+            if unknown:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"Unknown conflict fields: {unknown}",
+                )
+
+            try:
+                keys = (
+                    await self.dao.upsert_many(
+                        db_session=db, objs_in=rows, index_elements=on_conflict
+                    )
+                    if on_conflict
+                    else await self.dao.create_many(db_session=db, objs_in=rows)
+                )
+
+                return DAOResponse[List[Any]](
+                    success=True,
+                    data=[list(key) if isinstance(key, tuple) else key for key in keys],
+                    meta={"total": len(keys)},
+                )
+            except Exception as e:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)
+                )
+
     def add_update_route(self):
         @self.router.put("/{id}")
         async def update(
@@ -256,8 +485,12 @@ class BaseCRUDRouter(Generic[DBModelType]):
             db: AsyncSession = Depends(self.get_db),
         ) -> DAOResponse:
             # changed this from 'self.model_pk[0]' to self.dao.primary_key
+            # updates walk and return what the detail response shows
             db_item = await self.dao.query(
-                db_session=db, filters={f"{self.dao.primary_key}": id}, single=True
+                db_session=db,
+                filters={f"{self.dao.primary_key}": UtilsMixin.is_valid_uuid(id)},
+                single=True,
+                load_plan=LoadPlan.DETAIL,
             )
             if not db_item:
                 raise HTTPException(
@@ -266,6 +499,9 @@ class BaseCRUDRouter(Generic[DBModelType]):
             try:
                 item = await self.dao.update(db_session=db, db_obj=db_item, obj_in=item)
 
+                # load what the deferred refreshes would have before serializing
+                await UnitOfWork.refresh_pending(db)
+
                 return (
                     item
                     if isinstance(item, DAOResponse)
@@ -283,7 +519,9 @@ class BaseCRUDRouter(Generic[DBModelType]):
         ):
             # changed this from 'self.model_pk[0]' to self.dao.primary_key
             db_item = await self.dao.query(
-                db_session=db, filters={f"{self.dao.primary_key}": id}, single=True
+                db_session=db,
+                filters={f"{self.dao.primary_key}": UtilsMixin.is_valid_uuid(id)},
+                single=True,
             )
 
             if not db_item:
@@ -35,7 +35,7 @@ class InvoiceRouter(BaseCRUDRouter):
             request: Request,
             limit: int = Query(default=10, ge=1),
             offset: int = Query(default=0, ge=0),
-            db: AsyncSession = Depends(self.get_db),
+            db: AsyncSession = Depends(self.get_read_db),
         ):
             lease = await self.dao.get_leases_due(
                 db_session=db, offset=offset, limit=limit
@@ -47,7 +47,9 @@ class InvoiceRouter(BaseCRUDRouter):
             return lease
 
         @self.router.get("/user_lease_due/")
-        async def user_lease_due(user_id: str, db: AsyncSession = Depends(self.get_db)):
+        async def user_lease_due(
+            user_id: str, db: AsyncSession = Depends(self.get_read_db)
+        ):
             lease = await self.dao.get_leases_due(db_session=db, user_id=user_id)
 
             if lease is None:
@@ -1,4 +1,9 @@
+import re
+import mimetypes
 from typing import List
+from pydantic import ValidationError
+from fastapi import Depends, HTTPException, Request, status
+from sqlalchemy.ext.asyncio import AsyncSession
 
 # daos
 from app.dao.resources.media_dao import MediaDAO
@@ -6,9 +11,17 @@ from app.dao.resources.media_dao import MediaDAO
 # routers
 from app.router.base_router import BaseCRUDRouter
 
+# utils
+from app.utils.response import DAOResponse
+from app.utils.uploads import receive_upload
+from app.utils.file_response import RangeFileResponse
+
+# services
+from app.services.media_storage import LocalStorage, storage_backend
+
 # schemas
 from app.schema.schemas import MediaSchema
-from app.schema.media import MediaCreateSchema, MediaUpdateSchema
+from app.schema.media import MediaCreateSchema, MediaUpdateSchema, MediaUploadSchema
 
 
 class MediaRouter(BaseCRUDRouter):
@@ -24,4 +37,67 @@ class MediaRouter(BaseCRUDRouter):
         self.register_routes()
 
     def register_routes(self):
-        pass
+        @self.router.get("/files/{key}")
+        async def get_media_file(key: str, request: Request) -> RangeFileResponse:
+            """
+            Serves a file of the local media store, honouring Range requests.
+            """
+            storage = storage_backend()
+
+            if not isinstance(storage, LocalStorage) or not re.fullmatch(
+                r"[0-9a-f]{64}(-\d+w)?\.\w+", key
+            ):
+                raise HTTPException(status_code=404, detail="File not found")
+
+            if not storage.exists(key):
+                raise HTTPException(status_code=404, detail="File not found")
+
+            return RangeFileResponse(
+                storage.path(key),
+                request.headers,
+                media_type=mimetypes.guess_type(key)[0],
+                etag=key.split(".")[0],
+                # content addressed, a url never points at other bytes
+                headers={"cache-control": "public, max-age=31536000, immutable"},
+            )
+
+        @self.router.post("/upload", status_code=status.HTTP_200_OK)
+        async def upload_media(
+            request: Request, db: AsyncSession = Depends(self.get_db)
+        ) -> DAOResponse:
+            """
+            Creates media from a multipart/form-data body with a `file` part.
+
+            The file is streamed to disk and hashed as it arrives instead of
+            being sent base64 encoded inside a JSON body.
+            """
+            fields, files = await receive_upload(request)
+            upload = files.pop("file", None)
+
+            for extra in files.values():
+                extra.discard()
+
+            if upload is None:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Missing file part",
+                )
+
+            try:
+                media_info = MediaUploadSchema(**fields)
+            except ValidationError as e:
+                upload.discard()
+                raise HTTPException(
+                    status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e)
+                )
+
+            result = await self.dao.create_from_upload(
+                db_session=db, obj_in=media_info, upload=upload
+            )
+
+            if not result.success:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST, detail=result.error
+                )
+
+            return result
@@ -1,9 +1,12 @@
 from uuid import UUID
-from typing import List
-from fastapi import HTTPException, Depends
-from sqlalchemy import and_, or_, select, desc
+from datetime import datetime
+from typing import Any, Awaitable, Dict, List, Optional
+from fastapi import HTTPException, Depends, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+# db
+from app.db.dbPagination import InvalidCursorException
+
 # daos
 from app.dao.communication.message_dao import MessageDAO
 
@@ -15,13 +18,29 @@ from app.router.base_router import BaseCRUDRouter
 
 # models
 from app.models.message import Message
-from app.models.message_recipient import MessageRecipient
-from app.models.property_unit_assoc import PropertyUnitAssoc
-from app.models.under_contract import UnderContract
 
 # schemas
 from app.schema.schemas import MessageSchema
-from app.schema.message import MessageCreate, MessageReply, MessageResponseModel
+from app.schema.message import (
+    MessageCreate,
+    MessageReadUpdate,
+    MessageReply,
+    MessageResponseModel,
+)
+
+
+def page_params(
+    limit: int = Query(default=50, ge=1, le=200),
+    cursor: Optional[str] = Query(default=None),
+    since: Optional[datetime] = Query(default=None),
+) -> Dict[str, Any]:
+    """
+    Newest-first page of a message listing.
+
+    `cursor` continues from a previous page's `next_cursor`, `since` only
+    returns messages created after it for incremental sync.
+    """
+    return {"limit": limit, "cursor": cursor, "since": since}
 
 
 class MessageRouter(BaseCRUDRouter):
@@ -34,6 +53,12 @@ class MessageRouter(BaseCRUDRouter):
         super().__init__(dao=self.dao, schemas=MessageSchema, prefix=prefix, tags=tags)
         self.register_routes()
 
+    async def listing(self, page: Awaitable[DAOResponse]) -> DAOResponse:
+        try:
+            return await page
+        except InvalidCursorException as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
     def register_routes(self):
         @self.router.post("/reply/")
         async def reply_to_message(
@@ -65,21 +90,14 @@ class MessageRouter(BaseCRUDRouter):
             response_model=DAOResponse[List[MessageResponseModel]],
         )
         async def get_user_drafts(
-            user_id: UUID, db: AsyncSession = Depends(self.get_db)
+            user_id: UUID,
+            page: Dict[str, Any] = Depends(page_params),
+            db: AsyncSession = Depends(self.get_read_db),
         ):
-            messages: List[Message] = await self.dao.query(
-                db_session=db,
-                filters={
-                    "sender_id": user_id,
-                    "is_draft": True,
-                    "is_scheduled": False,
-                    "is_notification": False,
-                },
-            )
-
-            return DAOResponse[List[MessageResponseModel]](
-                success=True,
-                data=[MessageResponseModel.from_orm_model(r) for r in messages],
+            return await self.listing(
+                self.dao.get_sent(
+                    db_session=db, sender_id=user_id, is_draft=True, **page
+                )
             )
 
         @self.router.get(
@@ -87,21 +105,14 @@ class MessageRouter(BaseCRUDRouter):
             response_model=DAOResponse[List[MessageResponseModel]],
         )
         async def get_user_scheduled(
-            user_id: UUID, db: AsyncSession = Depends(self.get_db)
+            user_id: UUID,
+            page: Dict[str, Any] = Depends(page_params),
+            db: AsyncSession = Depends(self.get_read_db),
         ):
-            messages: List[Message] = await self.dao.query(
-                db_session=db,
-                filters={
-                    "sender_id": user_id,
-                    "is_scheduled": True,
-                    "is_draft": False,
-                    "is_notification": False,
-                },
-            )
-
-            return DAOResponse[List[MessageResponseModel]](
-                success=True,
-                data=[MessageResponseModel.from_orm_model(r) for r in messages],
+            return await self.listing(
+                self.dao.get_sent(
+                    db_session=db, sender_id=user_id, is_scheduled=True, **page
+                )
             )
 
         @self.router.get(
@@ -109,22 +120,12 @@ class MessageRouter(BaseCRUDRouter):
             response_model=DAOResponse[List[MessageResponseModel]],
         )
         async def get_user_outbox(
-            user_id: UUID, db: AsyncSession = Depends(self.get_db)
+            user_id: UUID,
+            page: Dict[str, Any] = Depends(page_params),
+            db: AsyncSession = Depends(self.get_read_db),
         ):
-            messages: List[Message] = await self.dao.query(
-                db_session=db,
-                filters={
-                    "sender_id": user_id,
-                    "is_draft": False,
-                    "is_scheduled": False,
-                    "is_notification": False,
-                },
-                order_by=[desc(Message.date_created)],
-            )
-
-            return DAOResponse[List[MessageResponseModel]](
-                success=True,
-                data=[MessageResponseModel.from_orm_model(r) for r in messages],
+            return await self.listing(
+                self.dao.get_sent(db_session=db, sender_id=user_id, **page)
             )
 
         @self.router.get(
@@ -132,69 +133,12 @@ class MessageRouter(BaseCRUDRouter):
             response_model=DAOResponse[List[MessageResponseModel]],
         )
         async def get_user_inbox(
-            user_id: UUID, db: AsyncSession = Depends(self.get_db)
+            user_id: UUID,
+            page: Dict[str, Any] = Depends(page_params),
+            db: AsyncSession = Depends(self.get_read_db),
         ):
-            # Asynchronously fetch the user's groups and contract dates
-            user_contracts_stmt = (
-                select(UnderContract)
-                .join(
-                    PropertyUnitAssoc,
-                    PropertyUnitAssoc.property_unit_assoc_id
-                    == UnderContract.property_unit_assoc_id,
-                )
-                .where(UnderContract.client_id == user_id)
-            )
-            contracts_result = await db.execute(user_contracts_stmt)
-            contracts = contracts_result.scalars().all()
-            contract_periods = [
-                (
-                    contract.property_unit_assoc_id,
-                    contract.start_date,
-                    contract.end_date,
-                )
-                for contract in contracts
-            ]
-
-            # Construct a list of group IDs for use in the next query
-            if not contract_periods:
-                contract_periods = []
-
-            # Filter messages based on whether the send date is within any of the contract periods
-            inbox_stmt = (
-                select(Message)
-                .join(
-                    MessageRecipient, Message.message_id == MessageRecipient.message_id
-                )
-                .where(
-                    Message.is_draft is False,
-                    Message.is_scheduled is False,
-                    Message.is_notification is False,
-                    or_(
-                        MessageRecipient.recipient_id == user_id,
-                        and_(
-                            MessageRecipient.recipient_group_id.in_(
-                                [cp[0] for cp in contract_periods]
-                            ),
-                            or_(
-                                *[
-                                    and_(
-                                        MessageRecipient.msg_send_date >= cp[1],
-                                        MessageRecipient.msg_send_date <= cp[2],
-                                    )
-                                    for cp in contract_periods
-                                ]
-                            ),
-                        ),
-                    ),
-                )
-                .order_by(Message.date_created.desc())
-            )
-            inbox_messages_result = await db.execute(inbox_stmt)
-            inbox_messages = inbox_messages_result.scalars().all()
-
-            return DAOResponse[List[MessageResponseModel]](
-                success=True,
-                data=[MessageResponseModel.from_orm_model(r) for r in inbox_messages],
+            return await self.listing(
+                self.dao.get_inbox(db_session=db, user_id=user_id, **page)
             )
 
         @self.router.get(
@@ -202,67 +146,34 @@ class MessageRouter(BaseCRUDRouter):
             response_model=DAOResponse[List[MessageResponseModel]],
         )
         async def get_user_notifications(
-            user_id: UUID, db: AsyncSession = Depends(self.get_db)
+            user_id: UUID,
+            page: Dict[str, Any] = Depends(page_params),
+            db: AsyncSession = Depends(self.get_read_db),
         ):
-            # Asynchronously fetch the user's groups and contract dates
-            user_contracts_stmt = (
-                select(UnderContract)
-                .join(
-                    PropertyUnitAssoc,
-                    PropertyUnitAssoc.property_unit_assoc_id
-                    == UnderContract.property_unit_assoc_id,
+            return await self.listing(
+                self.dao.get_inbox(
+                    db_session=db, user_id=user_id, is_notification=True, **page
                 )
-                .where(UnderContract.client_id == user_id)
             )
-            contracts_result = await db.execute(user_contracts_stmt)
-            contracts = contracts_result.scalars().all()
-            contract_periods = [
-                (
-                    contract.property_unit_assoc_id,
-                    contract.start_date,
-                    contract.end_date,
-                )
-                for contract in contracts
-            ]
 
-            # Construct a list of group IDs for use in the next query
-            if not contract_periods:
-                contract_periods = []
-
-            # Filter messages based on whether the send date is within any of the contract periods
-            inbox_stmt = (
-                select(Message)
-                .join(
-                    MessageRecipient, Message.message_id == MessageRecipient.message_id
-                )
-                .where(
-                    Message.is_draft is False,
-                    Message.is_scheduled is False,
-                    Message.is_notification is True,
-                    or_(
-                        MessageRecipient.recipient_id == user_id,
-                        and_(
-                            MessageRecipient.recipient_group_id.in_(
-                                [cp[0] for cp in contract_periods]
-                            ),
-                            or_(
-                                *[
-                                    and_(
-                                        MessageRecipient.msg_send_date >= cp[1],
-                                        MessageRecipient.msg_send_date <= cp[2],
-                                    )
-                                    for cp in contract_periods
-                                ]
-                            ),
-                        ),
-                    ),
-                )
-                .order_by(Message.date_created.desc())
-            )
-            inbox_messages_result = await db.execute(inbox_stmt)
-            inbox_messages = inbox_messages_result.scalars().all()
+        @self.router.get(
+            "/users/{user_id}/unread",
+            response_model=DAOResponse[Dict[str, int]],
+        )
+        async def get_user_unread_counts(
+            user_id: UUID, db: AsyncSession = Depends(self.get_read_db)
+        ):
+            return await self.dao.get_unread_counts(db_session=db, user_id=user_id)
 
-            return DAOResponse[List[MessageResponseModel]](
-                success=True,
-                data=[MessageResponseModel.from_orm_model(r) for r in inbox_messages],
+        @self.router.put(
+            "/users/{user_id}/read",
+            response_model=DAOResponse[Dict[str, int]],
+        )
+        async def mark_user_messages_read(
+            user_id: UUID,
+            read_update: MessageReadUpdate,
+            db: AsyncSession = Depends(self.get_db),
+        ):
+            return await self.dao.mark_read(
+                db_session=db, user_id=user_id, message_ids=read_update.message_ids
             )
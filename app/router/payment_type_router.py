@@ -12,7 +12,11 @@ class PaymentTypeRouter(BaseCRUDRouter):
         )
 
         super().__init__(
-            dao=self.dao, schemas=PaymentTypeSchema, prefix=prefix, tags=tags
+            dao=self.dao,
+            schemas=PaymentTypeSchema,
+            prefix=prefix,
+            tags=tags,
+            show_batch_routes=True,
         )
         self.register_routes()
 
@@ -19,7 +19,11 @@ class PropertyUnitRouter(BaseCRUDRouter):
         )
 
         super().__init__(
-            dao=self.dao, schemas=PropertyUnitSchema, prefix=prefix, tags=tags
+            dao=self.dao,
+            schemas=PropertyUnitSchema,
+            prefix=prefix,
+            tags=tags,
+            show_batch_routes=True,
         )
         self.register_routes()
 
@@ -4,6 +4,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.dao.auth.role_dao import RoleDAO
 from app.router.base_router import BaseCRUDRouter
+from app.utils.rbac import require_permissions
 
 # schemas
 from app.schema.schemas import RoleSchema
@@ -23,7 +24,11 @@ class RoleRouter(BaseCRUDRouter):
         self.register_routes()
 
     def register_routes(self):
-        @self.router.post("/add_permission")
+        # granting permissions changes what users can do
+        @self.router.post(
+            "/add_permission",
+            dependencies=[Depends(require_permissions("update_users"))],
+        )
         async def add_permission(
             role_alias: str,
             permission_alias: str,
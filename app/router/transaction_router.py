@@ -23,7 +23,7 @@ class TransactionRouter(BaseCRUDRouter):
 
     def register_routes(self):
         @self.router.get("/status/")
-        async def transaction_status(db: AsyncSession = Depends(self.get_db)):
+        async def transaction_status(db: AsyncSession = Depends(self.get_read_db)):
             transaction_status = await self.dao.get_transaction_status(db_session=db)
 
             if transaction_status is None:
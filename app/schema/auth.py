@@ -3,7 +3,7 @@ from pydantic import BaseModel, ConfigDict
 from typing import List, Optional
 
 # schemas
-from app.schema.role import Role
+from app.schema.role import Role, RoleResponse
 
 
 class Token(BaseModel):
@@ -48,6 +48,45 @@ class TokenExposed(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class AuthUser(BaseModel):
+    """
+    Model for the credentials and scopes read at login, without the user's relationships.
+
+    Attributes:
+        user_id (UUID): The unique identifier for the user.
+        first_name (str): User's first name.
+        last_name (str): User's last name.
+        email (str): User's email.
+        phone_number (Optional[str]): User's phone number.
+        identification_number (Optional[str]): User's identification number.
+        photo_url (Optional[str]): The URL of the user's photo.
+        date_of_birth (Optional[str]): The date of birth of the user.
+        password (Optional[str]): The stored password hash.
+        login_provider (Optional[str]): The provider the user signs in with.
+        is_verified (Optional[bool]): Whether the user's email is verified.
+        is_disabled (Optional[bool]): Whether the account is disabled.
+        roles (List[RoleResponse]): Roles assigned to the user, without their permissions.
+        permissions (List[str]): Names of the permissions granted by the user's roles.
+    """
+
+    user_id: UUID
+    first_name: Optional[str] = None
+    last_name: Optional[str] = None
+    email: str
+    phone_number: Optional[str] = None
+    identification_number: Optional[str] = None
+    photo_url: Optional[str] = None
+    date_of_birth: Optional[str] = None
+    password: Optional[str] = None
+    login_provider: Optional[str] = None
+    is_verified: Optional[bool] = None
+    is_disabled: Optional[bool] = None
+    roles: List[RoleResponse] = []
+    permissions: List[str] = []
+
+    model_config = ConfigDict(from_attributes=True)
+
+
 class TokenData(BaseModel):
     """
     Model for extracting email information from a token.
@@ -1,6 +1,6 @@
 from uuid import UUID
 from pydantic import BaseModel, ConfigDict, constr
-from typing import Annotated, Optional
+from typing import Annotated, Dict, Optional
 
 
 class EntityMediaCreateSchema(BaseModel):
@@ -48,6 +48,8 @@ class Media(BaseModel):
 
     Attributes:
         media_id (UUID): The unique identifier for the media.
+        variants (Optional[Dict[str, Dict[str, str]]]): Urls of the resized copies by format and width.
+        thumbnail_url (Optional[str]): Url of the smallest copy, for listings.
     """
 
     media_id: UUID
@@ -57,6 +59,8 @@ class Media(BaseModel):
     is_thumbnail: Optional[bool] = None
     caption: Optional[str] = None
     description: Optional[str] = None
+    variants: Optional[Dict[str, Dict[str, str]]] = None
+    thumbnail_url: Optional[str] = None
 
     model_config = ConfigDict(from_attributes=True)
 
@@ -81,6 +85,22 @@ class MediaCreateSchema(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class MediaUploadSchema(BaseModel):
+    """
+    Schema for the form fields sent with a streamed media upload.
+
+    Attributes:
+        media_name (str): The name of the media.
+        media_type (Optional[str]): The type of the media, taken from the file when missing.
+    """
+
+    media_name: Annotated[str, constr(max_length=128)]
+    media_type: Optional[str] = None
+    is_thumbnail: Optional[bool] = False
+    caption: Optional[str] = None
+    description: Optional[str] = None
+
+
 class MediaUpdateSchema(MediaBase):
     """
     Schema for updating media information.
@@ -112,6 +132,8 @@ class MediaResponse(Media):
         media_name (str): The name of the media.
         media_type (str): The type of the media.
         content_url (str): The URL where the media content is located.
+        variants (Optional[Dict[str, Dict[str, str]]]): Urls of the resized copies by format and width.
+        thumbnail_url (Optional[str]): Url of the smallest copy, for listings.
     """
 
     media_id: Optional[UUID] = None
@@ -121,6 +143,8 @@ class MediaResponse(Media):
     is_thumbnail: Optional[bool]
     caption: Optional[str] = None
     description: Optional[str] = None
+    variants: Optional[Dict[str, Dict[str, str]]] = None
+    thumbnail_url: Optional[str] = None
 
     model_config = ConfigDict(from_attributes=True, use_enum_values=True)
 
@@ -143,4 +167,6 @@ class MediaResponse(Media):
             is_thumbnail=media.is_thumbnail,
             caption=media.caption,
             description=media.description,
+            variants=media.variants,
+            thumbnail_url=media.thumbnail_url,
         ).model_dump()
@@ -73,6 +73,19 @@ class MessageReply(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class MessageReadUpdate(BaseModel):
+    """
+    Schema for marking messages as read.
+
+    Attributes:
+        message_ids (List[UUID]): The messages the user has read.
+    """
+
+    message_ids: List[UUID]
+
+    model_config = ConfigDict(from_attributes=True)
+
+
 class MessageResponseModel(BaseModel, UserBaseMixin):
     """
     Model for representing a message response.
@@ -93,6 +106,8 @@ class MessageResponseModel(BaseModel, UserBaseMixin):
         date_created (Optional[datetime]): The date the message was created.
         scheduled_date (Optional[datetime]): The scheduled date for the message.
         next_remind_date (Optional[datetime]): The next reminder date for the message.
+        recipient_count (Optional[int]): Users the message was addressed to, on create and in listings.
+        recipient_group_count (Optional[int]): Units the message was sent to, on create and in listings.
     """
 
     message_id: Optional[UUID] = None
@@ -110,6 +125,8 @@ class MessageResponseModel(BaseModel, UserBaseMixin):
     date_created: Optional[datetime] = None
     scheduled_date: Optional[datetime] = None
     next_remind_date: Optional[datetime] = None
+    recipient_count: Optional[int] = None
+    recipient_group_count: Optional[int] = None
 
     model_config = ConfigDict(
         from_attributes=True,
@@ -119,22 +136,30 @@ class MessageResponseModel(BaseModel, UserBaseMixin):
     )
 
     @classmethod
-    def from_orm_model(cls, message: MessageModel) -> "MessageResponseModel":
+    def from_orm_model(
+        cls, message: MessageModel, with_recipients: bool = True
+    ) -> "MessageResponseModel":
         """
         Create a MessageResponseModel instance from an ORM model.
 
         Args:
             message (MessageModel): Message ORM model.
+            with_recipients (bool): Whether to list the loaded recipients.
 
         Returns:
             MessageResponseModel: Message response object.
         """
 
-        # get message recipients
-        message_recipients = [
-            cls.get_user_info(message_recipients.recipient)
-            for message_recipients in message.recipients
-        ]
+        # get message recipients, group recipients have no user
+        message_recipients = (
+            [
+                cls.get_user_info(message_recipients.recipient)
+                for message_recipients in message.recipients
+                if message_recipients.recipient is not None
+            ]
+            if with_recipients
+            else None
+        )
 
         return cls(
             message_id=message.message_id,
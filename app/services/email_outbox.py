@@ -0,0 +1,521 @@
+import time
+import uuid
+import asyncio
+import hashlib
+from datetime import datetime, timedelta
+import pytz
+from email.mime.text import MIMEText
+from email.mime.multipart import MIMEMultipart
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
+from smtplib import SMTP, SMTP_SSL, SMTPException, SMTPRecipientsRefused
+from sqlalchemy import and_, event, or_, update
+from sqlalchemy.orm import Session
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.future import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# db
+from app.db.dbManager import DBManager
+from app.db.dbUnitOfWork import UnitOfWork
+
+# models
+from app.models.email_outbox import EmailStatusEnum, OutboxEmail
+
+# utils
+from app.utils.logger import AppLogger
+from app.utils.settings import settings
+
+# schemas
+from app.schema.message import EmailBody
+
+logger = AppLogger().get_logger()
+
+OUTBOX_WRITTEN = "email_outbox_written"
+
+# dialects that can skip a taken key and return the rows they did insert
+DIALECT_INSERTS = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+
+
+class OutgoingEmail(NamedTuple):
+    outbox_id: uuid.UUID
+    idempotency_key: str
+    to: str
+    subject: str
+    message: str
+    attempts: int = 0
+
+
+class SMTPConnection:
+    """
+    One authenticated SMTP connection kept open across sends.
+
+    smtplib is blocking, so every method here runs in a worker thread. A
+    connection belongs to a single outbox worker and is never shared.
+    """
+
+    # a connection idle for longer is checked with NOOP before reuse
+    IDLE_CHECK = 30
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        use_ssl: bool,
+        username: Optional[str],
+        password: Optional[str],
+        timeout: float = 30,
+    ):
+        self.host = host
+        self.port = port
+        self.use_ssl = use_ssl
+        self.username = username
+        self.password = password
+        self.timeout = timeout
+
+        self.server: Optional[SMTP] = None
+        self.last_used = 0.0
+
+    def connect(self):
+        smtp_class = SMTP_SSL if self.use_ssl else SMTP
+        server = smtp_class(self.host, self.port, timeout=self.timeout)
+        server.ehlo()
+
+        # local stand-ins don't offer AUTH
+        if self.password and server.has_extn("auth"):
+            server.login(self.username, self.password)
+
+        self.server = server
+
+    def ensure_connected(self):
+        if self.server is not None and time.monotonic() - self.last_used > (
+            self.IDLE_CHECK
+        ):
+            try:
+                self.server.noop()
+            except (SMTPException, OSError):
+                self.close()
+
+        if self.server is None:
+            self.connect()
+
+    def send_batch(
+        self, sender: str, emails: List[OutgoingEmail]
+    ) -> Dict[uuid.UUID, Tuple[bool, str]]:
+        """
+        Sends the emails over this connection.
+
+        Returns the failures by outbox id, with whether they're worth retrying.
+        """
+        failures = {}
+
+        for email in emails:
+            try:
+                self.ensure_connected()
+                self.server.sendmail(sender, email.to, self.build(sender, email))
+                self.last_used = time.monotonic()
+            except SMTPRecipientsRefused as e:
+                # retrying won't make the address valid
+                failures[email.outbox_id] = (False, str(e.recipients))
+            except (SMTPException, OSError) as e:
+                self.close()
+                failures[email.outbox_id] = (True, str(e))
+
+        return failures
+
+    @staticmethod
+    def build(sender: str, email: OutgoingEmail) -> str:
+        msg = MIMEMultipart()
+        msg["Subject"] = email.subject
+        msg["From"] = sender
+        msg["To"] = email.to
+        # lets the receiving side drop a resend after a lost acknowledgement
+        msg["Message-ID"] = f"<{email.idempotency_key}@{settings.APP_NAME}>"
+        msg.attach(MIMEText(email.message, "html"))
+
+        return msg.as_string()
+
+    def close(self):
+        if self.server is None:
+            return
+
+        try:
+            self.server.quit()
+        except (SMTPException, OSError):
+            self.server.close()
+        finally:
+            self.server = None
+
+
+class EmailOutbox:
+    """
+    Dispatcher for the email_outbox table.
+
+    Emails are rows written in the same transaction as the change that
+    triggers them, so they're sent only if it commits and survive a
+    restart. Workers claim ready rows in batches (FOR UPDATE SKIP LOCKED
+    where supported, and a conditional claim update everywhere) so several
+    of them, in one process or many, drain the table without sending a row
+    twice. Each worker owns one pooled SMTP connection and sends from a
+    thread. Failures are retried with exponential backoff, and a claim left
+    behind by a crashed worker lapses after the lease.
+
+    Usage:
+        await EmailOutbox.enqueue(db_session, EmailBody(...))
+        await email_outbox.start()
+        await email_outbox.stop()
+    """
+
+    def __init__(
+        self,
+        host: str = settings.EMAIL_SERVER,
+        port: int = settings.EMAIL_PORT,
+        use_ssl: bool = settings.EMAIL_USE_SSL,
+        username: str = settings.EMAIL,
+        password: str = settings.EMAIL_PASSWORD,
+        workers: int = settings.EMAIL_WORKERS,
+        batch_size: int = settings.EMAIL_BATCH_SIZE,
+        max_attempts: int = settings.EMAIL_MAX_ATTEMPTS,
+        backoff: float = 1.0,
+        poll_interval: float = settings.EMAIL_POLL_INTERVAL,
+        lease: float = 300.0,
+        session_factory=None,
+    ):
+        self.sender = f"{settings.APP_NAME} <{username}>"
+        self.connections = [
+            SMTPConnection(host, port, use_ssl, username, password)
+            for _ in range(workers)
+        ]
+        self.batch_size = batch_size
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.poll_interval = poll_interval
+        self.lease = lease
+        self.session_factory = session_factory
+
+        self.tasks: List[asyncio.Task] = []
+        self.wakeup = asyncio.Event()
+        self.stopping = False
+
+        self.sent = 0
+        self.dropped = 0
+
+    @staticmethod
+    def event_key(*parts: Any) -> str:
+        """
+        Key for the email a business event sends, e.g. ("reset-password", link).
+        """
+        return hashlib.sha256(
+            "\n".join(str(part) for part in parts).encode("utf-8")
+        ).hexdigest()
+
+    @staticmethod
+    def content_key(body: EmailBody) -> str:
+        return hashlib.sha256(
+            f"{body.to}\n{body.subject}\n{body.message}".encode("utf-8")
+        ).hexdigest()
+
+    @classmethod
+    def idempotency_key(
+        cls, body: EmailBody, key: Optional[str] = None, dedupe: bool = False
+    ) -> str:
+        if key:
+            return key
+
+        # the same content can legitimately go out twice, e.g. a repeated notice
+        return cls.content_key(body) if dedupe else uuid.uuid4().hex
+
+    @classmethod
+    async def enqueue(
+        cls,
+        db_session: AsyncSession,
+        body: EmailBody,
+        idempotency_key: Optional[str] = None,
+        dedupe: bool = False,
+    ) -> Optional[OutboxEmail]:
+        """
+        Adds an email to the caller's transaction, sent once that commits.
+
+        Callers pass the key of the event sending it (see `event_key`) so a
+        retried request doesn't send it twice. Without a key every call is a
+        new email, unless `dedupe` drops repeats of the same content. Returns
+        None for a duplicate.
+        """
+        emails = await cls.enqueue_many(
+            db_session, [body], [idempotency_key], dedupe=dedupe
+        )
+
+        return emails[0] if emails else None
+
+    @classmethod
+    async def enqueue_many(
+        cls,
+        db_session: AsyncSession,
+        bodies: List[EmailBody],
+        idempotency_keys: Optional[List[Optional[str]]] = None,
+        dedupe: bool = False,
+    ) -> List[OutboxEmail]:
+        """
+        Adds many emails to the caller's transaction, skipping duplicates.
+
+        A key that's already taken, by an earlier email or one committed
+        concurrently, is skipped by the insert itself rather than checked
+        first. Returns the emails that were added.
+        """
+        keys = idempotency_keys or [None] * len(bodies)
+
+        rows: Dict[str, Dict[str, Any]] = {}
+        for key, body in zip(keys, bodies):
+            key = cls.idempotency_key(body, key, dedupe)
+
+            # the same key twice in one call is one email as well
+            rows.setdefault(
+                key,
+                {
+                    "idempotency_key": key,
+                    "recipient": body.to,
+                    "subject": body.subject,
+                    "message": body.message,
+                },
+            )
+
+        if not rows:
+            return []
+
+        dialect = db_session.get_bind().dialect.name
+
+        if dialect in DIALECT_INSERTS:
+            query = (
+                DIALECT_INSERTS[dialect](OutboxEmail)
+                .on_conflict_do_nothing(index_elements=["idempotency_key"])
+                .returning(OutboxEmail)
+            )
+            emails = (await db_session.scalars(query, list(rows.values()))).all()
+        else:
+            emails = await cls.add_with_savepoints(db_session, rows.values())
+
+        if emails:
+            db_session.info[OUTBOX_WRITTEN] = True
+
+        return list(emails)
+
+    @staticmethod
+    async def add_with_savepoints(
+        db_session: AsyncSession, rows: Iterable[Dict[str, Any]]
+    ) -> List[OutboxEmail]:
+        """
+        Inserts the rows one savepoint each, a taken key only undoes its own row.
+        """
+        emails = []
+
+        for row in rows:
+            email = OutboxEmail(**row)
+
+            try:
+                async with db_session.begin_nested():
+                    db_session.add(email)
+            except IntegrityError:
+                continue
+
+            emails.append(email)
+
+        return emails
+
+    def get_session(self) -> AsyncSession:
+        session_factory = self.session_factory or DBManager().db_module.Session
+        return session_factory()
+
+    def wake(self):
+        self.wakeup.set()
+
+    async def start(self):
+        if self.tasks:
+            return
+
+        self.stopping = False
+        self.tasks = [
+            asyncio.create_task(self.work(connection))
+            for connection in self.connections
+        ]
+
+    async def work(self, connection: SMTPConnection):
+        while True:
+            self.wakeup.clear()
+
+            try:
+                batch = await self.claim()
+            except Exception as e:
+                logger.error(f"Email outbox claim failed: {e}")
+                batch = []
+
+            if batch:
+                await self.dispatch(connection, batch)
+                continue
+
+            # drained, nothing ready until a commit wakes us or a retry is due
+            if self.stopping:
+                return
+
+            try:
+                await asyncio.wait_for(self.wakeup.wait(), self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+
+    def ready(self, now: datetime):
+        return or_(
+            and_(
+                OutboxEmail.status == EmailStatusEnum.pending,
+                OutboxEmail.available_at <= now,
+            ),
+            and_(
+                OutboxEmail.status == EmailStatusEnum.sending,
+                OutboxEmail.claimed_until < now,
+            ),
+        )
+
+    async def claim(self) -> List[OutgoingEmail]:
+        """
+        Claims a batch of ready rows for this worker.
+        """
+        now, claim_id = datetime.now(pytz.utc), uuid.uuid4()
+
+        async with self.get_session() as db_session:
+            ready_ids = await db_session.execute(
+                select(OutboxEmail.outbox_id)
+                .where(self.ready(now))
+                .order_by(OutboxEmail.available_at)
+                .limit(self.batch_size)
+                .with_for_update(skip_locked=True)
+            )
+            ready_ids = ready_ids.scalars().all()
+
+            if not ready_ids:
+                await db_session.rollback()
+                return []
+
+            # re-checked, databases without row locks can race on the same rows
+            await db_session.execute(
+                update(OutboxEmail)
+                .where(OutboxEmail.outbox_id.in_(ready_ids), self.ready(now))
+                .values(
+                    status=EmailStatusEnum.sending,
+                    claimed_by=claim_id,
+                    claimed_until=now + timedelta(seconds=self.lease),
+                )
+                .execution_options(synchronize_session=False)
+            )
+            claimed = await db_session.execute(
+                select(OutboxEmail).where(OutboxEmail.claimed_by == claim_id)
+            )
+            claimed = claimed.scalars().all()
+            await db_session.commit()
+
+        return [
+            OutgoingEmail(
+                outbox_id=row.outbox_id,
+                idempotency_key=row.idempotency_key,
+                to=row.recipient,
+                subject=row.subject,
+                message=row.message,
+                attempts=row.attempts,
+            )
+            for row in claimed
+        ]
+
+    async def dispatch(self, connection: SMTPConnection, batch: List[OutgoingEmail]):
+        try:
+            failures = await asyncio.to_thread(
+                connection.send_batch, self.sender, batch
+            )
+        except Exception as e:
+            failures = {email.outbox_id: (True, str(e)) for email in batch}
+
+        now = datetime.now(pytz.utc)
+        sent_ids = [
+            email.outbox_id for email in batch if email.outbox_id not in failures
+        ]
+
+        async with self.get_session() as db_session:
+            if sent_ids:
+                await db_session.execute(
+                    update(OutboxEmail)
+                    .where(OutboxEmail.outbox_id.in_(sent_ids))
+                    .values(
+                        status=EmailStatusEnum.sent,
+                        sent_at=now,
+                        claimed_by=None,
+                        claimed_until=None,
+                    )
+                    .execution_options(synchronize_session=False)
+                )
+
+            for email in batch:
+                if email.outbox_id not in failures:
+                    continue
+
+                retryable, error = failures[email.outbox_id]
+                attempts = email.attempts + 1
+                logger.warning(f"Email to {email.to} failed: {error}")
+
+                if retryable and attempts < self.max_attempts:
+                    values = {
+                        "status": EmailStatusEnum.pending,
+                        "available_at": now
+                        + timedelta(seconds=self.backoff * 2 ** (attempts - 1)),
+                    }
+                else:
+                    logger.error(f"Giving up on email to {email.to}")
+                    values = {"status": EmailStatusEnum.failed}
+                    self.dropped += 1
+
+                await db_session.execute(
+                    update(OutboxEmail)
+                    .where(OutboxEmail.outbox_id == email.outbox_id)
+                    .values(
+                        attempts=attempts,
+                        last_error=error,
+                        claimed_by=None,
+                        claimed_until=None,
+                        **values,
+                    )
+                    .execution_options(synchronize_session=False)
+                )
+
+            await db_session.commit()
+
+        self.sent += len(sent_ids)
+
+    async def stop(self, timeout: float = 10):
+        """
+        Sends what's ready, then closes the connections; the rest waits in the table.
+        """
+        self.stopping = True
+        self.wake()
+
+        if self.tasks:
+            done, pending = await asyncio.wait(self.tasks, timeout=timeout)
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+        self.tasks = []
+
+        await asyncio.gather(
+            *[asyncio.to_thread(connection.close) for connection in self.connections]
+        )
+
+
+email_outbox = EmailOutbox()
+
+
+@event.listens_for(Session, "after_commit")
+def wake_email_outbox(session: Session):
+    # emails written by this transaction can go out right away
+    if session.info.pop(OUTBOX_WRITTEN, False):
+        email_outbox.wake()
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def discard_email_outbox_writes(session: Session, previous_transaction):
+    # a savepoint rolling back leaves the rest of the transaction's emails
+    if not UnitOfWork.in_savepoint(previous_transaction):
+        session.info.pop(OUTBOX_WRITTEN, None)
@@ -1,13 +1,26 @@
 from fastapi import status
-from email.mime.text import MIMEText
 from fastapi.exceptions import HTTPException
-from email.mime.multipart import MIMEMultipart
-from jinja2 import Environment, FileSystemLoader
-from smtplib import SMTP_SSL, SMTPAuthenticationError
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from sqlalchemy.ext.asyncio import AsyncSession
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
 
 from app.config import template_path
 from app.utils.settings import settings
 from app.schema.message import EmailBody
+from app.services.email_outbox import EmailOutbox
+
+
+# compiled once per process, the bytecode cache also spares restarts the compile
+template_env = Environment(
+    loader=FileSystemLoader(template_path),
+    bytecode_cache=FileSystemBytecodeCache(),
+    auto_reload=False,
+)
+
+
+def preload_templates():
+    for template_name in template_env.list_templates(extensions=["html"]):
+        template_env.get_template(template_name)
 
 
 class EmailSendException(HTTPException):
@@ -25,52 +38,92 @@ class EmailService:
         self.EMAIL_PASSWORD = settings.EMAIL_PASSWORD
         self.SERVER = settings.EMAIL_SERVER
         self.template_path = template_path
-        self.env = Environment(loader=FileSystemLoader(template_path))
+        self.env = template_env
 
-    async def send_email(self, body: EmailBody):
-        try:
-            msg = MIMEMultipart()
-            msg["Subject"] = body.subject
-            msg["From"] = f"{settings.APP_NAME} <{self.EMAIL}>"
-            msg["To"] = body.to
-            msg.attach(MIMEText(body.message, "html"))
-
-            port = 465  # 587 for TLS , 465 For SSL
-
-            # Connect to the email server
-            with SMTP_SSL(self.SERVER, port) as server:
-                server.ehlo()
-                server.login(self.EMAIL, self.EMAIL_PASSWORD)
-                server.sendmail(self.EMAIL, body.to, msg.as_string())
+    async def send_email(
+        self,
+        db_session: AsyncSession,
+        body: EmailBody,
+        idempotency_key: Optional[str] = None,
+    ):
+        # written with the caller's transaction, sent by the outbox workers
+        await EmailOutbox.enqueue(db_session, body, idempotency_key)
 
-            return {"message": "Email sent successfully"}
-        except SMTPAuthenticationError as e:
-            raise EmailSendException(detail=str(e))
+        return {"message": "Email queued"}
 
     def render_template(self, template_name: str, **context):
         template = self.env.get_template(template_name)
 
         return template.render(context)
 
+    def render_templates(
+        self, template_name: str, contexts: Iterable[Dict[str, Any]]
+    ) -> List[str]:
+        """
+        Renders one template for many contexts, looking the template up once.
+        """
+        template = self.env.get_template(template_name)
+
+        return [template.render(context) for context in contexts]
+
     async def send_template_email(
-        self, to: str, subject: str, template_name: str, **context
+        self,
+        db_session: AsyncSession,
+        to: str,
+        subject: str,
+        template_name: str,
+        idempotency_key: Optional[str] = None,
+        **context,
     ):
         html_content = self.render_template(template_name, **context)
         body = EmailBody(to=to, subject=subject, message=html_content)
 
         try:
-            await self.send_email(body)
+            await self.send_email(db_session, body, idempotency_key)
         except EmailSendException as e:
             error_message = f"Error sending email: {e.detail}"
             raise HTTPException(status_code=500, detail=error_message)
 
+    async def send_bulk_template_email(
+        self,
+        db_session: AsyncSession,
+        subject: str,
+        template_name: str,
+        recipients: List[Tuple[str, Dict[str, Any]]],
+        idempotency_keys: Optional[List[str]] = None,
+    ):
+        """
+        Queues one email per (address, context) pair, e.g. a notice to every tenant.
+
+        Sending the same notice again queues it again, unless it's given the
+        keys of the first send.
+        """
+        messages = self.render_templates(
+            template_name, [context for _, context in recipients]
+        )
+        bodies = [
+            EmailBody(to=to, subject=subject, message=message)
+            for (to, _), message in zip(recipients, messages)
+        ]
+
+        emails = await EmailOutbox.enqueue_many(db_session, bodies, idempotency_keys)
+
+        return {"message": f"{len(emails)} emails queued"}
+
     async def send_user_email(
-        self, user_email: str, user_name: str, verify_link: str, subscription_link: str
+        self,
+        db_session: AsyncSession,
+        user_email: str,
+        user_name: str,
+        verify_link: str,
+        subscription_link: str,
     ):
         return await self.send_template_email(
+            db_session=db_session,
             to=user_email,
             subject="New Account Created",
             template_name="confirmEmail.html",
+            idempotency_key=EmailOutbox.event_key("confirm-email", verify_link),
             first_name=user_name,
             user_email=user_email,
             verify_link=verify_link,
@@ -78,12 +131,19 @@ class EmailService:
         )
 
     async def send_welcome_email(
-        self, user_email: str, username: str, link: str, subscription_link: str
+        self,
+        db_session: AsyncSession,
+        user_email: str,
+        username: str,
+        link: str,
+        subscription_link: str,
     ):
         return await self.send_template_email(
+            db_session=db_session,
             to=user_email,
             subject=f"Welcome to {settings.APP_NAME}",
             template_name="welcome.html",
+            idempotency_key=EmailOutbox.event_key("welcome", user_email),
             first_name=username,
             user_email=user_email,
             reset_link=link,
@@ -91,12 +151,19 @@ class EmailService:
         )
 
     async def send_reset_password_email(
-        self, email: str, username: str, reset_link: str, subscription_link: str
+        self,
+        db_session: AsyncSession,
+        email: str,
+        username: str,
+        reset_link: str,
+        subscription_link: str,
     ):
         return await self.send_template_email(
+            db_session=db_session,
             to=email,
             subject="Reset Password Request",
             template_name="passwordReset.html",
+            idempotency_key=EmailOutbox.event_key("reset-password", reset_link),
             first_name=username,
             user_email=email,
             reset_link=reset_link,
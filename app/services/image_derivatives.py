@@ -0,0 +1,109 @@
+import cv2
+import asyncio
+import numpy as np
+import multiprocessing
+from typing import Dict, Iterable, Optional, Union
+from concurrent.futures import ProcessPoolExecutor
+
+# encoder and its parameters for every derivative format
+FORMATS = {
+    "webp": (".webp", [cv2.IMWRITE_WEBP_QUALITY, 80]),
+    "jpeg": (".jpg", [cv2.IMWRITE_JPEG_QUALITY, 82, cv2.IMWRITE_JPEG_PROGRESSIVE, 1]),
+}
+
+
+def read_image(content: Union[bytes, str]) -> Optional[np.ndarray]:
+    if isinstance(content, str):
+        content = np.fromfile(content, dtype=np.uint8)
+    else:
+        content = np.frombuffer(content, dtype=np.uint8)
+
+    return cv2.imdecode(content, cv2.IMREAD_UNCHANGED)
+
+
+def flatten(image: np.ndarray) -> np.ndarray:
+    """
+    Three channel 8-bit BGR copy of the image, transparency composited on white.
+    """
+    if image.dtype == np.uint16:
+        image = (image // 257).astype(np.uint8)
+
+    if image.ndim == 2:
+        return cv2.cvtColor(image, cv2.COLOR_GRAY2BGR)
+
+    if image.shape[2] == 4:
+        alpha = image[:, :, 3:4].astype(np.float32) / 255.0
+        colour = image[:, :, :3].astype(np.float32)
+        return (colour * alpha + 255.0 * (1.0 - alpha)).astype(np.uint8)
+
+    return image
+
+
+def render_derivatives(
+    content: Union[bytes, str], widths: Iterable[int]
+) -> Dict[str, Dict[str, bytes]]:
+    """
+    Encodes the image at each width narrower than it, in every format.
+
+    Runs in a worker process. Returns `{format: {width: bytes}}`, empty when
+    the content isn't an image OpenCV can decode.
+    """
+    image = read_image(content)
+    if image is None:
+        return {}
+
+    image = flatten(image)
+    height, width = image.shape[:2]
+
+    derivatives: Dict[str, Dict[str, bytes]] = {name: {} for name in FORMATS}
+
+    # widest first, each size is scaled down from the previous one
+    for target_width in sorted(set(widths), reverse=True):
+        if target_width >= width:
+            continue
+
+        target_height = max(1, round(height * target_width / width))
+        image = cv2.resize(
+            image, (target_width, target_height), interpolation=cv2.INTER_AREA
+        )
+        height, width = image.shape[:2]
+
+        for name, (extension, params) in FORMATS.items():
+            encoded, buffer = cv2.imencode(extension, image, params)
+            if encoded:
+                derivatives[name][str(target_width)] = buffer.tobytes()
+
+    return {name: sizes for name, sizes in derivatives.items() if sizes}
+
+
+class DerivativePool:
+    """
+    Process pool resizing images off the event loop.
+
+    Resizing and encoding hold the GIL for most of their run, so they get
+    processes rather than threads. Workers are spawned on first use, not
+    forked from the running server.
+    """
+
+    def __init__(self, workers: int):
+        self.workers = workers
+        self.executor: Optional[ProcessPoolExecutor] = None
+
+    async def render(
+        self, content: Union[bytes, str], widths: Iterable[int]
+    ) -> Dict[str, Dict[str, bytes]]:
+        if self.executor is None:
+            self.executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.executor, render_derivatives, content, list(widths)
+        )
+
+    def shutdown(self):
+        if self.executor is not None:
+            self.executor.shutdown(wait=True, cancel_futures=True)
+            self.executor = None
@@ -0,0 +1,278 @@
+import asyncio
+from uuid import UUID
+from datetime import datetime
+import pytz
+from typing import List, Optional
+from sqlalchemy import (
+    and_,
+    case,
+    event,
+    exists,
+    func,
+    insert,
+    literal,
+    select,
+    union,
+    update,
+)
+from sqlalchemy.orm import Session
+from sqlalchemy.dialects import mysql, postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# db
+from app.db.dbManager import DBManager
+
+# models
+from app.models.message import Message
+from app.models.user_mailbox import UserMailbox
+from app.models.under_contract import UnderContract
+from app.models.message_recipient import MessageRecipient
+
+# utils
+from app.utils.logger import AppLogger
+from app.utils.settings import settings
+
+logger = AppLogger().get_logger()
+
+MAILBOX_PENDING = "user_mailbox_pending"
+
+DIALECT_INSERTS = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+    "mysql": mysql.insert,
+}
+
+
+def pending_messages():
+    # drafts and scheduled messages are fanned out once they're sent
+    return and_(
+        Message.delivered_at.is_(None),
+        Message.is_draft.isnot(True),
+        Message.is_scheduled.isnot(True),
+    )
+
+
+def fan_out_query(dialect: str, message_ids: List[UUID]):
+    """
+    INSERT .. SELECT of the mailbox rows for the messages.
+
+    A message reaches the users it names and the clients under contract for
+    a unit when it was sent. Rows already there are left alone, so their
+    read state survives a second fan-out.
+    """
+    direct = select(
+        MessageRecipient.recipient_id.label("user_id"),
+        MessageRecipient.message_id,
+        case((MessageRecipient.is_read.is_(True), 1), else_=0).label("is_read"),
+    ).where(
+        MessageRecipient.message_id.in_(message_ids),
+        MessageRecipient.recipient_id.isnot(None),
+    )
+    group = (
+        select(
+            UnderContract.client_id.label("user_id"),
+            MessageRecipient.message_id,
+            literal(0).label("is_read"),
+        )
+        .join(
+            UnderContract,
+            and_(
+                UnderContract.property_unit_assoc_id
+                == MessageRecipient.recipient_group_id,
+                MessageRecipient.msg_send_date >= UnderContract.start_date,
+                MessageRecipient.msg_send_date <= UnderContract.end_date,
+            ),
+        )
+        .where(
+            MessageRecipient.message_id.in_(message_ids),
+            UnderContract.client_id.isnot(None),
+        )
+    )
+    recipients = union(direct, group).subquery()
+
+    # a user reached both ways reads it as read if either says so
+    rows = (
+        select(
+            recipients.c.user_id,
+            recipients.c.message_id,
+            Message.is_notification,
+            func.max(recipients.c.is_read) == 1,
+            Message.date_created,
+            func.now(),
+        )
+        .join(Message, Message.message_id == recipients.c.message_id)
+        .group_by(
+            recipients.c.user_id,
+            recipients.c.message_id,
+            Message.is_notification,
+            Message.date_created,
+        )
+    )
+
+    columns = [
+        "user_id",
+        "message_id",
+        "is_notification",
+        "is_read",
+        "created_at",
+        "updated_at",
+    ]
+
+    if dialect not in DIALECT_INSERTS:
+        # no upsert to lean on, skip the rows that are already there. Two
+        # workers racing on a batch can still collide, the loser retries it
+        rows = rows.where(
+            ~exists().where(
+                UserMailbox.user_id == recipients.c.user_id,
+                UserMailbox.message_id == recipients.c.message_id,
+            )
+        )
+        return insert(UserMailbox).from_select(columns, rows)
+
+    query = DIALECT_INSERTS[dialect](UserMailbox).from_select(columns, rows)
+
+    # mysql has no ON CONFLICT, setting a key to itself leaves the row alone
+    if dialect == "mysql":
+        return query.on_duplicate_key_update(user_id=query.table.c.user_id)
+
+    return query.on_conflict_do_nothing(index_elements=["user_id", "message_id"])
+
+
+class MailboxFanout:
+    """
+    Background writer of the user_mailbox table.
+
+    A sent message is pending until its mailbox rows exist. Workers resolve
+    pending messages in batches, direct and unit recipients in one INSERT ..
+    SELECT per batch, then mark them delivered. The insert ignores rows
+    that are already there, so two processes fanning out the same batch
+    write each row once and nothing needs claiming. A commit that created
+    messages wakes the worker, polling catches drafts and scheduled
+    messages once they're sent.
+
+    Usage:
+        await mailbox_fanout.start()
+        await mailbox_fanout.drain()
+        await mailbox_fanout.stop()
+    """
+
+    def __init__(
+        self,
+        batch_size: int = settings.MAILBOX_BATCH_SIZE,
+        poll_interval: float = settings.MAILBOX_POLL_INTERVAL,
+        session_factory=None,
+    ):
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.session_factory = session_factory
+
+        self.task: Optional[asyncio.Task] = None
+        self.wakeup = asyncio.Event()
+        self.stopping = False
+
+        self.delivered = 0
+
+    def get_session(self) -> AsyncSession:
+        session_factory = self.session_factory or DBManager().db_module.Session
+        return session_factory()
+
+    def wake(self):
+        self.wakeup.set()
+
+    async def start(self):
+        if self.task:
+            return
+
+        self.stopping = False
+        self.task = asyncio.create_task(self.work())
+
+    async def work(self):
+        while True:
+            self.wakeup.clear()
+
+            try:
+                delivered = await self.drain()
+            except Exception as e:
+                logger.error(f"Mailbox fan-out failed: {e}")
+                delivered = 0
+
+            if self.stopping:
+                return
+
+            if delivered:
+                continue
+
+            try:
+                await asyncio.wait_for(self.wakeup.wait(), self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+
+    async def fan_out(self, db_session: AsyncSession) -> int:
+        """
+        Fans out one batch of pending messages, returns how many.
+        """
+        message_ids = await db_session.execute(
+            select(Message.message_id)
+            .where(pending_messages())
+            .order_by(Message.date_created)
+            .limit(self.batch_size)
+        )
+        message_ids = message_ids.scalars().all()
+
+        if not message_ids:
+            await db_session.rollback()
+            return 0
+
+        dialect = db_session.get_bind().dialect.name
+        await db_session.execute(fan_out_query(dialect, message_ids))
+        await db_session.execute(
+            update(Message)
+            .where(Message.message_id.in_(message_ids))
+            .values(delivered_at=datetime.now(pytz.utc))
+            .execution_options(synchronize_session=False)
+        )
+        await db_session.commit()
+
+        return len(message_ids)
+
+    async def drain(self) -> int:
+        """
+        Fans out batches until nothing is pending, returns the message count.
+        """
+        delivered = 0
+
+        async with self.get_session() as db_session:
+            while batch := await self.fan_out(db_session):
+                delivered += batch
+
+        self.delivered += delivered
+        return delivered
+
+    async def stop(self, timeout: float = 10):
+        """
+        Finishes the pending batches, what's left is picked up on the next start.
+        """
+        self.stopping = True
+        self.wake()
+
+        if self.task:
+            try:
+                await asyncio.wait_for(self.task, timeout)
+            except asyncio.TimeoutError:
+                pass
+        self.task = None
+
+
+mailbox_fanout = MailboxFanout()
+
+
+@event.listens_for(Session, "after_commit")
+def wake_mailbox_fanout(session: Session):
+    # messages sent by this transaction can reach their mailboxes right away
+    if session.info.pop(MAILBOX_PENDING, False):
+        mailbox_fanout.wake()
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def discard_mailbox_pending(session: Session, previous_transaction):
+    session.info.pop(MAILBOX_PENDING, None)
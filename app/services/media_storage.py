@@ -0,0 +1,175 @@
+import io
+import os
+import uuid
+import shutil
+import urllib.request
+import cloudinary
+import cloudinary.api
+import cloudinary.utils
+import cloudinary.uploader
+import cloudinary.exceptions
+from functools import lru_cache
+from abc import ABC, abstractmethod
+from typing import Dict, Optional, Type, Union
+
+# utils
+from app.utils.settings import settings
+
+# raw bytes or the path of a file to store
+Content = Union[bytes, str]
+
+# where the media router serves local files
+LOCAL_FILES_PATH = "/media/files"
+
+
+class StorageBackend(ABC):
+    """
+    Where media content is kept.
+
+    Keys are content addressed, `<folder>/<sha256>.<extension>`, so storing
+    the same bytes twice is a no-op and stored content never changes. The
+    folder only groups files for backends that show it. Methods block and
+    are called from the upload executor, not the event loop.
+    """
+
+    @abstractmethod
+    def put(self, key: str, content: Content) -> str:
+        """
+        Stores the content under the key unless it's already there, returns its url.
+        """
+
+    @abstractmethod
+    def get(self, key: str) -> bytes:
+        pass
+
+    @abstractmethod
+    def exists(self, key: str) -> bool:
+        pass
+
+    @abstractmethod
+    def delete(self, key: str):
+        pass
+
+    @abstractmethod
+    def url(self, key: str) -> str:
+        pass
+
+
+class CloudinaryStorage(StorageBackend):
+    def __init__(self, folder: Optional[str] = None):
+        cloudinary.config(
+            cloud_name=settings.CLOUDINARY_CLOUD_NAME,
+            api_key=settings.CLOUDINARY_API_KEY,
+            api_secret=settings.CLOUDINARY_API_SECRET,
+        )
+
+        self.folder = (folder or settings.APP_NAME).lower()
+
+    def public_id(self, key: str) -> str:
+        # cloudinary keeps the format apart from the id
+        return f"{self.folder}/{os.path.splitext(key)[0]}"
+
+    def put(self, key: str, content: Content) -> str:
+        # an existing id is returned as stored instead of being uploaded again
+        upload_result = cloudinary.uploader.upload(
+            io.BytesIO(content) if isinstance(content, bytes) else content,
+            resource_type="auto",
+            public_id=self.public_id(key),
+            overwrite=False,
+        )
+
+        return upload_result["secure_url"]
+
+    def get(self, key: str) -> bytes:
+        with urllib.request.urlopen(self.url(key)) as response:
+            return response.read()
+
+    def exists(self, key: str) -> bool:
+        try:
+            cloudinary.api.resource(self.public_id(key))
+            return True
+        except cloudinary.exceptions.NotFound:
+            return False
+
+    def delete(self, key: str):
+        cloudinary.uploader.destroy(self.public_id(key), invalidate=True)
+
+    def url(self, key: str) -> str:
+        extension = os.path.splitext(key)[1].lstrip(".")
+
+        return cloudinary.utils.cloudinary_url(
+            self.public_id(key), format=extension or None, secure=True
+        )[0]
+
+
+class LocalStorage(StorageBackend):
+    """
+    Content-addressed store on the local filesystem.
+
+    Files are stored by hash alone, identical content under different
+    folders is one file. They are sharded into two levels of directories by
+    the first characters of the hash, `ab/cd/abcd...png`, so no directory
+    grows past a few thousand entries, and are served by the media router.
+    """
+
+    def __init__(self, root: Optional[str] = None, base_url: Optional[str] = None):
+        self.root = root or settings.MEDIA_ROOT
+        self.base_url = (base_url or settings.MEDIA_URL).rstrip("/")
+
+    def path(self, key: str) -> str:
+        # the folder isn't part of the address
+        key = os.path.basename(key)
+
+        return os.path.join(self.root, key[0:2], key[2:4], key)
+
+    def put(self, key: str, content: Content) -> str:
+        path = self.path(key)
+
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+
+            # written aside and renamed, readers never see half a file
+            partial_path = f"{path}.{uuid.uuid4().hex}.part"
+            if isinstance(content, bytes):
+                with open(partial_path, "wb") as file:
+                    file.write(content)
+            else:
+                shutil.move(content, partial_path)
+            os.replace(partial_path, path)
+
+        return self.url(key)
+
+    def get(self, key: str) -> bytes:
+        with open(self.path(key), "rb") as file:
+            return file.read()
+
+    def exists(self, key: str) -> bool:
+        return os.path.isfile(self.path(key))
+
+    def delete(self, key: str):
+        try:
+            os.unlink(self.path(key))
+        except FileNotFoundError:
+            pass
+
+    def url(self, key: str) -> str:
+        return f"{self.base_url}/{os.path.basename(key)}"
+
+
+STORAGE_BACKENDS: Dict[str, Type[StorageBackend]] = {
+    "cloudinary": CloudinaryStorage,
+    "local": LocalStorage,
+}
+
+
+@lru_cache
+def storage_backend(name: Optional[str] = None) -> StorageBackend:
+    """
+    The configured storage backend, `MEDIA_STORAGE` unless named.
+    """
+    name = name or settings.MEDIA_STORAGE
+
+    if name not in STORAGE_BACKENDS:
+        raise ValueError(f"Unknown media storage backend: {name}")
+
+    return STORAGE_BACKENDS[name]()
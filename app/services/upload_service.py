@@ -1,19 +1,51 @@
 import re
-import uuid
-import cloudinary
-import cloudinary.api
-import cloudinary.uploader
+import base64
+import asyncio
+import hashlib
+import binascii
+from typing import Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
 
 # utils
 from app.utils.settings import settings
+from app.utils.logger import AppLogger
 from app.utils.response import DAOResponse
 
+# services
+from app.services.media_storage import StorageBackend, storage_backend
+from app.services.image_derivatives import DerivativePool
+
+logger = AppLogger().get_logger()
+
 
 class MediaUploaderService:
-    def __init__(self, base64_image, file_name, media_type="general"):
+    # uploads wait on the network or the disk, threads run them off the event loop
+    executor = ThreadPoolExecutor(
+        max_workers=settings.MEDIA_UPLOAD_WORKERS, thread_name_prefix="media-upload"
+    )
+    # resizing is cpu bound and runs in worker processes
+    derivative_pool = DerivativePool(workers=settings.MEDIA_DERIVATIVE_WORKERS)
+
+    def __init__(
+        self,
+        base64_image=None,
+        file_name=None,
+        media_type="general",
+        file_path=None,
+        content_type=None,
+        storage: Optional[StorageBackend] = None,
+    ):
         self.base64_image = base64_image
         self.file_name = file_name
         self.media_type = media_type
+        self.storage = storage or storage_backend()
+
+        # streamed uploads arrive spooled to disk, already hashed
+        self.file_path = file_path
+        self.content_type = content_type
+
+        self.content: Optional[bytes] = None
+        self.content_hash: Optional[str] = None
 
     def get_image_type(self):
         """
@@ -25,49 +57,97 @@ class MediaUploaderService:
         Returns:
             str: The image type (e.g., 'jpeg', 'png', 'gif') or None if not found.
         """
+        if self.content_type and self.content_type.startswith("image/"):
+            return self.content_type.split("/", 1)[1]
+
         # use regex to find the image type
-        match = re.match(r"data:image/(?P<type>.+?);base64,", self.base64_image)
+        match = re.match(r"data:image/(?P<type>.+?);base64,", self.base64_image or "")
         if match:
             return match.group("type")
         return None
 
-    def check_filename_exists(self):
+    def is_encoded(self) -> bool:
+        # anything else is a url to media that is already stored
+        return bool(re.match(r"data:[^;,]+;base64,", self.base64_image or ""))
+
+    def digest(self) -> Optional[str]:
+        """
+        Decodes the base64 content and returns its SHA-256, None for urls.
+        """
+        if self.content_hash or not self.is_encoded():
+            return self.content_hash
+
         try:
-            result = cloudinary.api.resources(type="upload", prefix=self.file_name)
-            resources = result.get("resources", [])
-
-            # check if the filename exists
-            for resource in resources:
-                if resource["public_id"] == self.file_name:
-                    return True
-            return False
-        except Exception as e:
-            print(f"Error checking file_name: {e}")
-            return False
+            encoded = self.base64_image.split(",", 1)[1]
+            self.content = base64.b64decode(encoded, validate=True)
+        except (binascii.Error, ValueError) as e:
+            raise ValueError(f"Invalid base64 media content: {e}")
 
-    def upload(self):
-        # specify folder name
-        folder_name = str(settings.APP_NAME + "/" + self.media_type + "/").lower()
+        self.content_hash = hashlib.sha256(self.content).hexdigest()
+        return self.content_hash
+
+    def storage_key(self) -> str:
+        extension = self.get_image_type() or "bin"
 
-        # replace spaces with underscore
-        file_name = re.sub(r"\s+", "_", self.file_name)
+        return f"{self.media_type}/{self.content_hash}.{extension}".lower()
 
-        # TODO: Implement searching image information and returning it if already exists
-        if self.check_filename_exists():
-            file_name = file_name + "_" + str(uuid.uuid4())
+    def upload(self):
+        if self.file_path is None and not self.is_encoded():
+            return DAOResponse(success=True, data={"content_url": self.base64_image})
 
         try:
-            # upload an image
-            upload_result = cloudinary.uploader.upload(
-                self.base64_image,
-                resource_type="auto",
-                public_id=self.file_name,
-                folder=folder_name,
-            )
+            if self.content_hash is None:
+                self.digest()
 
-            # return upload_result['secure_url']
-            return DAOResponse(
-                success=True, data={"content_url": upload_result["secure_url"]}
+            content_url = self.storage.put(
+                self.storage_key(), self.file_path or self.content
             )
+
+            return DAOResponse(success=True, data={"content_url": content_url})
         except Exception as e:
             return DAOResponse(success=False, error=f"{str(e)}")
+
+    def store_derivatives(
+        self, derivatives: Dict[str, Dict[str, bytes]]
+    ) -> Dict[str, Dict[str, str]]:
+        """
+        Stores the rendered sizes next to the original, returns their urls.
+        """
+        return {
+            name: {
+                width: self.storage.put(
+                    f"{self.media_type}/{self.content_hash}-{width}w.{name}".lower(),
+                    content,
+                )
+                for width, content in sizes.items()
+            }
+            for name, sizes in derivatives.items()
+        }
+
+    async def run(self, fn):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, fn)
+
+    async def digest_async(self) -> Optional[str]:
+        return await self.run(self.digest)
+
+    async def upload_async(self) -> DAOResponse:
+        return await self.run(self.upload)
+
+    async def render_derivatives_async(self) -> Dict[str, Dict[str, bytes]]:
+        if self.get_image_type() is None or not settings.MEDIA_DERIVATIVE_WIDTHS:
+            return {}
+
+        # derivatives are a nicety, a failure leaves the original in place
+        try:
+            return await self.derivative_pool.render(
+                self.file_path or self.content, settings.MEDIA_DERIVATIVE_WIDTHS
+            )
+        except Exception as e:
+            logger.error(f"Rendering derivatives of {self.file_name} failed: {e}")
+            return {}
+
+    async def store_derivatives_async(
+        self, derivatives: Dict[str, Dict[str, bytes]]
+    ) -> Dict[str, Dict[str, str]]:
+        return await self.run(lambda: self.store_derivatives(derivatives))
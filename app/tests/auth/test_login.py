@@ -1,11 +1,43 @@
-# import pytest
-# from httpx import AsyncClient
-
-# @pytest.mark.asyncio(scope="session")
-# async def test_user_login(client: AsyncClient):
-#     response = await client.post("/auth/", json={"username": "admin@housekee.com", "password": "tester"})
-#     assert response.status_code == 200
-#     assert "access_token" in response.json()
+import pytest
+from httpx import AsyncClient
+
+from app.utils.jwt.token_cache import TokenCache
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_user_login(client: AsyncClient):
+    response = await client.post(
+        "/auth/", json={"username": "admin@housekee.com", "password": "tester"}
+    )
+    assert response.status_code == 200
+    assert "access_token" in response.json()
+    assert "view_users" in response.json()["scope"].split(",")
+    assert [role["alias"] for role in response.json()["roles"]] == ["admin"]
+
+    response = await client.post(
+        "/auth/", json={"username": "admin@housekee.com", "password": "wrong"}
+    )
+    assert response.status_code == 401
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_token_cache(client: AsyncClient):
+    response = await client.post(
+        "/auth/", json={"username": "admin@housekee.com", "password": "tester"}
+    )
+    token = response.json()["access_token"]
+    cache = TokenCache(max_size=1)
+
+    assert "view_users" in cache.verify(token).scopes
+    assert cache.verify(token) is not None
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 1
+
+    assert cache.verify("not.a.token") is None
+    assert cache.stats()["size"] == 1
+
+    cache.revoke(token)
+    assert cache.verify(token) is None
+
 
 # # @pytest.mark.asyncio(scope="session")
 # # async def test_reset_password(client: AsyncClient):
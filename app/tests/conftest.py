@@ -1,10 +1,16 @@
+import os
 import pytest
+import tempfile
 from fastapi import FastAPI
 from typing import AsyncGenerator
 from httpx import AsyncClient, ASGITransport
 
+# media goes to a scratch directory instead of cloudinary
+os.environ.setdefault("MEDIA_STORAGE", "local")
+os.environ.setdefault("MEDIA_ROOT", tempfile.mkdtemp(prefix="media-"))
+
 # local imports
-from main import app
+from main import app  # noqa: E402
 
 
 @pytest.fixture(scope="session")
@@ -0,0 +1,234 @@
+import uuid
+import asyncio
+import pytest
+from typing import List
+from sqlalchemy.future import select
+
+from app.db.dbManager import DBManager
+from app.db.dbUnitOfWork import UnitOfWork
+from app.schema.message import EmailBody
+from app.services.email_outbox import EmailOutbox
+from app.services.email_service import EmailService
+from app.models.email_outbox import EmailStatusEnum, OutboxEmail
+
+
+class SMTPStandIn:
+    """
+    Minimal local SMTP server recording what it receives.
+    """
+
+    def __init__(self, fail_first: int = 0):
+        self.messages: List[str] = []
+        self.connections = 0
+        self.fail_first = fail_first
+
+    async def start(self) -> int:
+        self.server = await asyncio.start_server(self.handle, "127.0.0.1", 0)
+        return self.server.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.connections += 1
+
+        async def reply(line: str):
+            writer.write(f"{line}\r\n".encode())
+            await writer.drain()
+
+        await reply("220 stand-in ready")
+        while line := await reader.readline():
+            command = line.decode().strip().upper()
+
+            if command.startswith("EHLO") or command.startswith("HELO"):
+                await reply("250 stand-in")
+            elif command == "DATA":
+                await reply("354 end with <CRLF>.<CRLF>")
+                data = []
+                while (line := await reader.readline()) not in (b".\r\n", b""):
+                    data.append(line.decode())
+
+                if self.fail_first > 0:
+                    self.fail_first -= 1
+                    await reply("451 try again later")
+                else:
+                    self.messages.append("".join(data))
+                    await reply("250 queued")
+            elif command == "QUIT":
+                await reply("221 bye")
+                break
+            else:
+                await reply("250 ok")
+
+        writer.close()
+
+    def received(self, subject: str) -> List[str]:
+        return [
+            message for message in self.messages if f"Subject: {subject}" in message
+        ]
+
+
+async def enqueue(subject: str, count: int):
+    async with DBManager().db_module.Session() as db_session:
+        for i in range(count):
+            body = EmailBody(to=f"user{i}@example.com", subject=subject, message="Hi")
+            key = EmailOutbox.event_key(subject, i)
+            await EmailOutbox.enqueue(db_session, body, key)
+
+        # enqueuing the same event again is a no-op
+        assert await EmailOutbox.enqueue(db_session, body, key) is None
+
+        await db_session.commit()
+
+
+async def statuses(subject: str) -> List[EmailStatusEnum]:
+    async with DBManager().db_module.Session() as db_session:
+        result = await db_session.execute(
+            select(OutboxEmail.status).where(OutboxEmail.subject == subject)
+        )
+        return result.scalars().all()
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_outbox_sends_over_pooled_connections():
+    stand_in = SMTPStandIn()
+    port = await stand_in.start()
+    subject = f"Batch {uuid.uuid4()}"
+
+    await enqueue(subject, 10)
+
+    outbox = EmailOutbox(
+        host="127.0.0.1", port=port, use_ssl=False, password="", workers=2
+    )
+    await outbox.start()
+    await outbox.stop()
+    await stand_in.stop()
+
+    # every row sent exactly once, one connection per worker
+    assert len(stand_in.received(subject)) == 10
+    assert await statuses(subject) == [EmailStatusEnum.sent] * 10
+    assert stand_in.connections <= 2
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_outbox_retries_with_backoff():
+    stand_in = SMTPStandIn(fail_first=2)
+    port = await stand_in.start()
+    subject = f"Retry {uuid.uuid4()}"
+
+    outbox = EmailOutbox(
+        host="127.0.0.1",
+        port=port,
+        use_ssl=False,
+        password="",
+        workers=1,
+        backoff=0.01,
+        poll_interval=0.01,
+    )
+    await outbox.start()
+    await enqueue(subject, 1)
+
+    for _ in range(200):
+        if stand_in.received(subject):
+            break
+        await asyncio.sleep(0.01)
+
+    await outbox.stop()
+    await stand_in.stop()
+
+    assert len(stand_in.received(subject)) == 1
+    assert await statuses(subject) == [EmailStatusEnum.sent]
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_bulk_template_email():
+    subject = f"Notice {uuid.uuid4()}"
+    recipients = [
+        (f"tenant{i}@example.com", {"first_name": f"Tenant {i}"}) for i in range(5)
+    ]
+
+    async with DBManager().db_module.Session() as db_session:
+        await EmailService().send_bulk_template_email(
+            db_session, subject, "welcome.html", recipients
+        )
+        await db_session.commit()
+
+        result = await db_session.execute(
+            select(OutboxEmail.message).where(OutboxEmail.subject == subject)
+        )
+        messages = result.scalars().all()
+
+    assert len(messages) == 5
+    assert all(f"Tenant {i}" in "".join(messages) for i in range(5))
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_repeated_emails_are_queued_unless_deduplicated():
+    subject = f"Repeat {uuid.uuid4()}"
+    body = EmailBody(to="tenant@example.com", subject=subject, message="Rent is due")
+
+    async with DBManager().db_module.Session() as db_session:
+        # the same notice sent twice is two emails
+        assert await EmailOutbox.enqueue(db_session, body) is not None
+        assert await EmailOutbox.enqueue(db_session, body) is not None
+
+        # dropping repeats of the same content is opt-in
+        assert await EmailOutbox.enqueue(db_session, body, dedupe=True) is not None
+        assert await EmailOutbox.enqueue(db_session, body, dedupe=True) is None
+
+        await db_session.commit()
+
+    assert len(await statuses(subject)) == 3
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_taken_keys_are_skipped_by_the_insert():
+    subject = f"Taken {uuid.uuid4()}"
+    bodies = [
+        EmailBody(to=f"user{i}@example.com", subject=subject, message="Hi")
+        for i in range(3)
+    ]
+    keys = [EmailOutbox.event_key(subject, i) for i in range(3)]
+
+    async with DBManager().db_module.Session() as db_session:
+        await EmailOutbox.enqueue(db_session, bodies[0], keys[0])
+        await db_session.commit()
+
+    # a second request racing the first only adds what's new
+    async with DBManager().db_module.Session() as db_session:
+        emails = await EmailOutbox.enqueue_many(db_session, bodies, keys + keys[1:2])
+        await db_session.commit()
+
+    assert [email.recipient for email in emails] == [
+        "user1@example.com",
+        "user2@example.com",
+    ]
+    assert len(await statuses(subject)) == 3
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_savepoints_skip_taken_keys_without_failing_the_unit():
+    # the path taken on dialects without INSERT .. ON CONFLICT DO NOTHING
+    subject = f"Savepoint {uuid.uuid4()}"
+    rows = [
+        {
+            "idempotency_key": EmailOutbox.event_key(subject, i % 2),
+            "recipient": f"user{i}@example.com",
+            "subject": subject,
+            "message": "Hi",
+        }
+        for i in range(3)
+    ]
+
+    async with DBManager().db_module.Session() as db_session:
+        async with UnitOfWork(db_session):
+            emails = await EmailOutbox.add_with_savepoints(db_session, rows)
+
+            assert [email.recipient for email in emails] == [
+                "user0@example.com",
+                "user1@example.com",
+            ]
+            assert UnitOfWork.ROLLBACK_ONLY not in db_session.info
+
+    assert len(await statuses(subject)) == 2
@@ -0,0 +1,92 @@
+import uuid
+import asyncio
+import pytest
+from typing import List
+from contextlib import contextmanager
+from sqlalchemy import event
+from sqlalchemy.future import select
+
+from app.db.dbManager import DBManager
+from app.models.user import User
+from app.models.payment_type import PaymentTypes
+from app.dao.auth.user_dao import UserDAO
+
+user_dao = UserDAO()
+
+
+@contextmanager
+def statements():
+    # every statement the write engine runs inside the block
+    executed: List[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        executed.append(statement)
+
+    engine = DBManager().db_module.engine["write"].sync_engine
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        yield executed
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+
+async def user_ids(db_session) -> List[uuid.UUID]:
+    result = await db_session.execute(select(User.user_id).limit(3))
+    return result.scalars().all()
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_loads_in_one_tick_share_one_query():
+    async with DBManager().db_module.Session() as db_session:
+        ids = await user_ids(db_session)
+        missing = uuid.uuid4()
+
+        with statements() as executed:
+            users = await asyncio.gather(
+                *[user_dao.load(db_session, key) for key in ids + [missing]],
+                user_dao.load(db_session, str(ids[0])),
+            )
+
+        assert len(executed) == 1
+        assert " IN " in executed[0].upper()
+        assert [user.user_id for user in users[: len(ids)]] == ids
+        assert users[len(ids)] is None
+        assert users[-1] is users[0]
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_loaded_rows_and_misses_are_remembered():
+    async with DBManager().db_module.Session() as db_session:
+        ids = await user_ids(db_session)
+        missing = uuid.uuid4()
+
+        first = await user_dao.get_many(db_session, ids + [missing])
+
+        with statements() as executed:
+            again = await user_dao.get_many(db_session, ids + [missing])
+
+        assert executed == []
+        assert again == first
+        assert again[-1] is None
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_flush_and_rollback_clear_the_cache():
+    async with DBManager().db_module.Session() as db_session:
+        ids = await user_ids(db_session)
+        await user_dao.load(db_session, ids[0])
+
+        db_session.add(PaymentTypes(payment_type_name=f"loader_{uuid.uuid4()}"))
+        await db_session.flush()
+
+        with statements() as executed:
+            await user_dao.load(db_session, ids[0])
+
+        assert len(executed) == 1
+
+        await db_session.rollback()
+
+        with statements() as executed:
+            await user_dao.load(db_session, ids[0])
+
+        assert len(executed) == 1
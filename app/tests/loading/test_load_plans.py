@@ -0,0 +1,95 @@
+import pytest
+from datetime import datetime
+from httpx import AsyncClient
+from sqlalchemy.future import select
+
+from app.db.dbManager import DBManager
+from app.models.user import User
+from app.models.message import Message
+from app.models.message_recipient import MessageRecipient
+from app.utils.settings import settings
+
+LIST_ROUTES = [
+    "/users/",
+    "/roles/",
+    "/permissions/",
+    "/property/",
+    "/units/",
+    "/ammenities/",
+    "/media/",
+    "/messages/",
+    "/assign_contracts/",
+    "/property_assignment/",
+    "/contract/",
+    "/invoice/",
+    "/transaction/",
+    "/maintenance_request/",
+    "/calendar_event/",
+    "/tour_booking/",
+    "/utilities/",
+]
+
+
+@pytest.fixture(scope="session")
+async def sent_message():
+    # the messages listing walks the sender and counts recipients
+    async with DBManager().db_module.Session() as db_session:
+        user_id = (
+            await db_session.execute(
+                select(User.user_id).where(User.email == "admin@housekee.com")
+            )
+        ).scalar_one()
+
+        message = Message(subject="Load plan", message_body="Hello", sender_id=user_id)
+        db_session.add(message)
+        await db_session.flush()
+
+        db_session.add(
+            MessageRecipient(
+                message_id=message.message_id,
+                recipient_id=user_id,
+                msg_send_date=datetime(2024, 6, 1),
+                is_read=False,
+            )
+        )
+        await db_session.commit()
+
+
+@pytest.fixture
+def strict_loading(monkeypatch):
+    # anything a response walks outside its DAO's plan raises instead of loading
+    monkeypatch.setattr(settings, "DB_STRICT_LOADING", True)
+
+
+@pytest.mark.asyncio(scope="session")
+@pytest.mark.parametrize("route", LIST_ROUTES)
+async def test_list_routes_stay_within_list_plan(
+    client: AsyncClient, sent_message, strict_loading, route: str
+):
+    response = await client.get(route, params={"limit": 20})
+    assert response.status_code == 200, response.text
+    assert response.json()["success"]
+
+
+@pytest.mark.asyncio(scope="session")
+@pytest.mark.parametrize(
+    "route, key",
+    [
+        ("/users/", "user_id"),
+        ("/property/", "property_unit_assoc_id"),
+        ("/units/", "property_unit_assoc_id"),
+        ("/contract/", "contract_id"),
+    ],
+)
+async def test_list_items_match_their_detail(
+    client: AsyncClient, strict_loading, route: str, key: str
+):
+    # the list plan is a loading concern, it doesn't change the payload
+    listed = (await client.get(route, params={"limit": 20})).json()["data"]
+    if not listed:
+        pytest.skip(f"nothing listed at {route}")
+
+    for item in listed:
+        detail = await client.get(f"{route}{item[key]}")
+        assert detail.status_code == 200, detail.text
+        assert detail.json()["data"] == item
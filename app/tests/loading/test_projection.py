@@ -0,0 +1,48 @@
+import pytest
+
+from app.models.user import User
+from app.dao.auth.user_dao import UserDAO
+from app.db.dbProjection import InvalidProjectionException, Projection
+
+
+def test_projection_reaches_only_expandable_paths():
+    allowed = UserDAO().expandable_paths()
+
+    projection = Projection(User, fields="first_name,roles.name", allowed=allowed)
+    assert projection.expand == {"roles": {}}
+
+    for fields, expand in [
+        ("accounts.bank_account_number", None),
+        (None, "accounts"),
+        (None, "roles.users"),
+    ]:
+        with pytest.raises(InvalidProjectionException):
+            Projection(User, fields=fields, expand=expand, allowed=allowed)
+
+
+def test_projection_depth_is_capped():
+    # even a path the dao allows stops at MAX_DEPTH relationships
+    allowed = ["roles.users.roles.users"]
+
+    Projection(User, expand="roles.users.roles", allowed=allowed)
+    Projection(User, fields="roles.users.roles.name", allowed=allowed)
+
+    with pytest.raises(InvalidProjectionException):
+        Projection(User, expand="roles.users.roles.users", allowed=allowed)
+
+    with pytest.raises(InvalidProjectionException):
+        Projection(User, fields="roles.users.roles.users.email", allowed=allowed)
+
+    with pytest.raises(InvalidProjectionException):
+        Projection(User, fields="roles.users.roles.users", allowed=allowed)
+
+
+def test_response_model_is_built_once_per_selection():
+    allowed = ["roles"]
+
+    first = Projection(User, fields="email,first_name,roles.name", allowed=allowed)
+    second = Projection(User, fields="first_name,roles.name,email", allowed=allowed)
+    other = Projection(User, fields="email,roles.alias", allowed=allowed)
+
+    assert first.response_model() is second.response_model()
+    assert first.response_model() is not other.response_model()
@@ -1,7 +1,16 @@
+import os
+import base64
+import hashlib
+import cv2
 import pytest
+import numpy as np
 from typing import Any, Dict
 from httpx import AsyncClient
 
+from app.utils.settings import settings
+from app.utils.response import DAOResponse
+from app.services.upload_service import MediaUploaderService
+
 
 class TestMedia:
     default_media: Dict[str, Any] = {}
@@ -56,6 +65,12 @@ class TestMedia:
         assert response.status_code == 200
         assert response.json()["data"]["media_name"] == "updated_property_image"
 
+        # the same bytes are linked to the copy stored on create
+        assert response.json()["data"]["content_url"] == (
+            self.default_media["content_url"]
+        )
+        assert response.json()["data"]["variants"] == self.default_media["variants"]
+
     @pytest.mark.asyncio(scope="session")
     @pytest.mark.dependency(depends=["update_media_by_id"], name="delete_media_by_id")
     async def test_delete_media(self, client: AsyncClient):
@@ -67,3 +82,193 @@ class TestMedia:
         # Verify the media is deleted
         response = await client.get(f"/media/{media_id}")
         assert response.status_code == 404
+
+    @pytest.mark.asyncio(scope="session")
+    async def test_identical_media_is_stored_once(self, client: AsyncClient):
+        content = base64.b64encode(os.urandom(64)).decode()
+        content_urls = []
+
+        for media_name in ["front_view", "front_view_copy"]:
+            response = await client.post(
+                "/media/",
+                json={
+                    "media_name": media_name,
+                    "media_type": "png",
+                    "is_thumbnail": False,
+                    "content_url": f"data:image/png;base64,{content}",
+                },
+            )
+            assert response.status_code == 200
+            content_urls.append(response.json()["data"]["content_url"])
+
+        # the second upload links the file the first one stored
+        assert content_urls[0] == content_urls[1]
+
+        file_name = content_urls[0].rsplit("/", 1)[1]
+        stored = [
+            name
+            for _, _, names in os.walk(settings.MEDIA_ROOT)
+            for name in names
+            if name == file_name
+        ]
+        assert len(stored) == 1
+
+    @pytest.mark.asyncio(scope="session")
+    async def test_upload_media_file(self, client: AsyncClient):
+        content = os.urandom(256 * 1024)
+
+        response = await client.post(
+            "/media/upload",
+            data={"media_name": "floor_plan", "caption": "Ground floor"},
+            files={"file": ("floor_plan.png", content, "image/png")},
+        )
+        assert response.status_code == 200
+
+        media = response.json()["data"]
+        assert media["media_type"] == "png"
+        assert media["caption"] == "Ground floor"
+
+        # the same bytes sent base64 encoded link the streamed file
+        response = await client.post(
+            "/media/",
+            json={
+                "media_name": "floor_plan_copy",
+                "media_type": "png",
+                "is_thumbnail": False,
+                "content_url": "data:image/png;base64,"
+                + base64.b64encode(content).decode(),
+            },
+        )
+        assert response.status_code == 200
+        assert response.json()["data"]["content_url"] == media["content_url"]
+
+    @pytest.mark.asyncio(scope="session")
+    async def test_upload_media_limits(self, client: AsyncClient, monkeypatch):
+        monkeypatch.setattr(settings, "MEDIA_MAX_UPLOAD_SIZE", 1024)
+
+        response = await client.post(
+            "/media/upload",
+            data={"media_name": "too_large"},
+            files={"file": ("too_large.png", os.urandom(2048), "image/png")},
+        )
+        assert response.status_code == 413
+
+        # multipart, but without the file part
+        response = await client.post(
+            "/media/upload",
+            data={"media_name": "no_file"},
+            files={"attachment": ("notes.txt", b"notes", "text/plain")},
+        )
+        assert response.status_code == 400
+
+        response = await client.post("/media/upload", json={"media_name": "json"})
+        assert response.status_code == 415
+
+    @pytest.mark.asyncio(scope="session")
+    async def test_get_media_file_ranges(self, client: AsyncClient):
+        content = os.urandom(100 * 1024)
+
+        response = await client.post(
+            "/media/upload",
+            data={"media_name": "tour_video_still"},
+            files={"file": ("still.jpeg", content, "image/jpeg")},
+        )
+        content_url = response.json()["data"]["content_url"]
+
+        # files are sharded by hash prefix on disk
+        key = content_url.rsplit("/", 1)[1]
+        assert os.path.isfile(
+            os.path.join(settings.MEDIA_ROOT, key[0:2], key[2:4], key)
+        )
+
+        response = await client.get(content_url)
+        assert response.status_code == 200
+        assert response.content == content
+        assert response.headers["content-type"] == "image/jpeg"
+        etag = response.headers["etag"]
+
+        response = await client.get(content_url, headers={"Range": "bytes=10-19"})
+        assert response.status_code == 206
+        assert response.content == content[10:20]
+        assert response.headers["content-range"] == f"bytes 10-19/{len(content)}"
+
+        response = await client.get(content_url, headers={"Range": "bytes=-5"})
+        assert response.content == content[-5:]
+
+        response = await client.get(
+            content_url, headers={"Range": f"bytes={len(content)}-"}
+        )
+        assert response.status_code == 416
+
+        response = await client.get(content_url, headers={"If-None-Match": etag})
+        assert response.status_code == 304
+
+        response = await client.get(f"/media/files/{'0' * 64}.png")
+        assert response.status_code == 404
+
+    @pytest.mark.asyncio(scope="session")
+    async def test_media_derivatives(self, client: AsyncClient):
+        image = np.random.randint(0, 255, (900, 1600, 3), dtype=np.uint8)
+        content = cv2.imencode(".png", image)[1].tobytes()
+
+        response = await client.post(
+            "/media/",
+            json={
+                "media_name": "living_room",
+                "media_type": "png",
+                "is_thumbnail": False,
+                "content_url": "data:image/png;base64,"
+                + base64.b64encode(content).decode(),
+            },
+        )
+        assert response.status_code == 200
+
+        media = response.json()["data"]
+        assert set(media["variants"]) == {"webp", "jpeg"}
+        assert set(media["variants"]["webp"]) == set(
+            map(str, settings.MEDIA_DERIVATIVE_WIDTHS)
+        )
+        assert media["thumbnail_url"] == media["variants"]["webp"]["320"]
+
+        response = await client.get(media["thumbnail_url"])
+        assert response.headers["content-type"] == "image/webp"
+
+        thumbnail = cv2.imdecode(
+            np.frombuffer(response.content, dtype=np.uint8), cv2.IMREAD_COLOR
+        )
+        assert thumbnail.shape[:2] == (180, 320)
+
+        # images narrower than every size are served as they are
+        assert self.default_media["variants"] is None
+        assert self.default_media["thumbnail_url"] == self.default_media["content_url"]
+
+    @pytest.mark.asyncio(scope="session")
+    async def test_failed_upload_stores_no_derivatives(
+        self, client: AsyncClient, monkeypatch
+    ):
+        image = np.random.randint(0, 255, (900, 1600, 3), dtype=np.uint8)
+        content = cv2.imencode(".png", image)[1].tobytes()
+        content_hash = hashlib.sha256(content).hexdigest()
+
+        monkeypatch.setattr(
+            MediaUploaderService,
+            "upload",
+            lambda self: DAOResponse(success=False, error="storage unavailable"),
+        )
+
+        response = await client.post(
+            "/media/",
+            json={
+                "media_name": "failed_upload",
+                "media_type": "png",
+                "is_thumbnail": False,
+                "content_url": "data:image/png;base64,"
+                + base64.b64encode(content).decode(),
+            },
+        )
+        assert response.status_code != 200 or not response.json()["success"]
+
+        shard = os.path.join(settings.MEDIA_ROOT, content_hash[0:2], content_hash[2:4])
+        assert not os.path.isdir(shard) or not [
+            name for name in os.listdir(shard) if name.startswith(content_hash)
+        ]
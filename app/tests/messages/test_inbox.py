@@ -0,0 +1,308 @@
+import uuid
+import pytz
+import pytest
+from typing import List
+from datetime import datetime, timedelta
+from httpx import AsyncClient
+from sqlalchemy import func
+from sqlalchemy.dialects import mysql
+from sqlalchemy.future import select
+
+from app.db.dbManager import DBManager
+from app.models.user import User
+from app.models.message import Message
+from app.models.under_contract import UnderContract
+from app.models.user_mailbox import UserMailbox
+from app.models.message_recipient import MessageRecipient
+from app.models.property_unit_assoc import PropertyUnitAssoc
+from app.services.mailbox_fanout import MailboxFanout, fan_out_query
+from scripts.backfill_mailbox import backfill
+
+NOW = datetime(2024, 6, 1)
+
+
+async def send(db_session, subject: str, recipient_id=None, group_id=None, **flags):
+    message = Message(subject=subject, message_body="Hello", **flags)
+    db_session.add(message)
+    await db_session.flush()
+
+    for recipient in [recipient_id, group_id]:
+        if recipient is None:
+            continue
+
+        db_session.add(
+            MessageRecipient(
+                message_id=message.message_id,
+                recipient_id=recipient if recipient is recipient_id else None,
+                recipient_group_id=recipient if recipient is group_id else None,
+                msg_send_date=NOW,
+                is_read=False,
+            )
+        )
+
+
+def tagged(response, tag: str) -> dict:
+    messages = response.json()["data"]
+    return {m["subject"]: m for m in messages if m["subject"].startswith(tag)}
+
+
+def subjects(response, tag: str) -> List[str]:
+    return sorted(tagged(response, tag))
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_mailbox_fans_out_group_messages(client: AsyncClient):
+    tag = f"Inbox {uuid.uuid4()}"
+
+    async with DBManager().db_module.Session() as db_session:
+        user_id = (
+            await db_session.execute(
+                select(User.user_id).where(User.email == "admin@housekee.com")
+            )
+        ).scalar_one()
+
+        unit, past_unit = PropertyUnitAssoc(), PropertyUnitAssoc()
+        db_session.add_all([unit, past_unit])
+        await db_session.flush()
+
+        db_session.add_all(
+            [
+                UnderContract(
+                    property_unit_assoc_id=unit.property_unit_assoc_id,
+                    client_id=user_id,
+                    start_date=NOW - timedelta(days=30),
+                    end_date=NOW + timedelta(days=30),
+                ),
+                UnderContract(
+                    property_unit_assoc_id=past_unit.property_unit_assoc_id,
+                    client_id=user_id,
+                    start_date=NOW - timedelta(days=400),
+                    end_date=NOW - timedelta(days=30),
+                ),
+            ]
+        )
+
+        await send(db_session, f"{tag} direct", recipient_id=user_id)
+        await send(
+            db_session,
+            f"{tag} direct and unit",
+            recipient_id=user_id,
+            group_id=unit.property_unit_assoc_id,
+        )
+        await send(db_session, f"{tag} unit", group_id=unit.property_unit_assoc_id)
+        await send(
+            db_session,
+            f"{tag} previous unit",
+            group_id=past_unit.property_unit_assoc_id,
+        )
+        await send(db_session, f"{tag} draft", recipient_id=user_id, is_draft=True)
+        await send(
+            db_session,
+            f"{tag} notice",
+            group_id=unit.property_unit_assoc_id,
+            is_notification=True,
+        )
+        await db_session.commit()
+
+    # nothing reaches a mailbox until it's fanned out
+    inbox = await client.get(f"/messages/users/{user_id}/inbox")
+    assert subjects(inbox, tag) == []
+
+    assert await MailboxFanout(batch_size=2).drain() >= 5
+
+    inbox = await client.get(f"/messages/users/{user_id}/inbox")
+    notifications = await client.get(f"/messages/users/{user_id}/notifications")
+    assert inbox.status_code == 200
+    assert notifications.status_code == 200
+
+    assert subjects(inbox, tag) == [
+        f"{tag} direct",
+        f"{tag} direct and unit",
+        f"{tag} unit",
+    ]
+    assert subjects(notifications, tag) == [f"{tag} notice"]
+
+    # reading one message leaves the rest unread
+    unread = (await client.get(f"/messages/users/{user_id}/unread")).json()["data"]
+    direct_id = tagged(inbox, tag)[f"{tag} direct"]["message_id"]
+
+    response = await client.put(
+        f"/messages/users/{user_id}/read", json={"message_ids": [direct_id]}
+    )
+    assert response.json()["data"] == {"updated": 1}
+
+    after = (await client.get(f"/messages/users/{user_id}/unread")).json()["data"]
+    assert after == {**unread, "inbox": unread["inbox"] - 1}
+
+    # a backfill rewrites nothing that's there, read state included
+    await backfill(since=datetime.now(pytz.utc) - timedelta(hours=1))
+
+    inbox = await client.get(f"/messages/users/{user_id}/inbox")
+    assert subjects(inbox, tag) == [
+        f"{tag} direct",
+        f"{tag} direct and unit",
+        f"{tag} unit",
+    ]
+    assert [subject for subject, m in tagged(inbox, tag).items() if m["is_read"]] == [
+        f"{tag} direct"
+    ]
+
+
+async def pages(client: AsyncClient, url: str, **params) -> List[List[str]]:
+    subjects, cursor = [], None
+
+    while True:
+        page = {**params, "cursor": cursor} if cursor else params
+        response = await client.get(url, params=page)
+        assert response.status_code == 200
+
+        body = response.json()
+        subjects.append([m["subject"] for m in body["data"]])
+
+        cursor = body["meta"]["next_cursor"]
+        if not cursor:
+            return subjects
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_message_listings_page_newest_first(client: AsyncClient):
+    tag = f"Page {uuid.uuid4()}"
+    since = datetime.now(pytz.utc)
+
+    async with DBManager().db_module.Session() as db_session:
+        user_id = (
+            await db_session.execute(
+                select(User.user_id).where(User.email == "admin@housekee.com")
+            )
+        ).scalar_one()
+
+        for i in range(5):
+            await send(
+                db_session,
+                f"{tag} {i}",
+                recipient_id=user_id,
+                sender_id=user_id,
+                date_created=since + timedelta(seconds=i + 1),
+            )
+        await db_session.commit()
+
+    await MailboxFanout().drain()
+
+    expected = [[f"{tag} 4", f"{tag} 3"], [f"{tag} 2", f"{tag} 1"], [f"{tag} 0"]]
+    params = {"limit": 2, "since": since.isoformat()}
+
+    assert await pages(client, f"/messages/users/{user_id}/inbox", **params) == (
+        expected
+    )
+    assert await pages(client, f"/messages/users/{user_id}/outbox", **params) == (
+        expected
+    )
+
+    # the previous cursor of the second page leads back to the first
+    first = await client.get(f"/messages/users/{user_id}/outbox", params=params)
+    second = await client.get(
+        f"/messages/users/{user_id}/outbox",
+        params={**params, "cursor": first.json()["meta"]["next_cursor"]},
+    )
+    back = await client.get(
+        f"/messages/users/{user_id}/outbox",
+        params={**params, "cursor": second.json()["meta"]["previous_cursor"]},
+    )
+    assert back.json()["data"] == first.json()["data"]
+
+    response = await client.get(
+        f"/messages/users/{user_id}/inbox", params={"cursor": "not-a-cursor"}
+    )
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_create_message_counts_recipients(client: AsyncClient):
+    subject = f"Broadcast {uuid.uuid4()}"
+
+    async with DBManager().db_module.Session() as db_session:
+        user_id = (
+            await db_session.execute(
+                select(User.user_id).where(User.email == "admin@housekee.com")
+            )
+        ).scalar_one()
+
+        units = [PropertyUnitAssoc() for _ in range(3)]
+        db_session.add_all(units)
+        await db_session.commit()
+        unit_ids = [str(unit.property_unit_assoc_id) for unit in units]
+
+    response = await client.post(
+        "/messages/",
+        json={
+            "subject": subject,
+            "message_body": "The water is off on Monday.",
+            "sender_id": str(user_id),
+            "recipient_ids": [str(user_id), str(user_id)],
+            "recipient_groups": unit_ids,
+        },
+    )
+    assert response.status_code == 200
+
+    message = response.json()["data"]
+    assert message["recipient_count"] == 1
+    assert message["recipient_group_count"] == 3
+    assert message["sender"]["email"] == "admin@housekee.com"
+    assert message["thread_id"] == message["message_id"]
+
+    async with DBManager().db_module.Session() as db_session:
+        recipients = await db_session.execute(
+            select(MessageRecipient).where(
+                MessageRecipient.message_id == uuid.UUID(message["message_id"])
+            )
+        )
+        recipients = recipients.scalars().all()
+
+    assert len(recipients) == 4
+    assert len({r.msg_send_date for r in recipients}) == 1
+
+    await MailboxFanout().drain()
+    inbox = await client.get(f"/messages/users/{user_id}/inbox")
+    assert subjects(inbox, subject) == [subject]
+
+    # listings count the recipients instead of loading them
+    outbox = await client.get(f"/messages/users/{user_id}/outbox")
+    for listed in [tagged(inbox, subject)[subject], tagged(outbox, subject)[subject]]:
+        assert listed["recipients"] is None
+        assert listed["recipient_count"] == 1
+        assert listed["recipient_group_count"] == 3
+        assert listed["sender"]["email"] == "admin@housekee.com"
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_fan_out_query_on_other_dialects(client: AsyncClient):
+    subject = f"Fallback {uuid.uuid4()}"
+
+    async with DBManager().db_module.Session() as db_session:
+        user_id = (
+            await db_session.execute(
+                select(User.user_id).where(User.email == "admin@housekee.com")
+            )
+        ).scalar_one()
+
+        # a draft, so the fan-out worker leaves it to this test
+        await send(db_session, subject, recipient_id=user_id, is_draft=True)
+        message_id = (
+            await db_session.execute(
+                select(Message.message_id).where(Message.subject == subject)
+            )
+        ).scalar_one()
+
+        # without an upsert the insert skips the rows already there
+        for _ in range(2):
+            await db_session.execute(fan_out_query("default", [message_id]))
+
+        rows = await db_session.execute(
+            select(func.count()).where(UserMailbox.message_id == message_id)
+        )
+        assert rows.scalar_one() == 1
+
+        await db_session.rollback()
+
+    query = fan_out_query("mysql", [message_id]).compile(dialect=mysql.dialect())
+    assert "ON DUPLICATE KEY UPDATE user_id = user_mailbox.user_id" in str(query)
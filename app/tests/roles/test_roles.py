@@ -1,6 +1,21 @@
+import uuid
 import pytest
 from typing import Any, Dict
 from httpx import AsyncClient
+from sqlalchemy import delete
+from sqlalchemy.future import select
+
+from app.db.dbManager import DBManager
+from app.models.role import Role
+from app.models.role_permissions import RolePermissions
+from app.utils.rbac import PermissionMatrix, permission_matrix
+
+
+async def login(client: AsyncClient, username: str) -> Dict[str, str]:
+    response = await client.post(
+        "/auth/", json={"username": username, "password": "tester"}
+    )
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
 
 
 class TestRoles:
@@ -56,6 +71,80 @@ class TestRoles:
         assert response.json()["data"]["name"] == "updatedrole"
         assert response.json()["data"]["alias"] == "updatedrolealias"
 
+    @pytest.mark.asyncio(scope="session")
+    async def test_add_role_permission(self, client: AsyncClient):
+        alias = f"auditor_{uuid.uuid4().hex[:8]}"
+        response = await client.post(
+            "/roles/",
+            json={"name": alias, "alias": alias, "description": "Read only"},
+        )
+        assert response.status_code == 200
+
+        # stands in for another worker, which never sees this one's writes
+        other_worker = PermissionMatrix(check_interval=0)
+        await other_worker.refresh()
+        await permission_matrix.refresh()
+        assert not permission_matrix.allows([alias], ["view_users"])
+
+        response = await client.post(
+            "/roles/add_permission",
+            params={"role_alias": alias, "permission_alias": "view_users"},
+            headers=await login(client, "admin@housekee.com"),
+        )
+        assert response.status_code == 200
+
+        # the write invalidates the matrix, the next check rebuilds it
+        assert permission_matrix.stale
+        await permission_matrix.refresh()
+        assert permission_matrix.allows([alias], ["view_users"])
+        assert not permission_matrix.allows([alias], ["delete_users"])
+
+        # other workers see the bumped version
+        assert not other_worker.stale
+        await other_worker.refresh()
+        assert other_worker.allows([alias], ["view_users"])
+
+        # bulk statements never load the rows, they're tracked all the same
+        async with DBManager().db_module.Session() as db_session:
+            role_id = (
+                await db_session.execute(
+                    select(Role.role_id).where(Role.alias == alias)
+                )
+            ).scalar_one()
+            await db_session.execute(
+                delete(RolePermissions).where(RolePermissions.role_id == role_id)
+            )
+            await db_session.commit()
+
+        assert permission_matrix.stale
+        await other_worker.refresh()
+        assert not other_worker.allows([alias], ["view_users"])
+
+    @pytest.mark.asyncio(scope="session")
+    async def test_add_role_permission_requires_permission(self, client: AsyncClient):
+        params = {"role_alias": "tenant", "permission_alias": "delete_users"}
+
+        response = await client.post("/roles/add_permission", params=params)
+        assert response.status_code == 401
+
+        response = await client.post(
+            "/roles/add_permission",
+            params=params,
+            headers={"Authorization": "Bearer not.a.token"},
+        )
+        assert response.status_code == 401
+
+        # tenants can't grant themselves more
+        response = await client.post(
+            "/roles/add_permission",
+            params=params,
+            headers=await login(client, "tenant@housekee.com"),
+        )
+        assert response.status_code == 403
+
+        await permission_matrix.refresh()
+        assert not permission_matrix.allows(["tenant"], ["delete_users"])
+
     @pytest.mark.asyncio(scope="session")
     @pytest.mark.dependency(depends=["update_role_by_id"], name="delete_role_by_id")
     async def test_delete_role(self, client: AsyncClient):
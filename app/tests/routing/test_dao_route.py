@@ -0,0 +1,50 @@
+import pytest
+from typing import List
+from pydantic import BaseModel
+from fastapi import APIRouter, FastAPI
+from httpx import AsyncClient, ASGITransport
+
+from app.router.base_router import DAORoute
+from app.utils.response import DAOResponse
+
+
+class Item(BaseModel):
+    name: str
+
+
+router = APIRouter(route_class=DAORoute)
+ROWS = [{"name": "first", "secret": "hidden"}]
+
+
+@router.get("/envelope")
+async def envelope() -> DAOResponse:
+    return DAOResponse(success=True, data=ROWS)
+
+
+@router.get("/filtered", response_model=DAOResponse[List[Item]])
+async def filtered():
+    return DAOResponse(success=True, data=ROWS)
+
+
+@pytest.fixture(scope="module")
+async def route_client():
+    app = FastAPI()
+    app.include_router(router)
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_bare_envelope_is_rendered_directly(route_client: AsyncClient):
+    response = await route_client.get("/envelope")
+    assert response.status_code == 200
+    assert response.json()["data"] == ROWS
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_declared_response_model_filters_the_payload(route_client: AsyncClient):
+    response = await route_client.get("/filtered")
+    assert response.status_code == 200
+    assert response.json()["data"] == [{"name": "first"}]
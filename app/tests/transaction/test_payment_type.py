@@ -1,3 +1,4 @@
+import uuid
 import pytest
 from typing import Any, Dict
 from httpx import AsyncClient
@@ -27,6 +28,75 @@ class TestPaymentType:
         assert response.status_code == 200
         assert isinstance(response.json(), dict)
 
+    @pytest.mark.asyncio(scope="session")
+    async def test_get_all_payment_types_with_cursor(self, client: AsyncClient):
+        response = await client.get("/payment_type/", params={"limit": 1})
+        assert response.status_code == 200
+
+        first_page = response.json()
+        next_cursor = first_page["meta"]["next_cursor"]
+        assert next_cursor is not None
+
+        response = await client.get(
+            "/payment_type/", params={"limit": 1, "cursor": next_cursor}
+        )
+        assert response.status_code == 200
+
+        second_page = response.json()
+        assert "total" not in second_page["meta"]
+        assert second_page["data"] != first_page["data"]
+
+        response = await client.get(
+            "/payment_type/",
+            params={"limit": 1, "cursor": second_page["meta"]["previous_cursor"]},
+        )
+        assert response.status_code == 200
+        assert response.json()["data"] == first_page["data"]
+
+    @pytest.mark.asyncio(scope="session")
+    async def test_batch_create_payment_types(self, client: AsyncClient):
+        suffix = uuid.uuid4().hex[:8]
+        payment_types = [
+            {
+                "payment_type_name": f"batch_plan_{i}_{suffix}",
+                "payment_type_description": "Batch payment plan",
+                "num_of_invoices": i,
+            }
+            for i in range(1, 4)
+        ]
+
+        response = await client.post("/payment_type/batch", json=payment_types)
+        assert response.status_code == 200
+
+        created_ids = response.json()["data"]
+        assert len(created_ids) == 3
+
+        # upsert on the unique name updates the existing rows in place
+        for payment_type in payment_types:
+            payment_type["payment_type_description"] = "Upserted payment plan"
+
+        response = await client.post(
+            "/payment_type/batch",
+            params={"on_conflict": "payment_type_name"},
+            json=payment_types,
+        )
+        assert response.status_code == 200
+        assert response.json()["data"] == created_ids
+
+        response = await client.get(f"/payment_type/{created_ids[0]}")
+        assert response.status_code == 200
+        assert (
+            response.json()["data"]["payment_type_description"]
+            == "Upserted payment plan"
+        )
+
+    @pytest.mark.asyncio(scope="session")
+    async def test_get_all_payment_types_invalid_cursor(self, client: AsyncClient):
+        response = await client.get(
+            "/payment_type/", params={"limit": 1, "cursor": "not-a-cursor"}
+        )
+        assert response.status_code == 400
+
     @pytest.mark.asyncio(scope="session")
     @pytest.mark.dependency(
         depends=["create_payment_type"], name="get_payment_type_by_id"
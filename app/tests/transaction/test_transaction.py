@@ -60,6 +60,22 @@ class TestTransaction:
         assert response.status_code == 200
         assert isinstance(response.json(), dict)
 
+    @pytest.mark.asyncio(scope="session")
+    @pytest.mark.dependency(depends=["create_transaction"])
+    async def test_get_all_transactions_count_strategies(self, client: AsyncClient):
+        response = await client.get(
+            "/transaction/", params={"limit": 1, "count": "estimated"}
+        )
+        assert response.status_code == 200
+        assert response.json()["meta"]["total"] >= 1
+
+        response = await client.get(
+            "/transaction/", params={"limit": 1, "count": "none"}
+        )
+        assert response.status_code == 200
+        assert "total" not in response.json()["meta"]
+        assert "has_more" in response.json()["meta"]
+
     @pytest.mark.asyncio(scope="session")
     @pytest.mark.dependency(
         depends=["create_transaction"], name="get_transaction_by_id"
@@ -0,0 +1,172 @@
+import uuid
+import pytest
+from typing import List
+from httpx import AsyncClient
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from sqlalchemy.future import select
+
+from app.db.dbManager import DBManager
+from app.db.dbUnitOfWork import UnitOfWork
+from app.models.payment_type import PaymentTypes
+from app.models.contract_type import ContractType
+from app.dao.billing.payment_type_dao import PaymentTypeDAO
+from app.dao.contracts.contract_type_dao import ContractTypeDAO
+
+payment_type_dao = PaymentTypeDAO()
+contract_type_dao = ContractTypeDAO()
+
+
+@pytest.fixture
+def commits():
+    # every session commit made while the test runs
+    committed: List[Session] = []
+
+    def count(session):
+        committed.append(session)
+
+    event.listen(Session, "after_commit", count)
+    yield committed
+    event.remove(Session, "after_commit", count)
+
+
+def payment_type(name: str) -> dict:
+    return {
+        "payment_type_name": name,
+        "payment_type_description": "Unit of work",
+        "num_of_invoices": 1,
+    }
+
+
+async def persisted(model, **filters) -> list:
+    async with DBManager().db_module.Session() as db_session:
+        result = await db_session.execute(select(model).filter_by(**filters))
+        return result.scalars().all()
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_request_commits_once(client: AsyncClient, commits):
+    name = f"uow_request_{uuid.uuid4().hex[:8]}"
+
+    response = await client.post("/payment_type/", json=payment_type(name))
+    assert response.status_code == 200
+    assert response.json()["data"]["payment_type_name"] == name
+
+    assert len(commits) == 1
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_writes_across_daos_commit_once(commits):
+    name = f"uow_multi_{uuid.uuid4().hex[:8]}"
+
+    async with DBManager().db_module.Session() as db_session:
+        async with UnitOfWork(db_session):
+            await payment_type_dao.create(db_session, payment_type(name))
+            await contract_type_dao.create(
+                db_session, {"contract_type_name": name, "fee_percentage": 5}
+            )
+
+            assert commits == []
+
+    assert len(commits) == 1
+    assert len(await persisted(PaymentTypes, payment_type_name=name)) == 1
+    assert len(await persisted(ContractType, contract_type_name=name)) == 1
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_nested_units_commit_with_the_outermost(commits):
+    name = f"uow_nested_{uuid.uuid4().hex[:8]}"
+
+    async with DBManager().db_module.Session() as db_session:
+        async with UnitOfWork(db_session):
+            async with UnitOfWork(db_session):
+                assert db_session.info[UnitOfWork.DEPTH] == 2
+                await payment_type_dao.create(db_session, payment_type(name))
+
+            assert db_session.info[UnitOfWork.DEPTH] == 1
+            assert commits == []
+
+        assert db_session.info[UnitOfWork.DEPTH] == 0
+
+    assert len(commits) == 1
+    assert len(await persisted(PaymentTypes, payment_type_name=name)) == 1
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_nested_create_failing_partway_persists_nothing(commits):
+    name = f"uow_failed_{uuid.uuid4().hex[:8]}"
+
+    async with DBManager().db_module.Session() as db_session:
+        with pytest.raises(RuntimeError):
+            async with UnitOfWork(db_session):
+                await payment_type_dao.create(db_session, payment_type(name))
+
+                async with UnitOfWork(db_session):
+                    await contract_type_dao.create(
+                        db_session, {"contract_type_name": name, "fee_percentage": 5}
+                    )
+                    raise RuntimeError("nested step failed")
+
+        assert UnitOfWork.ROLLBACK_ONLY not in db_session.info
+
+    assert commits == []
+    assert await persisted(PaymentTypes, payment_type_name=name) == []
+    assert await persisted(ContractType, contract_type_name=name) == []
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_dao_rollback_makes_the_unit_rollback_only(commits):
+    name = f"uow_rollback_{uuid.uuid4().hex[:8]}"
+    later = f"uow_later_{uuid.uuid4().hex[:8]}"
+
+    async with DBManager().db_module.Session() as db_session:
+        async with UnitOfWork(db_session):
+            await payment_type_dao.create(db_session, payment_type(name))
+
+            # the duplicate name fails the flush and the dao rolls back
+            with pytest.raises(Exception):
+                await payment_type_dao.create(db_session, payment_type(name))
+
+            assert db_session.info[UnitOfWork.ROLLBACK_ONLY]
+
+            # the handler carries on, but nothing after the rollback is committed
+            await payment_type_dao.create(db_session, payment_type(later))
+
+    assert commits == []
+    assert await persisted(PaymentTypes, payment_type_name=name) == []
+    assert await persisted(PaymentTypes, payment_type_name=later) == []
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_refresh_is_deferred_and_batched_per_model():
+    names = [f"uow_refresh_{i}_{uuid.uuid4().hex[:8]}" for i in range(2)]
+    statements: List[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    engine = DBManager().db_module.engine["write"].sync_engine
+
+    async with DBManager().db_module.Session() as db_session:
+        async with UnitOfWork(db_session):
+            created = [
+                await payment_type_dao.create(db_session, payment_type(name))
+                for name in names
+            ]
+
+            pending = db_session.info[UnitOfWork.PENDING_REFRESH]
+            assert [obj for obj, _ in pending.values()] == created
+
+            event.listen(engine, "before_cursor_execute", record)
+            try:
+                await UnitOfWork.refresh_pending(db_session)
+            finally:
+                event.remove(engine, "before_cursor_execute", record)
+
+            assert UnitOfWork.PENDING_REFRESH not in db_session.info
+
+        assert UnitOfWork.PENDING_REFRESH not in db_session.info
+
+    selects = [s for s in statements if s.lstrip().upper().startswith("SELECT")]
+    assert len(selects) == 1
+    assert "payment_types" in selects[0]
@@ -70,6 +70,32 @@ class TestUsers:
         assert response.status_code == 200
         assert isinstance(response.json(), dict)
 
+    @pytest.mark.asyncio(scope="session")
+    async def test_get_all_users_with_projection(self, client: AsyncClient):
+        response = await client.get(
+            "/users/",
+            params={"limit": 1, "fields": "first_name,email,roles.name"},
+        )
+        assert response.status_code == 200
+
+        user = response.json()["data"][0]
+        assert set(user.keys()) == {"user_id", "first_name", "email", "roles"}
+        assert all(set(role.keys()) == {"role_id", "name"} for role in user["roles"])
+        assert "fields=" in response.json()["meta"]["next"]
+
+        # private columns can't be projected
+        response = await client.get("/users/", params={"fields": "password"})
+        assert response.status_code == 400
+
+        response = await client.get("/users/", params={"expand": "not_a_relation"})
+        assert response.status_code == 400
+
+        # nor relationships the users listing doesn't show
+        response = await client.get(
+            "/users/", params={"fields": "accounts.bank_account_number"}
+        )
+        assert response.status_code == 400
+
     @pytest.mark.asyncio(scope="session")
     @pytest.mark.dependency(depends=["create_user"], name="get_user_by_id")
     async def test_get_user_by_id(self, client: AsyncClient):
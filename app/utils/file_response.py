@@ -0,0 +1,152 @@
+import os
+import re
+import anyio
+from email.utils import formatdate
+from typing import Dict, Optional, Tuple
+from starlette.datastructures import Headers
+from starlette.responses import Response
+from starlette.types import Receive, Scope, Send
+
+RANGE_PATTERN = re.compile(r"bytes=(?P<start>\d*)-(?P<end>\d*)$")
+
+
+class RangeFileResponse(Response):
+    """
+    Serves a file or the single byte range the request asks for.
+
+    The body is handed to the server with the ASGI `pathsend` or `zerocopy`
+    extension when it offers one, so the kernel copies the file to the socket
+    with sendfile. Otherwise the file is read in chunks off the event loop.
+    Multi-range requests get the whole file, as HTTP allows.
+    """
+
+    chunk_size = 64 * 1024
+
+    def __init__(
+        self,
+        path: str,
+        request_headers: Headers,
+        media_type: Optional[str] = None,
+        etag: Optional[str] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ):
+        # pathsend wants an absolute path
+        self.path = os.path.abspath(path)
+        self.media_type = media_type or "application/octet-stream"
+        self.background = None
+
+        stat = os.stat(path)
+        self.size = stat.st_size
+        self.status_code, self.offset, self.count = 200, 0, self.size
+
+        headers = {
+            **(headers or {}),
+            "accept-ranges": "bytes",
+            "last-modified": formatdate(stat.st_mtime, usegmt=True),
+        }
+        if etag:
+            headers["etag"] = f'"{etag}"'
+
+        if etag and request_headers.get("if-none-match") == headers["etag"]:
+            self.status_code, self.count = 304, 0
+        elif (byte_range := self.requested_range(request_headers, etag)) is not None:
+            if byte_range == ():
+                self.status_code, self.count = 416, 0
+                headers["content-range"] = f"bytes */{self.size}"
+            else:
+                start, end = byte_range
+                self.status_code = 206
+                self.offset, self.count = start, end - start + 1
+                headers["content-range"] = f"bytes {start}-{end}/{self.size}"
+
+        if self.status_code != 304:
+            headers["content-length"] = str(self.count)
+
+        self.init_headers(headers)
+
+    def requested_range(
+        self, request_headers: Headers, etag: Optional[str]
+    ) -> Optional[Tuple[int, ...]]:
+        """
+        The inclusive (start, end) asked for, () if unsatisfiable, None for all.
+        """
+        header = request_headers.get("range")
+        if not header:
+            return None
+
+        # a range of an older version of the file is meaningless
+        if_range = request_headers.get("if-range")
+        if if_range and if_range != f'"{etag}"':
+            return None
+
+        match = RANGE_PATTERN.match(header.strip())
+        if not match or not (match["start"] or match["end"]):
+            return None
+
+        if not match["start"]:
+            # "bytes=-500" is the last 500 bytes
+            start, end = max(0, self.size - int(match["end"])), self.size - 1
+        else:
+            start = int(match["start"])
+            end = min(int(match["end"] or self.size - 1), self.size - 1)
+
+        if start > end or start >= self.size:
+            return ()
+
+        return start, end
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        await send(
+            {
+                "type": "http.response.start",
+                "status": self.status_code,
+                "headers": self.raw_headers,
+            }
+        )
+
+        extensions = scope.get("extensions", {})
+
+        if scope["method"] == "HEAD" or self.count == 0:
+            await send({"type": "http.response.body", "body": b""})
+        elif self.status_code == 200 and "http.response.pathsend" in extensions:
+            await send({"type": "http.response.pathsend", "path": self.path})
+        else:
+            with open(self.path, "rb") as file:
+                if "http.response.zerocopy" in extensions:
+                    await send(
+                        {
+                            "type": "http.response.zerocopy",
+                            "file": file,
+                            "offset": self.offset,
+                            "count": self.count,
+                        }
+                    )
+                else:
+                    await self.send_chunks(file, send)
+
+        if self.background is not None:
+            await self.background()
+
+    async def send_chunks(self, file, send: Send):
+        await anyio.to_thread.run_sync(file.seek, self.offset)
+        remaining = self.count
+
+        while remaining > 0:
+            chunk = await anyio.to_thread.run_sync(
+                file.read, min(self.chunk_size, remaining)
+            )
+            if not chunk:
+                break
+
+            remaining -= len(chunk)
+            await send(
+                {
+                    "type": "http.response.body",
+                    "body": chunk,
+                    "more_body": remaining > 0,
+                }
+            )
+
+        # the file shrank under us, end the body anyway
+        if remaining > 0:
+            await send({"type": "http.response.body", "body": b""})
@@ -1,9 +1,28 @@
+import asyncio
 import bcrypt
+from concurrent.futures import ThreadPoolExecutor
+
+from app.utils.settings import settings
+
+
+class HashPoolBusyException(Exception):
+    def __init__(self, msg="Too many password checks in progress, try again shortly"):
+        self.msg = msg
+        super().__init__(self.msg)
+
+    def __str__(self):
+        return self.msg
 
 
 class Hash:
+    # bcrypt releases the GIL, so a few threads hash in parallel off the event loop
+    executor = ThreadPoolExecutor(
+        max_workers=settings.HASH_WORKERS, thread_name_prefix="bcrypt"
+    )
+    pending = 0
+
     def bcrypt(password: str) -> str:
-        salt = bcrypt.gensalt()
+        salt = bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS)
         hashed = bcrypt.hashpw(password.encode("utf-8"), salt)
 
         return hashed.decode("utf-8")
@@ -12,3 +31,33 @@ class Hash:
         return bcrypt.checkpw(
             plain_password.encode("utf-8"), hashed_password.encode("utf-8")
         )
+
+    def needs_rehash(hashed_password: str) -> bool:
+        # "$2b$12$..." carries the cost it was hashed with
+        try:
+            return int(hashed_password.split("$")[2]) != settings.BCRYPT_ROUNDS
+        except (IndexError, ValueError):
+            return True
+
+    @classmethod
+    async def run(cls, fn, *args):
+        """
+        Runs a hashing call in the pool, refusing work once the queue is full.
+        """
+        if cls.pending >= settings.HASH_QUEUE_DEPTH:
+            raise HashPoolBusyException()
+
+        cls.pending += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(cls.executor, fn, *args)
+        finally:
+            cls.pending -= 1
+
+    @classmethod
+    async def bcrypt_async(cls, password: str) -> str:
+        return await cls.run(cls.bcrypt, password)
+
+    @classmethod
+    async def verify_async(cls, hashed_password: str, plain_password: str) -> bool:
+        return await cls.run(cls.verify, hashed_password, plain_password)
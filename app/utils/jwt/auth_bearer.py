@@ -3,13 +3,13 @@ from fastapi import Request, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 
 # utils
-from app.utils.jwt.auth_handler import decodeJWT
+from app.utils.jwt.token_cache import token_cache
 
 
 class JWTBearer(HTTPBearer):
     def __init__(self, scopes: list = [], auto_error: bool = True):
         super(JWTBearer, self).__init__(auto_error=auto_error)
-        self.scopes = scopes
+        self.scopes = frozenset(scopes)
 
     async def __call__(self, request: Request):
         credentials: HTTPAuthorizationCredentials = await super(
@@ -21,14 +21,13 @@ class JWTBearer(HTTPBearer):
                     status_code=403, detail="Invalid authentication scheme."
                 )
 
-            payload = self.verify_jwt(credentials.credentials)
-            if not payload:
+            verified_token = token_cache.verify(credentials.credentials)
+            if not verified_token:
                 raise HTTPException(
                     status_code=403, detail="Invalid token or expired token."
                 )
 
-            token_scopes = payload["scope"].split(",")
-            if self.scopes and not any(scope in token_scopes for scope in self.scopes):
+            if self.scopes and self.scopes.isdisjoint(verified_token.scopes):
                 raise HTTPException(
                     status_code=status.HTTP_401_UNAUTHORIZED,
                     detail="Not enough permissions",
@@ -38,9 +37,6 @@ class JWTBearer(HTTPBearer):
             return credentials.credentials
 
     def verify_jwt(self, jwtoken: str) -> Optional[Dict[str, Any]]:
-        try:
-            payload = decodeJWT(jwtoken)
-        except Exception:
-            payload = None
+        verified_token = token_cache.verify(jwtoken)
 
-        return payload
+        return verified_token.claims if verified_token else None
@@ -1,46 +1,45 @@
 import jwt
 import time
-from typing import Dict
-
-# models
-from app.models.user import User
+from typing import Any, Dict
 
 # utils
 from app.utils.settings import settings
 
 # schemas
 from app.schema.user import UserBase
-from app.schema.auth import TokenExposed
+from app.schema.auth import AuthUser, TokenExposed
 
 JWT_SECRET = settings.JWT_SECRET
 JWT_ALGORITHM = settings.JWT_ALGORITHM
 
+# user fields carried in the token besides its expiry and scope
+TOKEN_CLAIMS = set(UserBase.model_fields) - {"gender", "user_id"}
+
 
-def token_response(token: str) -> TokenExposed:
-    payload = decodeJWT(token)
-    payload.update({"access_token": token, "token_type": "Bearer"})
+def token_response(token: str, payload: Dict[str, Any]) -> TokenExposed:
+    # the claims were just signed, no need to decode them back
+    token_data = dict(payload)
+    token_data.update({"access_token": token, "token_type": "Bearer"})
 
-    return payload
+    return token_data
 
 
-def signJWT(user: User) -> Dict[str, str]:
-    payload = user.to_dict(
-        exclude={"password_hash", "updated_at", "created_at", "gender", "user_id"}
-    )
-    payload = {key: payload[key] for key in payload if key in UserBase.model_fields}
+def signJWT(user: AuthUser) -> Dict[str, str]:
+    payload = user.model_dump(include=TOKEN_CLAIMS)
     payload.update({"expires": time.time() + 1800})
 
     # create the access token with the user's scopes as permissions
-    user_permissions = [p.name for r in user.roles for p in r.permissions]
-    payload.update({"scope": ",".join(user_permissions)})
+    payload.update({"scope": ",".join(user.permissions)})
+    # role aliases, checked against the permission matrix
+    payload.update({"roles": [role.alias for role in user.roles]})
     token = jwt.encode(payload, JWT_SECRET, algorithm=JWT_ALGORITHM)
 
-    token_data = token_response(token)
+    token_data = token_response(token, payload)
     token_data.update(
         {
             "first_name": user.first_name,
             "email": user.email,
-            "user_id": user.to_dict().get("user_id"),
+            "user_id": str(user.user_id),
             "last_name": user.last_name,
             "expires": payload["expires"],
             "roles": user.roles,
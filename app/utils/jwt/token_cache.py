@@ -0,0 +1,111 @@
+import time
+import hashlib
+from collections import OrderedDict
+from typing import Any, Dict, FrozenSet, NamedTuple, Optional
+
+# utils
+from app.utils.settings import settings
+from app.utils.jwt.auth_handler import decodeJWT
+
+
+class VerifiedToken(NamedTuple):
+    claims: Dict[str, Any]
+    scopes: FrozenSet[str]
+    expires: float
+
+
+class TokenCache:
+    """
+    LRU cache of verified tokens, so a token's signature is checked once.
+
+    Entries are keyed by the SHA-256 of the token, never the token itself,
+    hold the decoded claims and the parsed scopes, and are dropped once the
+    token expires. Revoked tokens are remembered until they would have
+    expired and are refused even though their signature is still valid.
+    """
+
+    def __init__(self, max_size: int = settings.JWT_CACHE_SIZE):
+        self.max_size = max_size
+        self.entries: OrderedDict[bytes, VerifiedToken] = OrderedDict()
+        self.revoked: Dict[bytes, float] = {}
+
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(token: str) -> bytes:
+        return hashlib.sha256(token.encode("utf-8")).digest()
+
+    def verify(self, token: str) -> Optional[VerifiedToken]:
+        """
+        Returns the verified token, or None if it's invalid, expired or revoked.
+        """
+        key, now = self.key(token), time.time()
+
+        if key in self.revoked:
+            if self.revoked[key] >= now:
+                return None
+            del self.revoked[key]
+
+        entry = self.entries.get(key)
+        if entry is not None:
+            if entry.expires >= now:
+                self.hits += 1
+                self.entries.move_to_end(key)
+                return entry
+
+            del self.entries[key]
+
+        self.misses += 1
+
+        claims = decodeJWT(token)
+        if not claims:
+            return None
+
+        entry = VerifiedToken(
+            claims=claims,
+            scopes=frozenset(filter(None, claims.get("scope", "").split(","))),
+            expires=claims["expires"],
+        )
+
+        self.entries[key] = entry
+        if len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+
+        return entry
+
+    def revoke(self, token: str):
+        """
+        Refuses a token from now on, e.g. after logout or a password change.
+        """
+        entry = self.verify(token)
+
+        # invalid or expired tokens are refused anyway
+        if entry is None:
+            return
+
+        key, now = self.key(token), time.time()
+        self.entries.pop(key, None)
+
+        for revoked_key in [k for k, until in self.revoked.items() if until < now]:
+            del self.revoked[revoked_key]
+
+        self.revoked[key] = entry.expires
+
+    def invalidate(self, token: str):
+        self.entries.pop(self.key(token), None)
+
+    def clear(self):
+        self.entries.clear()
+        self.revoked.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "size": len(self.entries),
+            "revoked": len(self.revoked),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+token_cache = TokenCache()
@@ -3,6 +3,11 @@ from contextlib import asynccontextmanager
 
 from app.db.dbManager import DBManager
 from app.utils.logger import AppLogger
+from app.utils.rbac import permission_matrix
+from app.services.email_outbox import email_outbox
+from app.services.mailbox_fanout import mailbox_fanout
+from app.services.email_service import preload_templates
+from app.services.upload_service import MediaUploaderService
 from app.factory.dataSeeder import DataSeeder
 from app.factory.dataFactory import (
     AmmenityFactory,
@@ -22,6 +27,7 @@ logger = AppLogger().get_logger()
 # Get DB Info
 db_manager = DBManager()
 get_db = db_manager.db_module.get_db
+get_read_db = db_manager.db_module.get_read_db
 
 
 @asynccontextmanager
@@ -53,8 +59,25 @@ async def lifespan(app: FastAPI):
     )
     await seeder.seed_data()
 
+    # roles and permissions are seeded, compile them once
+    await permission_matrix.reload()
+
+    # send queued emails in the background, templates compiled up front
+    preload_templates()
+    await email_outbox.start()
+
+    # resolve sent messages into their recipients' mailboxes
+    await mailbox_fanout.start()
+
     yield
 
+    # finish sending before the process exits
+    await email_outbox.stop()
+    await mailbox_fanout.stop()
+
+    # let image workers finish their resizes
+    MediaUploaderService.derivative_pool.shutdown()
+
     # TODO: Add tear down items
     # await db_manager.db_module.drop_all_tables()
     logger.info("Shutting down")
@@ -5,11 +5,17 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import Receive, Scope, Send
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
 from app.utils.lifespan import logger
+from app.utils.hashing import HashPoolBusyException
 from app.utils.lifespan import get_db
 from app.utils.response import DAOResponse
+from app.services.media_storage import LOCAL_FILES_PATH
+
+# longest request body written to the log
+LOG_BODY_LIMIT = 1024
 
 
 class SessionMiddleware(BaseHTTPMiddleware):
@@ -23,20 +29,40 @@ class SessionMiddleware(BaseHTTPMiddleware):
         return response
 
 
+def is_media_file(scope: Scope) -> bool:
+    return scope["type"] == "http" and scope["path"].startswith(LOCAL_FILES_PATH)
+
+
 class LoggingMiddleware(BaseHTTPMiddleware):
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        # files are streamed, or sent with sendfile, not buffered to be logged
+        if is_media_file(scope):
+            return await self.app(scope, receive, send)
+
+        await super().__call__(scope, receive, send)
+
     async def dispatch(self, request: Request, call_next):
         start_time = time.time()
 
         # Prepare request log
-        request_body = await request.body()
         request_log = f"{request.method} {request.url.path}"
 
         if request.path_params:
             request_log += f"{request.path_params}"
         if request.query_params:
             request_log += f"?{request.query_params}"
-        if request_body:
-            request_log += f" Body: {request_body.decode('utf-8')}"
+
+        # uploads are streamed by their route, reading them here would buffer them
+        if request.headers.get("content-type", "").startswith("multipart/form-data"):
+            content_length = request.headers.get("content-length", "unknown")
+            request_log += f" Body: <multipart, {content_length} bytes>"
+        elif request_body := await request.body():
+            request_log += (
+                f" Body: {request_body[:LOG_BODY_LIMIT].decode('utf-8', 'replace')}"
+            )
+
+            if len(request_body) > LOG_BODY_LIMIT:
+                request_log += f"... ({len(request_body)} bytes)"
         logger.info(f"Request: {request_log}")
 
         # Process request
@@ -56,6 +82,15 @@ class LoggingMiddleware(BaseHTTPMiddleware):
         )
 
 
+class MediaAwareGZipMiddleware(GZipMiddleware):
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        # images are compressed already and byte ranges index the stored file
+        if is_media_file(scope):
+            return await self.app(scope, receive, send)
+
+        await super().__call__(scope, receive, send)
+
+
 def configure_middleware(app: FastAPI):
     app.add_middleware(LoggingMiddleware)
     app.add_middleware(
@@ -75,5 +110,14 @@ def configure_middleware(app: FastAPI):
             content=DAOResponse[dict](success=False, error=exc.detail).model_dump(),
         )
 
-    app.add_middleware(GZipMiddleware, minimum_size=1000)
+    # password hashing is saturated, ask the client to come back
+    @app.exception_handler(HashPoolBusyException)
+    async def hash_pool_busy_handler(request: Request, exc: HashPoolBusyException):
+        return JSONResponse(
+            status_code=503,
+            headers={"Retry-After": "1"},
+            content=DAOResponse[dict](success=False, error=str(exc)).model_dump(),
+        )
+
+    app.add_middleware(MediaAwareGZipMiddleware, minimum_size=1000)
     app.add_middleware(TrustedHostMiddleware, allowed_hosts=["*"])
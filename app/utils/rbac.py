@@ -0,0 +1,250 @@
+import time
+import asyncio
+from typing import Dict, Iterable, Optional, Tuple
+from fastapi import Request, HTTPException, status
+from fastapi.security import HTTPBearer
+from sqlalchemy import event, insert, update
+from sqlalchemy.orm import ORMExecuteState, Session
+from sqlalchemy.future import select
+
+# db
+from app.db.dbManager import DBManager
+from app.db.dbUnitOfWork import UnitOfWork
+
+# models
+from app.models.role import Role
+from app.models.permissions import Permissions
+from app.models.cache_version import CacheVersion
+from app.models.role_permissions import RolePermissions
+
+# utils
+from app.utils.settings import settings
+from app.utils.jwt.token_cache import token_cache
+
+RBAC_MODELS = (Role, Permissions, RolePermissions)
+RBAC_TABLES = {model.__tablename__ for model in RBAC_MODELS}
+RBAC_CHANGED = "rbac_changed"
+
+
+class PermissionMatrix:
+    """
+    In-memory map of role alias to the bitset of permissions the role grants.
+
+    Every permission alias gets a bit, so checking a set of permissions
+    against a set of roles is a couple of integer operations. The matrix is
+    built at startup and rebuilt on first use after any committed write to
+    roles, permissions or their assignments.
+
+    The worker committing the write marks its own matrix stale right away.
+    The write also bumps the "rbac" row of cache_version, and every worker
+    compares that row with the version its matrix was built from at most
+    every `check_interval` seconds, so the other workers pick the change up
+    within that interval.
+    """
+
+    VERSION = "rbac"
+
+    def __init__(self, check_interval: float = settings.RBAC_CHECK_INTERVAL):
+        self.bits: Dict[str, int] = {}
+        self.roles: Dict[str, int] = {}
+        self.version = 0
+        self.stale = True
+        self.checked_at = 0.0
+        self.check_interval = check_interval
+        self.lock = asyncio.Lock()
+
+    async def refresh(self):
+        """
+        Rebuilds the matrix if this or, once the interval lapsed, any process
+        changed the grants since it was built.
+        """
+        if not self.stale:
+            if time.monotonic() - self.checked_at < self.check_interval:
+                return
+
+            self.checked_at = time.monotonic()
+            if await self.read_version() == self.version:
+                return
+
+            self.stale = True
+
+        await self.reload()
+
+    async def reload(self):
+        async with self.lock:
+            # another request rebuilt it while this one waited
+            if not self.stale:
+                return
+
+            # cleared first, a write landing mid-rebuild marks it stale again
+            self.stale = False
+
+            try:
+                bits, roles, version = await self.build()
+            except Exception:
+                self.stale = True
+                raise
+
+            self.bits, self.roles, self.version = bits, roles, version
+            self.checked_at = time.monotonic()
+
+    async def read_version(self) -> int:
+        async with DBManager().db_module.ReadSession() as db_session:
+            return await self.fetch_version(db_session)
+
+    @classmethod
+    async def fetch_version(cls, db_session) -> int:
+        version = await db_session.execute(
+            select(CacheVersion.version).where(CacheVersion.name == cls.VERSION)
+        )
+
+        return version.scalar_one_or_none() or 0
+
+    @classmethod
+    def bump_version(cls, session: Session):
+        # runs inside the transaction writing the grants
+        bumped = session.execute(
+            update(CacheVersion)
+            .where(CacheVersion.name == cls.VERSION)
+            .values(version=CacheVersion.version + 1)
+        )
+
+        if bumped.rowcount == 0:
+            session.execute(insert(CacheVersion).values(name=cls.VERSION, version=1))
+
+    async def build(self) -> Tuple[Dict[str, int], Dict[str, int], int]:
+        async with DBManager().db_module.ReadSession() as db_session:
+            # read first, a write landing after it bumps past it
+            version = await self.fetch_version(db_session)
+
+            permissions = await db_session.execute(
+                select(Permissions.alias).order_by(Permissions.alias)
+            )
+            grants = await db_session.execute(
+                select(Role.alias, Permissions.alias)
+                .select_from(Role)
+                .outerjoin(RolePermissions, RolePermissions.role_id == Role.role_id)
+                .outerjoin(
+                    Permissions,
+                    Permissions.permission_id == RolePermissions.permission_id,
+                )
+            )
+
+            bits = {alias: 1 << i for i, alias in enumerate(permissions.scalars())}
+            roles: Dict[str, int] = {}
+            for role_alias, permission_alias in grants:
+                roles[role_alias] = roles.get(role_alias, 0) | bits.get(
+                    permission_alias, 0
+                )
+
+        return bits, roles, version
+
+    def invalidate(self):
+        self.stale = True
+
+    def mask(self, permissions: Iterable[str]) -> Optional[int]:
+        """
+        Bitset of the given permission aliases, None if one doesn't exist.
+        """
+        mask = 0
+        for permission in permissions:
+            if permission not in self.bits:
+                return None
+            mask |= self.bits[permission]
+
+        return mask
+
+    def role_mask(self, roles: Iterable[str]) -> int:
+        mask = 0
+        for role in roles:
+            mask |= self.roles.get(role, 0)
+
+        return mask
+
+    def allows(self, roles: Iterable[str], permissions: Iterable[str]) -> bool:
+        required = self.mask(permissions)
+
+        return required is not None and self.role_mask(roles) & required == required
+
+
+permission_matrix = PermissionMatrix()
+
+
+def require_permissions(*permissions: str):
+    """
+    Dependency refusing tokens whose roles don't grant every given permission.
+
+    Missing, invalid, expired or revoked tokens are refused with 401.
+
+    Usage:
+        @router.delete("/{id}", dependencies=[Depends(require_permissions("delete_users"))])
+    """
+    bearer = HTTPBearer(auto_error=False)
+
+    async def dependency(request: Request):
+        credentials = await bearer(request)
+
+        # verified once, the token can't expire between two checks
+        verified_token = (
+            token_cache.verify(credentials.credentials) if credentials else None
+        )
+        if verified_token is None:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid or expired token",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+
+        await permission_matrix.refresh()
+
+        claims = verified_token.claims
+        if not permission_matrix.allows(claims.get("roles", []), permissions):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Not enough permissions",
+            )
+
+        return claims
+
+    return dependency
+
+
+@event.listens_for(Session, "after_flush")
+def track_rbac_writes(session: Session, flush_context):
+    changed = session.new | session.dirty | session.deleted
+
+    if any(isinstance(obj, RBAC_MODELS) for obj in changed):
+        session.info[RBAC_CHANGED] = True
+
+
+@event.listens_for(Session, "do_orm_execute")
+def track_rbac_statements(orm_execute_state: ORMExecuteState):
+    # bulk insert, update and delete statements never reach new, dirty or deleted
+    state = orm_execute_state
+    if not (state.is_insert or state.is_update or state.is_delete):
+        return
+
+    if state.statement.table.name in RBAC_TABLES:
+        state.session.info[RBAC_CHANGED] = True
+
+
+@event.listens_for(Session, "before_commit")
+def bump_rbac_version(session: Session):
+    # flushed first so writes still pending are tracked as well
+    session.flush()
+
+    if session.info.get(RBAC_CHANGED):
+        PermissionMatrix.bump_version(session)
+
+
+@event.listens_for(Session, "after_commit")
+def invalidate_permission_matrix(session: Session):
+    if session.info.pop(RBAC_CHANGED, False):
+        permission_matrix.invalidate()
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def discard_rbac_writes(session: Session, previous_transaction):
+    # writes outside a rolled back savepoint still count
+    if not UnitOfWork.in_savepoint(previous_transaction):
+        session.info.pop(RBAC_CHANGED, None)
@@ -1,8 +1,30 @@
+import orjson
+from decimal import Decimal
 from typing import Any, Dict, TypeVar, Generic, Optional
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel, ConfigDict, ValidationError, model_serializer
 
 T = TypeVar("T")
 
+# utc datetimes end in "Z" like pydantic's json output
+JSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z
+
+
+def encode_default(obj: Any) -> Any:
+    """
+    Fallback for values orjson doesn't encode natively.
+    """
+    # pydantic models serialize with the serializer compiled for their class
+    if isinstance(obj, BaseModel):
+        return obj.__pydantic_serializer__.to_python(obj, mode="json")
+    if isinstance(obj, Decimal):
+        return str(obj)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+
+    return jsonable_encoder(obj)
+
 
 class DAOResponse(BaseModel, Generic[T]):
     success: bool = False
@@ -40,13 +62,37 @@ class DAOResponse(BaseModel, Generic[T]):
     def set_meta(self, meta):
         self.meta = meta
 
+    def dump_json(self) -> bytes:
+        """
+        Encodes the envelope straight to JSON bytes, skipping the model_dump
+        passes. Produces the same shape as the json dump below.
+        """
+        result = {"success": self.success, "error": self.error, "data": self.data}
+
+        if self.meta and self.meta.get("total") != 0:
+            result["meta"] = self.meta
+
+        return orjson.dumps(result, default=encode_default, option=JSON_OPTIONS)
+
     @model_serializer(when_used="json")
     def dump_model(self) -> Dict[str, Any]:
         result = super().model_dump()
 
         if not self.meta:
             result.pop("meta", None)
-        elif self.meta["total"] == 0:
+        elif self.meta.get("total") == 0:
             result.pop("meta", None)
 
         return result
+
+
+class DAOJSONResponse(JSONResponse):
+    """
+    JSON response rendered with orjson, encoding DAOResponse envelopes directly.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, DAOResponse):
+            return content.dump_json()
+
+        return orjson.dumps(content, default=encode_default, option=JSON_OPTIONS)
@@ -1,6 +1,6 @@
 from pydantic_settings import BaseSettings
+from typing import List, Optional
 from pydantic import ConfigDict
-import cloudinary
 
 
 class Settings(BaseSettings):
@@ -11,10 +11,12 @@ class Settings(BaseSettings):
     DB_USER: str
     DB_PASSWORD: str
     DB_HOST: str
+    DB_READ_HOST: Optional[str] = None
     DB_PORT: str
     DB_DATABASE: str
     DB_ENGINE: str
     DB_DATABASE_DEFAULT: str
+    DB_STRICT_LOADING: bool = False
 
     GOOGLE_SIGNIN_CLIENT_ID: str
     GOOGLE_SIGNIN_CLIENT_SECRET: str
@@ -24,14 +26,40 @@ class Settings(BaseSettings):
     CLOUDINARY_API_KEY: str
     CLOUDINARY_API_SECRET: str
 
+    MEDIA_STORAGE: str = "cloudinary"
+    MEDIA_ROOT: str = "media"
+    # base url of local media, "/media/files" is served by the app itself
+    MEDIA_URL: str = "/media/files"
+    MEDIA_UPLOAD_WORKERS: int = 8
+    MEDIA_MAX_UPLOAD_SIZE: int = 10 * 1024 * 1024
+    MEDIA_DERIVATIVE_WIDTHS: List[int] = [320, 768, 1280]
+    MEDIA_DERIVATIVE_WORKERS: int = 2
+
     JWT_ALGORITHM: str
     JWT_SECRET: str
+    JWT_CACHE_SIZE: int = 4096
+    # seconds a worker trusts its permission matrix before checking for writes
+    # made by other workers
+    RBAC_CHECK_INTERVAL: float = 5.0
+
+    BCRYPT_ROUNDS: int = 12
+    HASH_WORKERS: int = 4
+    HASH_QUEUE_DEPTH: int = 64
 
     PYTHON_VERSION: str
 
     EMAIL: str
     EMAIL_PASSWORD: str
     EMAIL_SERVER: str
+    EMAIL_PORT: int = 465
+    EMAIL_USE_SSL: bool = True
+    EMAIL_WORKERS: int = 2
+    EMAIL_BATCH_SIZE: int = 20
+    EMAIL_MAX_ATTEMPTS: int = 5
+    EMAIL_POLL_INTERVAL: float = 5.0
+
+    MAILBOX_BATCH_SIZE: int = 200
+    MAILBOX_POLL_INTERVAL: float = 5.0
 
     ENCRYPT_KEY: str
     ACCESS_TOKEN_EXPIRE_MINUTES: str
@@ -43,9 +71,3 @@ class Settings(BaseSettings):
 
 
 settings = Settings()
-
-cloudinary.config(
-    cloud_name=settings.CLOUDINARY_CLOUD_NAME,
-    api_key=settings.CLOUDINARY_API_KEY,
-    api_secret=settings.CLOUDINARY_API_SECRET,
-)
@@ -0,0 +1,183 @@
+import os
+import hashlib
+import tempfile
+import multipart
+from multipart.multipart import parse_options_header
+from typing import Dict, List, Optional, Tuple
+from fastapi import HTTPException, Request, status
+
+# utils
+from app.utils.settings import settings
+
+# room for the part headers and small form fields around the file
+FORM_OVERHEAD = 64 * 1024
+
+
+class SpooledUpload:
+    """
+    A file part written to a temporary file as it arrives.
+
+    The SHA-256 and size are computed chunk by chunk, so the content is
+    never held in memory and never read back to be hashed.
+    """
+
+    def __init__(self, field_name: str, file_name: str, content_type: str):
+        self.field_name = field_name
+        self.file_name = file_name
+        self.content_type = content_type
+
+        self.size = 0
+        self.hasher = hashlib.sha256()
+
+        descriptor, self.path = tempfile.mkstemp(prefix="upload-")
+        self.file = os.fdopen(descriptor, "wb")
+
+    @property
+    def content_hash(self) -> str:
+        return self.hasher.hexdigest()
+
+    def write(self, data: bytes, max_size: int):
+        self.size += len(data)
+
+        if self.size > max_size:
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail=f"Files are limited to {max_size} bytes",
+            )
+
+        self.hasher.update(data)
+        self.file.write(data)
+
+    def close(self):
+        if not self.file.closed:
+            self.file.close()
+
+    def discard(self):
+        self.close()
+
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+
+
+async def receive_upload(
+    request: Request, max_size: Optional[int] = None
+) -> Tuple[Dict[str, str], Dict[str, SpooledUpload]]:
+    """
+    Streams a multipart/form-data body into form fields and spooled files.
+
+    Request chunks are fed to the parser as they are received, file parts go
+    straight to disk and the upload is refused as soon as it goes over
+    `max_size`, without waiting for the rest of the body. Callers own the
+    returned files and discard them once stored.
+    """
+    max_size = max_size or settings.MEDIA_MAX_UPLOAD_SIZE
+
+    content_type, params = parse_options_header(request.headers.get("content-type", ""))
+    if content_type != b"multipart/form-data" or b"boundary" not in params:
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail="Expected a multipart/form-data body",
+        )
+
+    content_length = request.headers.get("content-length")
+    if content_length and int(content_length) > max_size + FORM_OVERHEAD:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"Files are limited to {max_size} bytes",
+        )
+
+    fields: Dict[str, str] = {}
+    files: Dict[str, SpooledUpload] = {}
+    spooled: List[SpooledUpload] = []
+
+    headers: Dict[bytes, bytes] = {}
+    header_field, header_value = bytearray(), bytearray()
+    part: Dict[str, Optional[object]] = {}
+
+    def on_part_begin():
+        headers.clear()
+        part.clear()
+
+    def on_header_field(data: bytes, start: int, end: int):
+        header_field.extend(data[start:end])
+
+    def on_header_value(data: bytes, start: int, end: int):
+        header_value.extend(data[start:end])
+
+    def on_header_end():
+        headers[bytes(header_field).lower()] = bytes(header_value)
+        header_field.clear()
+        header_value.clear()
+
+    def on_headers_finished():
+        _, options = parse_options_header(headers.get(b"content-disposition", b""))
+        field_name = options.get(b"name", b"").decode("utf-8")
+
+        if b"filename" in options:
+            upload = SpooledUpload(
+                field_name=field_name,
+                file_name=options[b"filename"].decode("utf-8"),
+                content_type=headers.get(
+                    b"content-type", b"application/octet-stream"
+                ).decode("latin-1"),
+            )
+            spooled.append(upload)
+            part["upload"] = upload
+        else:
+            part["field"] = field_name
+            part["value"] = bytearray()
+
+    def on_part_data(data: bytes, start: int, end: int):
+        if "upload" in part:
+            part["upload"].write(data[start:end], max_size)
+        else:
+            part["value"].extend(data[start:end])
+
+            if len(part["value"]) > FORM_OVERHEAD:
+                raise HTTPException(
+                    status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                    detail=f"Form field {part['field']} is too large",
+                )
+
+    def on_part_end():
+        if "upload" in part:
+            part["upload"].close()
+            files[part["upload"].field_name] = part["upload"]
+        elif "field" in part:
+            fields[part["field"]] = part["value"].decode("utf-8")
+
+    parser = multipart.MultipartParser(
+        params[b"boundary"],
+        {
+            "on_part_begin": on_part_begin,
+            "on_part_data": on_part_data,
+            "on_part_end": on_part_end,
+            "on_header_field": on_header_field,
+            "on_header_value": on_header_value,
+            "on_header_end": on_header_end,
+            "on_headers_finished": on_headers_finished,
+        },
+    )
+
+    try:
+        async for chunk in request.stream():
+            parser.write(chunk)
+        parser.finalize()
+    except HTTPException:
+        for upload in spooled:
+            upload.discard()
+        raise
+    except Exception as e:
+        for upload in spooled:
+            upload.discard()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid multipart body: {e}",
+        )
+
+    # a repeated file field only keeps the last part
+    for upload in spooled:
+        if files.get(upload.field_name) is not upload:
+            upload.discard()
+
+    return fields, files
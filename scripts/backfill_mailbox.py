@@ -0,0 +1,56 @@
+"""
+Backfills the user_mailbox table from existing messages.
+
+Every sent message (or every one created since `--since`) is marked pending
+again and fanned out in batches, direct recipients and the clients under
+contract for the units it was sent to. Mailbox rows that already exist keep
+their read state.
+
+Databases created before the mailbox need its migration first, it adds the
+user_mailbox table and the message.delivered_at column. Run from the
+repository root with the app's environment loaded:
+
+    alembic upgrade head
+    python -m scripts.backfill_mailbox --since 2024-01-01 --batch-size 500
+"""
+
+import argparse
+import asyncio
+from typing import Optional
+from datetime import datetime
+from sqlalchemy import update
+
+import app.models  # noqa: F401
+from app.db.dbManager import DBManager
+from app.models.message import Message
+from app.services.mailbox_fanout import MailboxFanout
+from app.utils.settings import settings
+
+
+async def backfill(
+    since: Optional[datetime] = None, batch_size: Optional[int] = None
+) -> int:
+    async with DBManager().db_module.Session() as db_session:
+        query = update(Message).values(delivered_at=None)
+        if since is not None:
+            query = query.where(Message.date_created >= since)
+
+        await db_session.execute(query.execution_options(synchronize_session=False))
+        await db_session.commit()
+
+    fanout = MailboxFanout(batch_size=batch_size or settings.MAILBOX_BATCH_SIZE)
+    return await fanout.drain()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--since", type=datetime.fromisoformat, default=None)
+    parser.add_argument("--batch-size", type=int, default=settings.MAILBOX_BATCH_SIZE)
+    args = parser.parse_args()
+
+    delivered = asyncio.run(backfill(args.since, args.batch_size))
+    print(f"fanned out {delivered} messages")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,236 @@
+"""
+Inbox query time with many contracts and message recipients.
+
+Seeds a scratch SQLite database with clients holding contracts on units one
+after another, and messages sent either to a client or to a unit. It then
+times each sampled client's inbox three ways. The old way loads the client's
+contracts and filters with an OR term per contract period, with its
+`is False` filters corrected. It also counts a unit's messages sent during
+the client's contract on another unit, so it finds more messages. The
+joined way resolves units against contract periods in one query, and the
+mailbox way reads the rows the fan-out wrote. Run from the repository root
+with the app's environment loaded:
+
+    python -m scripts.benchmarks.bench_inbox --contracts 10000 --recipients 1000000
+"""
+
+import os
+import uuid
+import random
+import argparse
+import tempfile
+import statistics
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import and_, create_engine, insert, or_, select, union_all, update
+from sqlalchemy.orm import Session
+
+import app.models  # noqa: F401
+from app.models.model_base import BaseModel
+from app.models.message import Message
+from app.models.under_contract import UnderContract
+from app.models.message_recipient import MessageRecipient
+from app.db.dbLoadPlan import LoadPlan
+from app.dao.communication.message_dao import MessageDAO
+from app.services.mailbox_fanout import fan_out_query
+
+EPOCH = datetime(2020, 1, 1)
+MESSAGE_DAO = MessageDAO()
+BATCH = 50_000
+
+
+def seed(db_session: Session, clients: int, contracts: int, recipients: int):
+    units = [uuid.uuid4() for _ in range(max(1, contracts // 4))]
+    client_ids = [uuid.uuid4() for _ in range(clients)]
+
+    # every unit is let to a run of clients, a year each
+    rows, lease = [], {}
+    for _ in range(contracts):
+        unit = random.choice(units)
+        start = lease.get(unit, EPOCH)
+        lease[unit] = start + timedelta(days=365)
+        rows.append(
+            {
+                "property_unit_assoc_id": unit,
+                "client_id": random.choice(client_ids),
+                "start_date": start,
+                "end_date": lease[unit] - timedelta(seconds=1),
+            }
+        )
+    db_session.execute(insert(UnderContract), rows)
+
+    span = (max(lease.values()) - EPOCH).total_seconds()
+
+    for offset in range(0, recipients, BATCH):
+        messages, deliveries = [], []
+
+        for _ in range(min(BATCH, recipients - offset)):
+            message_id = uuid.uuid4()
+            sent = EPOCH + timedelta(seconds=random.uniform(0, span))
+            direct = random.random() < 0.5
+
+            messages.append(
+                {
+                    "message_id": message_id,
+                    "subject": "Notice",
+                    "message_body": "Hello",
+                    "is_draft": False,
+                    "is_scheduled": False,
+                    "is_notification": random.random() < 0.2,
+                    "date_created": sent,
+                }
+            )
+            deliveries.append(
+                {
+                    "message_id": message_id,
+                    "recipient_id": random.choice(client_ids) if direct else None,
+                    "recipient_group_id": None if direct else random.choice(units),
+                    "msg_send_date": sent,
+                    "is_read": False,
+                }
+            )
+
+        db_session.execute(insert(Message), messages)
+        db_session.execute(insert(MessageRecipient), deliveries)
+
+        # what the mailbox fan-out writes, a worker batch at a time
+        message_ids = [message["message_id"] for message in messages]
+        for i in range(0, len(message_ids), 500):
+            db_session.execute(fan_out_query("sqlite", message_ids[i : i + 500]))
+
+    db_session.execute(update(Message).values(delivered_at=EPOCH))
+    db_session.commit()
+
+    return client_ids
+
+
+def or_chain_query(db_session: Session, user_id: uuid.UUID):
+    contracts = db_session.execute(
+        select(UnderContract).where(UnderContract.client_id == user_id)
+    ).scalars()
+    periods = [(c.property_unit_assoc_id, c.start_date, c.end_date) for c in contracts]
+
+    return (
+        select(Message)
+        .join(MessageRecipient, Message.message_id == MessageRecipient.message_id)
+        .where(
+            Message.is_draft.is_(False),
+            Message.is_scheduled.is_(False),
+            Message.is_notification.is_(False),
+            or_(
+                MessageRecipient.recipient_id == user_id,
+                and_(
+                    MessageRecipient.recipient_group_id.in_([p[0] for p in periods]),
+                    or_(
+                        *[
+                            and_(
+                                MessageRecipient.msg_send_date >= p[1],
+                                MessageRecipient.msg_send_date <= p[2],
+                            )
+                            for p in periods
+                        ]
+                    ),
+                ),
+            ),
+        )
+        .options(*MESSAGE_DAO.load_options(LoadPlan.LIST))
+        .order_by(Message.date_created.desc())
+    )
+
+
+def joined_query(db_session: Session, user_id: uuid.UUID):
+    direct = select(MessageRecipient.message_id).where(
+        MessageRecipient.recipient_id == user_id
+    )
+    group = (
+        select(MessageRecipient.message_id)
+        .join(
+            UnderContract,
+            and_(
+                UnderContract.property_unit_assoc_id
+                == MessageRecipient.recipient_group_id,
+                MessageRecipient.msg_send_date >= UnderContract.start_date,
+                MessageRecipient.msg_send_date <= UnderContract.end_date,
+            ),
+        )
+        .where(UnderContract.client_id == user_id)
+    )
+
+    return (
+        select(Message)
+        .where(
+            Message.message_id.in_(union_all(direct, group)),
+            Message.is_draft.is_(False),
+            Message.is_scheduled.is_(False),
+            Message.is_notification.is_(False),
+        )
+        .options(*MESSAGE_DAO.load_options(LoadPlan.LIST))
+        .order_by(Message.date_created.desc())
+    )
+
+
+def mailbox_query(db_session: Session, user_id: uuid.UUID):
+    return MESSAGE_DAO.inbox_query(user_id)
+
+
+def timed(db_session: Session, query, user_ids):
+    durations, counts = [], []
+
+    for user_id in user_ids:
+        db_session.expunge_all()
+
+        start = time.perf_counter()
+        messages = db_session.execute(query(db_session, user_id)).unique()
+        counts.append(len(messages.all()))
+        durations.append((time.perf_counter() - start) * 1000)
+
+    durations.sort()
+    return {
+        "mean (ms)": statistics.mean(durations),
+        "p95 (ms)": durations[min(len(durations) - 1, int(len(durations) * 0.95))],
+        "messages": statistics.mean(counts),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--contracts", type=int, default=10_000)
+    parser.add_argument("--recipients", type=int, default=1_000_000)
+    parser.add_argument("--clients", type=int, default=1_000)
+    parser.add_argument("--samples", type=int, default=50)
+    args = parser.parse_args()
+
+    random.seed(22)
+    path = os.path.join(tempfile.mkdtemp(prefix="bench-inbox-"), "inbox.db")
+    engine = create_engine(f"sqlite:///{path}")
+    BaseModel.metadata.create_all(engine)
+
+    with Session(engine) as db_session:
+        start = time.perf_counter()
+        client_ids = seed(db_session, args.clients, args.contracts, args.recipients)
+        print(
+            f"seeded {args.contracts} contracts, {args.recipients} recipients "
+            f"for {args.clients} clients in {time.perf_counter() - start:.1f}s"
+        )
+
+        sample = random.sample(client_ids, min(args.samples, len(client_ids)))
+
+        print(f"{'query':<12}{'mean (ms)':>12}{'p95 (ms)':>12}{'messages':>12}")
+        for name, query in (
+            ("or chain", or_chain_query),
+            ("joined", joined_query),
+            ("mailbox", mailbox_query),
+        ):
+            result = timed(db_session, query, sample)
+            print(
+                f"{name:<12}{result['mean (ms)']:>12.1f}{result['p95 (ms)']:>12.1f}"
+                f"{result['messages']:>12.1f}"
+            )
+
+    engine.dispose()
+    os.unlink(path)
+
+
+if __name__ == "__main__":
+    main()
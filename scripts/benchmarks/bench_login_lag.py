@@ -0,0 +1,97 @@
+"""
+Event-loop lag during a burst of concurrent logins.
+
+Every login verifies a bcrypt hash. A ticker task sleeps a few milliseconds
+at a time and records how late it wakes up while the burst runs, once with
+the verification on the event loop (the old behaviour) and once through
+the bounded hashing pool. Run from the repository root with the app's
+environment loaded:
+
+    python -m scripts.benchmarks.bench_login_lag --logins 50 --rounds 12
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+import bcrypt
+
+from app.utils.hashing import Hash
+from app.utils.settings import settings
+
+TICK = 0.005
+
+
+async def ticker(lags: list, done: asyncio.Event):
+    while not done.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(TICK)
+        lags.append((time.perf_counter() - start - TICK) * 1000)
+
+
+async def on_loop(hashed: str, password: str):
+    # awaited like the old route, but nothing here ever yields
+    return Hash.verify(hashed, password)
+
+
+async def burst(login, logins: int, hashed: str, password: str):
+    lags, done = [], asyncio.Event()
+    tick_task = asyncio.create_task(ticker(lags, done))
+
+    # let the ticker get going before the burst lands
+    await asyncio.sleep(TICK * 2)
+
+    start = time.perf_counter()
+    results = await asyncio.gather(
+        *[login(hashed, password) for _ in range(logins)], return_exceptions=True
+    )
+    elapsed = time.perf_counter() - start
+
+    done.set()
+    await tick_task
+
+    rejected = sum(isinstance(result, Exception) for result in results)
+    lags = sorted(lags) or [0.0]
+
+    return {
+        "elapsed (s)": elapsed,
+        "max lag (ms)": lags[-1],
+        "p99 lag (ms)": lags[min(len(lags) - 1, int(len(lags) * 0.99))],
+        "mean lag (ms)": statistics.mean(lags),
+        "rejected": rejected,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--logins", type=int, default=50)
+    parser.add_argument("--rounds", type=int, default=settings.BCRYPT_ROUNDS)
+    args = parser.parse_args()
+
+    password = "correct horse battery staple"
+    hashed = bcrypt.hashpw(
+        password.encode("utf-8"), bcrypt.gensalt(rounds=args.rounds)
+    ).decode("utf-8")
+
+    print(
+        f"{args.logins} concurrent logins, cost {args.rounds}, "
+        f"{settings.HASH_WORKERS} hashing workers, "
+        f"queue depth {settings.HASH_QUEUE_DEPTH}"
+    )
+    print(
+        f"{'path':<12}{'elapsed (s)':>14}{'max lag (ms)':>14}"
+        f"{'p99 lag (ms)':>14}{'mean lag (ms)':>15}{'rejected':>10}"
+    )
+
+    for name, login in (("event loop", on_loop), ("pool", Hash.verify_async)):
+        result = asyncio.run(burst(login, args.logins, hashed, password))
+        print(
+            f"{name:<12}{result['elapsed (s)']:>14.2f}{result['max lag (ms)']:>14.1f}"
+            f"{result['p99 lag (ms)']:>14.1f}{result['mean lag (ms)']:>15.2f}"
+            f"{result['rejected']:>10}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+Message creation throughput by number of recipients.
+
+Creates messages addressed to 1, 100 and 10k units in a scratch SQLite
+database, once the old way (each recipient added, then committed and
+refreshed one by one) and once through MessageDAO.create, which writes the
+recipients in one multi-row INSERT and commits once. Run from the
+repository root with the app's environment loaded:
+
+    python -m scripts.benchmarks.bench_message_create --sizes 1 100 10000
+"""
+
+import os
+import uuid
+import asyncio
+import argparse
+import tempfile
+import time
+
+from sqlalchemy.ext.asyncio import (
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+import app.models  # noqa: F401
+from app.models.model_base import BaseModel
+from app.models.message import Message
+from app.models.message_recipient import MessageRecipient
+from app.dao.communication.message_dao import MessageDAO
+
+MESSAGE_DAO = MessageDAO()
+
+
+async def one_by_one(db_session: AsyncSession, obj_in: dict):
+    new_message = Message(subject=obj_in["subject"], message_body="Hello")
+    db_session.add(new_message)
+    await MESSAGE_DAO.commit_and_refresh(db_session=db_session, obj=new_message)
+
+    recipients = [
+        MessageRecipient(
+            recipient_group_id=gid, message_id=new_message.message_id, is_read=False
+        )
+        for gid in obj_in["recipient_groups"]
+    ]
+    db_session.add_all(recipients)
+
+    for obj in recipients:
+        await MESSAGE_DAO.commit_and_refresh(db_session=db_session, obj=obj)
+
+    await MESSAGE_DAO.commit_and_refresh(db_session=db_session, obj=new_message)
+
+
+async def bulk(db_session: AsyncSession, obj_in: dict):
+    response = await MESSAGE_DAO.create(db_session=db_session, obj_in=obj_in)
+    assert response.success, response.error
+
+
+async def run(create, sessions, size: int, messages: int) -> float:
+    units = [uuid.uuid4() for _ in range(size)]
+
+    start = time.perf_counter()
+    for _ in range(messages):
+        async with sessions() as db_session:
+            await create(
+                db_session,
+                {
+                    "subject": "Notice",
+                    "message_body": "Hello",
+                    "recipient_ids": [],
+                    "recipient_groups": units,
+                },
+            )
+
+    return (time.perf_counter() - start) / messages * 1000
+
+
+async def bench(sizes, messages: int):
+    directory = tempfile.mkdtemp(prefix="bench-message-create-")
+    path = os.path.join(directory, "messages.db")
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    sessions = async_sessionmaker(engine, expire_on_commit=False)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(BaseModel.metadata.create_all)
+
+    print(
+        f"{'recipients':>10}{'one by one (ms)':>18}{'bulk (ms)':>12}"
+        f"{'recipients/s':>16}"
+    )
+    for size in sizes:
+        # the old way takes a commit per recipient, one message is plenty
+        old = await run(one_by_one, sessions, size, 1 if size > 1000 else messages)
+        new = await run(bulk, sessions, size, messages)
+        print(f"{size:>10}{old:>18.1f}{new:>12.1f}{size / new * 1000:>16.0f}")
+
+    await engine.dispose()
+    os.unlink(path)
+    os.rmdir(directory)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 100, 10_000])
+    parser.add_argument("--messages", type=int, default=5)
+    args = parser.parse_args()
+
+    asyncio.run(bench(args.sizes, args.messages))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Per-request CPU spent on the generated list/detail response models.
+
+Compares generating the pydantic model inside every request (the old
+behaviour) with the per-router cached model, for every router the app
+registers. Run from the repository root with the app's environment loaded:
+
+    python -m scripts.benchmarks.bench_response_models --requests 200
+"""
+
+import argparse
+import time
+
+from fastapi import FastAPI
+
+from app.utils.routes import configure_routes
+from app.router.base_router import (
+    create_pydantic_model_from_sqlalchemy,
+    get_pydantic_model,
+    pydantic_models,
+)
+
+
+def per_request(fn, requests: int) -> float:
+    start = time.process_time()
+    for _ in range(requests):
+        fn()
+
+    return (time.process_time() - start) / requests * 1_000_000
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=200)
+    args = parser.parse_args()
+
+    # building the routers registers every response model
+    configure_routes(FastAPI())
+
+    print(f"{'model':<56}{'uncached (us)':>16}{'cached (us)':>16}")
+
+    for model, parents, children, excludes in list(pydantic_models):
+        instance = model()
+
+        def uncached():
+            create_pydantic_model_from_sqlalchemy(
+                model,
+                load_parent_relationships=parents,
+                load_child_relationships=children,
+                excludes=list(excludes),
+            ).model_validate(instance, strict=False, from_attributes=True)
+
+        def cached():
+            get_pydantic_model(
+                model,
+                load_parent_relationships=parents,
+                load_child_relationships=children,
+                excludes=excludes,
+            ).model_validate(instance, strict=False, from_attributes=True)
+
+        name = f"{model.__name__} (parents={parents}, children={children})"
+        print(
+            f"{name:<56}"
+            f"{per_request(uncached, args.requests):>16.1f}"
+            f"{per_request(cached, args.requests):>16.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+"""
+Response envelope serialization, FastAPI's default path against the orjson one.
+
+For the most used response schemas a representative payload is generated
+from the schema's fields, dumped the way the DAOs do it, and wrapped in a
+DAOResponse. The default path validates the envelope against the route's
+response model, runs jsonable_encoder and renders with JSONResponse;
+the fast path is DAOJSONResponse rendering the envelope directly. Run from
+the repository root with the app's environment loaded:
+
+    python -m scripts.benchmarks.bench_serialization --items 25 --rounds 200
+"""
+
+import types
+import asyncio
+import argparse
+import time
+import typing
+from enum import Enum
+from decimal import Decimal
+from uuid import uuid4
+from datetime import date, datetime, timezone
+
+import pytz
+from pydantic import BaseModel, EmailStr
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+
+from app.utils.response import DAOJSONResponse, DAOResponse
+from app.schema.user import UserResponse
+from app.schema.tour import TourResponse
+from app.schema.invoice import InvoiceResponse
+from app.schema.contract import ContractResponse
+from app.schema.message import MessageResponseModel
+from app.schema.transaction import TransactionResponse
+from app.schema.calendar_event import CalendarEventResponse
+from app.schema.property import PropertyResponse, PropertyUnitResponse
+from app.schema.maintenance_request import MaintenanceRequestResponse
+
+RESPONSE_TYPES = [
+    UserResponse,
+    PropertyResponse,
+    PropertyUnitResponse,
+    InvoiceResponse,
+    TransactionResponse,
+    ContractResponse,
+    MessageResponseModel,
+    CalendarEventResponse,
+    MaintenanceRequestResponse,
+    TourResponse,
+]
+
+
+def sample(annotation, depth=0):
+    """
+    Builds a value matching a field annotation, lists get a few entries.
+    """
+    origin = typing.get_origin(annotation)
+    args = typing.get_args(annotation)
+
+    if origin in (typing.Union, types.UnionType):
+        options = [arg for arg in args if arg is not type(None)]
+        return sample(options[0], depth) if options else None
+    if origin in (list, typing.List):
+        count = 3 if depth < 4 else 0
+        return [sample(args[0] if args else str, depth + 1) for _ in range(count)]
+    if origin in (dict, typing.Dict):
+        return {"user": sample(args[1], depth + 1) if args else "value"}
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return {
+            name: sample(field.annotation, depth + 1)
+            for name, field in annotation.model_fields.items()
+        }
+    if isinstance(annotation, type) and issubclass(annotation, Enum):
+        return next(iter(annotation)).value
+
+    return {
+        bool: True,
+        int: 3,
+        float: 1250.5,
+        str: "sample text",
+        EmailStr: "jane.doe@example.com",
+        Decimal: Decimal("1250.50"),
+        datetime: datetime.now(pytz.utc),
+        date: datetime.now(timezone.utc).date(),
+    }.get(annotation, str(uuid4()))
+
+
+def payload(schema, items: int):
+    # the dao responses hold model_dump() output
+    data = []
+    for _ in range(items):
+        values = sample(schema)
+        data.append(schema.model_validate(values).model_dump())
+
+    return DAOResponse[typing.List[schema]](
+        success=True, data=data, meta={"limit": items, "total": items}
+    )
+
+
+async def default_path(field, response: DAOResponse) -> bytes:
+    content = await serialize_response(field=field, response_content=response)
+    return JSONResponse(content).body
+
+
+def per_round(fn, rounds: int) -> float:
+    start = time.process_time()
+    for _ in range(rounds):
+        fn()
+
+    return (time.process_time() - start) / rounds * 1_000_000
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--items", type=int, default=25)
+    parser.add_argument("--rounds", type=int, default=200)
+    args = parser.parse_args()
+
+    loop = asyncio.new_event_loop()
+    field = create_response_field(name="Response_get_all", type_=DAOResponse)
+
+    print(f"{'response':<32}{'default (us)':>16}{'orjson (us)':>16}{'speedup':>10}")
+
+    for schema in RESPONSE_TYPES:
+        try:
+            response = payload(schema, args.items)
+        except Exception as e:
+            print(f"{schema.__name__:<32}  skipped: {e.__class__.__name__}")
+            continue
+
+        default = per_round(
+            lambda: loop.run_until_complete(default_path(field, response)),
+            args.rounds,
+        )
+        fast = per_round(lambda: DAOJSONResponse(response).body, args.rounds)
+
+        print(
+            f"{schema.__name__:<32}{default:>16.1f}{fast:>16.1f}"
+            f"{default / fast:>9.1f}x"
+        )
+
+    loop.close()
+
+
+if __name__ == "__main__":
+    main()